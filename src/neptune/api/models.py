@@ -21,6 +21,7 @@ __all__ = (
     "FieldType",
     "GitCommit",
     "LeaderboardEntry",
+    "Fields",
     "LeaderboardEntriesSearchResult",
     "FieldVisitor",
     "FloatField",
@@ -58,16 +59,23 @@ from datetime import (
     timezone,
 )
 from enum import Enum
+from operator import attrgetter
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    Sequence,
     Set,
     Type,
     TypeVar,
+    Union,
+    overload,
 )
 
 from neptune.api.proto.neptune_pb.api.model.attributes_pb2 import ProtoAttributeDefinitionDTO
@@ -121,14 +129,20 @@ class FieldType(Enum):
 
 @dataclass
 class Field(abc.ABC):
+    __slots__ = ("path",)
+
     path: str
     type: ClassVar[FieldType] = dataclass_field(init=False)
     _registry: ClassVar[Dict[str, Type[Field]]] = {}
+    _proto_decoders: ClassVar[Dict[str, Callable[[Any], Field]]] = {}
 
     def __init_subclass__(cls, *args: Any, field_type: FieldType, **kwargs: Any) -> None:
         super().__init_subclass__(*args, **kwargs)
         cls.type = field_type
         cls._registry[field_type.value] = cls
+        cls._proto_decoders[field_type.value] = _proto_decoder(
+            cls.from_proto, attrgetter(f"{camel_to_snake(field_type.value)}_properties")
+        )
 
     @classmethod
     def by_type(cls, field_type: FieldType) -> Type[Field]:
@@ -149,8 +163,7 @@ class Field(abc.ABC):
 
     @staticmethod
     def from_proto(data: Any) -> Field:
-        field_type = str(data.type)
-        return Field._registry[field_type].from_proto(data.__getattribute__(f"{camel_to_snake(field_type)}_properties"))
+        return Field._proto_decoders[str(data.type)](data)
 
 
 def camel_to_snake(name: str) -> str:
@@ -160,6 +173,16 @@ def camel_to_snake(name: str) -> str:
     return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
 
 
+def _proto_decoder(
+    from_proto: Callable[[Any], Field], get_properties: Callable[[Any], Any]
+) -> Callable[[ProtoAttributeDTO], Field]:
+    # The properties attribute name is resolved once per field type, so decoding doesn't touch strings at all
+    def decode(data: ProtoAttributeDTO) -> Field:
+        return from_proto(get_properties(data))
+
+    return decode
+
+
 class FieldVisitor(Generic[Ret], abc.ABC):
 
     def visit(self, field: Field) -> Ret:
@@ -213,6 +236,8 @@ class FieldVisitor(Generic[Ret], abc.ABC):
 
 @dataclass
 class FloatField(Field, field_type=FieldType.FLOAT):
+    __slots__ = ("value",)
+
     value: float
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -233,6 +258,8 @@ class FloatField(Field, field_type=FieldType.FLOAT):
 
 @dataclass
 class IntField(Field, field_type=FieldType.INT):
+    __slots__ = ("value",)
+
     value: int
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -253,6 +280,8 @@ class IntField(Field, field_type=FieldType.INT):
 
 @dataclass
 class BoolField(Field, field_type=FieldType.BOOL):
+    __slots__ = ("value",)
+
     value: bool
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -273,6 +302,8 @@ class BoolField(Field, field_type=FieldType.BOOL):
 
 @dataclass
 class StringField(Field, field_type=FieldType.STRING):
+    __slots__ = ("value",)
+
     value: str
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -293,6 +324,8 @@ class StringField(Field, field_type=FieldType.STRING):
 
 @dataclass
 class DateTimeField(Field, field_type=FieldType.DATETIME):
+    __slots__ = ("value",)
+
     value: datetime
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -315,6 +348,8 @@ class DateTimeField(Field, field_type=FieldType.DATETIME):
 
 @dataclass
 class FileField(Field, field_type=FieldType.FILE):
+    __slots__ = ("name", "ext", "size")
+
     name: str
     ext: str
     size: int
@@ -337,6 +372,8 @@ class FileField(Field, field_type=FieldType.FILE):
 
 @dataclass
 class FileSetField(Field, field_type=FieldType.FILE_SET):
+    __slots__ = ("size",)
+
     size: int
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -357,6 +394,8 @@ class FileSetField(Field, field_type=FieldType.FILE_SET):
 
 @dataclass
 class FloatSeriesField(Field, field_type=FieldType.FLOAT_SERIES):
+    __slots__ = ("last",)
+
     last: Optional[float]
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -379,6 +418,8 @@ class FloatSeriesField(Field, field_type=FieldType.FLOAT_SERIES):
 
 @dataclass
 class StringSeriesField(Field, field_type=FieldType.STRING_SERIES):
+    __slots__ = ("last",)
+
     last: Optional[str]
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -400,6 +441,8 @@ class StringSeriesField(Field, field_type=FieldType.STRING_SERIES):
 
 @dataclass
 class ImageSeriesField(Field, field_type=FieldType.IMAGE_SERIES):
+    __slots__ = ("last_step",)
+
     last_step: Optional[float]
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -421,6 +464,8 @@ class ImageSeriesField(Field, field_type=FieldType.IMAGE_SERIES):
 
 @dataclass
 class StringSetField(Field, field_type=FieldType.STRING_SET):
+    __slots__ = ("values",)
+
     values: Set[str]
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -441,6 +486,8 @@ class StringSetField(Field, field_type=FieldType.STRING_SET):
 
 @dataclass
 class GitCommit:
+    __slots__ = ("commit_id",)
+
     commit_id: Optional[str]
 
     @staticmethod
@@ -459,6 +506,8 @@ class GitCommit:
 
 @dataclass
 class GitRefField(Field, field_type=FieldType.GIT_REF):
+    __slots__ = ("commit",)
+
     commit: Optional[GitCommit]
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -481,6 +530,8 @@ class GitRefField(Field, field_type=FieldType.GIT_REF):
 
 @dataclass
 class ObjectStateField(Field, field_type=FieldType.OBJECT_STATE):
+    __slots__ = ("value",)
+
     value: str
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -503,6 +554,8 @@ class ObjectStateField(Field, field_type=FieldType.OBJECT_STATE):
 
 @dataclass
 class NotebookRefField(Field, field_type=FieldType.NOTEBOOK_REF):
+    __slots__ = ("notebook_name",)
+
     notebook_name: Optional[str]
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -524,6 +577,8 @@ class NotebookRefField(Field, field_type=FieldType.NOTEBOOK_REF):
 
 @dataclass
 class ArtifactField(Field, field_type=FieldType.ARTIFACT):
+    __slots__ = ("hash",)
+
     hash: str
 
     def accept(self, visitor: FieldVisitor[Ret]) -> Ret:
@@ -545,7 +600,12 @@ class ArtifactField(Field, field_type=FieldType.ARTIFACT):
 @dataclass
 class LeaderboardEntry:
     object_id: str
-    fields: List[Field]
+    fields: Sequence[Field]
+
+    def get_field(self, path: str) -> Optional[Field]:
+        if not isinstance(self.fields, Fields):
+            self.fields = Fields(self.fields)
+        return self.fields.get(path)
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> LeaderboardEntry:
@@ -561,20 +621,94 @@ class LeaderboardEntry:
 
     @staticmethod
     def from_proto(data: ProtoAttributesDTO) -> LeaderboardEntry:
-        with_proto_support = {
-            FieldType.STRING.value,
-            FieldType.BOOL.value,
-            FieldType.INT.value,
-            FieldType.FLOAT.value,
-            FieldType.DATETIME.value,
-            FieldType.STRING_SET.value,
-            FieldType.FLOAT_SERIES.value,
-        }
+        return LeaderboardEntry(object_id=data.experiment_id, fields=Fields.from_proto(data.attributes))
 
-        return LeaderboardEntry(
-            object_id=data.experiment_id,
-            fields=[Field.from_proto(field) for field in data.attributes if str(field.type) in with_proto_support],
-        )
+
+# Decoders of the field types that leaderboard entries can be fetched as protobuf with
+_SUPPORTED_PROTO_DECODERS: Dict[str, Callable[[Any], Field]] = {
+    field_type.value: Field._proto_decoders[field_type.value]
+    for field_type in (
+        FieldType.STRING,
+        FieldType.BOOL,
+        FieldType.INT,
+        FieldType.FLOAT,
+        FieldType.DATETIME,
+        FieldType.STRING_SET,
+        FieldType.FLOAT_SERIES,
+    )
+}
+
+
+class Fields(Sequence[Field]):
+    """Fields of a leaderboard entry, indexed by path.
+
+    When created from protobuf attributes, fields are decoded only when first accessed. Looking a single
+    field up with `get` decodes just that field, so reading a few columns of a wide table stays cheap.
+    """
+
+    __slots__ = ("_fields", "_attributes", "_by_path")
+
+    def __init__(self, fields: Iterable[Field] = ()) -> None:
+        self._fields: Optional[List[Field]] = list(fields)
+        self._attributes: Iterable[ProtoAttributeDTO] = ()
+        self._by_path: Optional[Dict[str, Union[Field, ProtoAttributeDTO]]] = None
+
+    @staticmethod
+    def from_proto(attributes: Iterable[ProtoAttributeDTO]) -> Fields:
+        fields = Fields()
+        fields._fields = None
+        fields._attributes = attributes
+        return fields
+
+    def get(self, path: str) -> Optional[Field]:
+        if self._by_path is None:
+            self._by_path = self._index()
+
+        item = self._by_path.get(path)
+        if item is None or isinstance(item, Field):
+            return item
+
+        field = self._by_path[path] = _SUPPORTED_PROTO_DECODERS[item.type](item)
+        return field
+
+    def _index(self) -> Dict[str, Union[Field, ProtoAttributeDTO]]:
+        # Iterating in reverse keeps the first occurrence of a path, the same as a linear search would
+        if self._fields is not None:
+            return {field.path: field for field in reversed(self._fields)}
+
+        attributes = [attribute for attribute in self._attributes if attribute.type in _SUPPORTED_PROTO_DECODERS]
+        return {attribute.name: attribute for attribute in reversed(attributes)}
+
+    def _materialize(self) -> List[Field]:
+        if self._fields is None:
+            decoders = _SUPPORTED_PROTO_DECODERS
+            self._fields = [decoders[field.type](field) for field in self._attributes if field.type in decoders]
+            self._attributes = ()
+            self._by_path = None
+        return self._fields
+
+    @overload
+    def __getitem__(self, index: int) -> Field: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Field]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Field, List[Field]]:
+        return self._materialize()[index]
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __iter__(self) -> Iterator[Field]:
+        return iter(self._materialize())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Fields, list)):
+            return self._materialize() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
 
 
 @dataclass
@@ -740,13 +874,22 @@ class FloatSeriesValues:
 
     @staticmethod
     def from_proto(data: Any) -> FloatSeriesValues:
+        fromtimestamp, utc = datetime.fromtimestamp, timezone.utc
         return FloatSeriesValues(
-            total=data.total_item_count, values=[FloatPointValue.from_proto(value) for value in data.values]
+            total=data.total_item_count,
+            values=[
+                FloatPointValue(
+                    timestamp=fromtimestamp(value.timestamp_millis / 1000.0, tz=utc), value=value.value, step=value.step
+                )
+                for value in data.values
+            ],
         )
 
 
 @dataclass
 class FloatPointValue:
+    __slots__ = ("timestamp", "value", "step")
+
     timestamp: datetime
     value: float
     step: float
@@ -800,6 +943,8 @@ class StringSeriesValues:
 
 @dataclass
 class StringPointValue:
+    __slots__ = ("timestamp", "step", "value")
+
     timestamp: datetime
     step: float
     value: str
@@ -15,12 +15,19 @@
 #
 __all__ = ["get_single_page", "iter_over_pages"]
 
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Deque,
     Dict,
     Generator,
     Iterable,
+    Iterator,
     Optional,
 )
 
@@ -57,6 +64,8 @@ from neptune.internal.init.parameters import MAX_SERVER_OFFSET
 from neptune.typing import ProgressBarType
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from neptune.internal.backends.swagger_client_wrapper import SwaggerClientWrapper
     from neptune.internal.id_formats import UniqueId
 
@@ -160,7 +169,42 @@ def get_single_page(
 
 
 def find_attribute(*, entry: LeaderboardEntry, path: str) -> Optional[Field]:
-    return next((attr for attr in entry.fields if attr.path == path), None)
+    return entry.get_field(path)
+
+
+class _PagePrefetcher:
+    """Keeps up to `depth` page requests in flight and yields their results in order."""
+
+    def __init__(
+        self,
+        executor: ThreadPoolExecutor,
+        requests: Iterable[Callable[[], LeaderboardEntriesSearchResult]],
+        depth: int,
+    ):
+        self._executor = executor
+        self._requests = iter(requests)
+        self._in_flight: Deque["Future[LeaderboardEntriesSearchResult]"] = deque()
+        for _ in range(depth):
+            self._submit_next()
+
+    def _submit_next(self) -> None:
+        request = next(self._requests, None)
+        if request is not None:
+            self._in_flight.append(self._executor.submit(request))
+
+    def __iter__(self) -> Iterator[LeaderboardEntriesSearchResult]:
+        return self
+
+    def __next__(self) -> LeaderboardEntriesSearchResult:
+        if not self._in_flight:
+            raise StopIteration
+        result = self._in_flight.popleft().result()
+        self._submit_next()
+        return result
+
+    def close(self) -> None:
+        while self._in_flight:
+            self._in_flight.popleft().cancel()
 
 
 def iter_over_pages(
@@ -172,77 +216,111 @@ def iter_over_pages(
     ascending: bool,
     progress_bar: Optional[ProgressBarType],
     max_offset: int = MAX_SERVER_OFFSET,
+    prefetch_pages: int = 1,
     **kwargs: Any,
 ) -> Generator[Any, None, None]:
     searching_after = None
     last_page = None
 
-    data = get_single_page(
-        limit=0,
-        offset=0,
-        sort_by=sort_by,
-        ascending=ascending,
-        sort_by_column_type=sort_by_column_type,
-        searching_after=None,
-        **kwargs,
-    )
-    total = data.matching_item_count
+    def fetch_page(offset: int, local_limit: int, searching_after: Optional[str]) -> LeaderboardEntriesSearchResult:
+        return get_single_page(
+            limit=local_limit,
+            offset=offset,
+            sort_by=sort_by,
+            ascending=ascending,
+            sort_by_column_type=sort_by_column_type,
+            searching_after=searching_after,
+            **kwargs,
+        )
 
     limit = limit if limit is not None else NoLimit()
 
-    total = total if total < limit else limit
+    def window_requests(
+        searching_after: Optional[str], extracted_before: int
+    ) -> Iterator[Callable[[], LeaderboardEntriesSearchResult]]:
+        for offset in range(0, max_offset, step_size):
+            local_limit = min(step_size, max_offset - offset)
+            if extracted_before + offset + local_limit > limit:
+                local_limit = limit - extracted_before - offset
+            if local_limit <= 0:
+                return
+            yield functools.partial(fetch_page, offset, local_limit, searching_after)
+
+    with ExitStack() as stack:
+        # Pages within an offset window don't depend on each other, so with `prefetch_pages` > 1
+        # the following pages are requested while the current one is being consumed
+        executor: Optional[ThreadPoolExecutor] = None
+        if prefetch_pages > 1:
+            executor = stack.enter_context(
+                ThreadPoolExecutor(max_workers=prefetch_pages, thread_name_prefix="NeptunePagePrefetch")
+            )
+
+        def iter_window(
+            searching_after: Optional[str], extracted_before: int
+        ) -> Iterator[LeaderboardEntriesSearchResult]:
+            requests = window_requests(searching_after, extracted_before)
+            if executor is None:
+                return (request() for request in requests)
+            prefetcher = _PagePrefetcher(executor=executor, requests=requests, depth=prefetch_pages)
+            stack.callback(prefetcher.close)
+            return prefetcher
+
+        if executor is None:
+            total = fetch_page(offset=0, local_limit=0, searching_after=None).matching_item_count
+            pages = None
+        else:
+            # the item count is fetched concurrently with the first pages
+            count_future = executor.submit(fetch_page, 0, 0, None)
+            pages = iter_window(searching_after=None, extracted_before=0)
+            total = count_future.result().matching_item_count
 
-    progress_bar = False if total <= step_size else progress_bar  # disable progress bar if only one page is fetched
+        total = total if total < limit else limit
 
-    extracted_records = 0
+        progress_bar = False if total <= step_size else progress_bar  # disable progress bar if only one page is fetched
 
-    field_to_value_visitor = FieldToValueVisitor()
+        extracted_records = 0
 
-    with construct_progress_bar(progress_bar, "Fetching table...") as bar:
-        # beginning of the first page
-        bar.update(
-            by=0,
-            total=total,
-        )
+        field_to_value_visitor = FieldToValueVisitor()
 
-        while True:
-            if last_page:
-                searching_after_field = find_attribute(entry=last_page[-1], path=sort_by)
-                if not searching_after_field:
-                    raise ValueError(f"Cannot find attribute {sort_by} in last page")
-                searching_after = field_to_value_visitor.visit(searching_after_field)
-
-            for offset in range(0, max_offset, step_size):
-                local_limit = min(step_size, max_offset - offset)
-                if extracted_records + local_limit > limit:
-                    local_limit = limit - extracted_records
-
-                result = get_single_page(
-                    limit=local_limit,
-                    offset=offset,
-                    sort_by=sort_by,
-                    sort_by_column_type=sort_by_column_type,
-                    searching_after=searching_after,
-                    ascending=ascending,
-                    **kwargs,
-                )
-
-                # fetch the item count everytime a new page is started (except for the very fist page)
-                if offset == 0 and last_page is not None:
-                    total += result.matching_item_count
-
-                total = min(total, limit)
-
-                page = result.entries
-                extracted_records += len(page)
-                bar.update(by=len(page), total=total)
-
-                if not page:
-                    return
+        with construct_progress_bar(progress_bar, "Fetching table...") as bar:
+            # beginning of the first page
+            bar.update(
+                by=0,
+                total=total,
+            )
 
-                yield from page
+            while True:
+                if last_page:
+                    searching_after_field = find_attribute(entry=last_page[-1], path=sort_by)
+                    if not searching_after_field:
+                        raise ValueError(f"Cannot find attribute {sort_by} in last page")
+                    searching_after = field_to_value_visitor.visit(searching_after_field)
+                    pages = iter_window(searching_after=searching_after, extracted_before=extracted_records)
+                elif pages is None:
+                    pages = iter_window(searching_after=None, extracted_before=0)
 
-                if extracted_records == limit:
-                    return
+                window_page_count = 0
+                for result in pages:
+                    # fetch the item count everytime a new page is started (except for the very fist page)
+                    if window_page_count == 0 and last_page is not None:
+                        total += result.matching_item_count
+                    window_page_count += 1
+
+                    total = min(total, limit)
 
-                last_page = page
+                    page = result.entries
+                    extracted_records += len(page)
+                    bar.update(by=len(page), total=total)
+
+                    if not page:
+                        return
+
+                    yield from page
+
+                    if extracted_records == limit:
+                        return
+
+                    last_page = page
+
+                if window_page_count == 0:
+                    return
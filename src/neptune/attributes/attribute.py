@@ -42,7 +42,11 @@ class Attribute:
         raise TypeDoesNotSupportAttributeException(type_=type(self), attribute=attr)
 
     def _enqueue_operation(self, operation: Operation, *, wait: bool):
-        self._container._op_processor.enqueue_operation(operation, wait=wait)
+        operations_batch = self._container._operations_batch
+        if operations_batch is not None:
+            operations_batch.append(operation)
+        else:
+            self._container._op_processor.enqueue_operation(operation, wait=wait)
 
     @property
     def _backend(self) -> NeptuneBackend:
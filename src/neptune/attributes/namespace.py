@@ -88,8 +88,11 @@ class Namespace(Attribute, MutableMapping):
     ) -> None:
         if not isinstance(value, NamespaceVal):
             value = NamespaceVal(value)
-        for k, v in value.value.items():
-            self._container[f"{self._str_path}/{k}"].extend(v, steps=steps, timestamps=timestamps, wait=wait, **kwargs)
+        with self._container._batch_operations(wait=wait):
+            for k, v in value.value.items():
+                self._container[f"{self._str_path}/{k}"].extend(
+                    v, steps=steps, timestamps=timestamps, wait=False, **kwargs
+                )
 
     def to_dict(self) -> Dict[str, Any]:
         result = {}
@@ -106,27 +109,23 @@ class Namespace(Attribute, MutableMapping):
         elif not isinstance(value, NamespaceVal):
             value = NamespaceVal(value)
 
-        for k, v in value.value.items():
-            self._container[f"{self._str_path}/{k}"].assign(v, wait=wait)
-
-    def _collect_atom_values(self, attribute_dict) -> dict:
-        result = {}
-        for k, v in attribute_dict.items():
-            if isinstance(v, dict):
-                result[k] = self._collect_atom_values(v)
-            else:
-                attr_type, attr_value = v
-                if attr_type in atomic_attribute_types_map and attr_value is not NoValue:
-                    result[k] = v[1]
-        return result
+        # Nested namespaces join the outer batch, so the whole dict reaches the processor as a single group
+        with self._container._batch_operations(wait=wait):
+            for k, v in value.value.items():
+                self._container[f"{self._str_path}/{k}"].assign(v, wait=False)
 
     def fetch(self) -> dict:
         attributes = self._backend.fetch_atom_attribute_values(self._container_id, self._container_type, self._path)
-        run_struct = ContainerStructure()
+        result: dict = {}
         prefix_len = len(self._path)
         for attr_name, attr_type, attr_value in attributes:
-            run_struct.set(parse_path(attr_name)[prefix_len:], (attr_type, attr_value))
-        return self._collect_atom_values(run_struct.get_structure())
+            *namespace, name = parse_path(attr_name)[prefix_len:]
+            target = result
+            for key in namespace:
+                target = target.setdefault(key, {})
+            if attr_type in atomic_attribute_types_map and attr_value is not NoValue:
+                target[name] = attr_value
+        return result
 
 
 class NamespaceBuilder:
@@ -18,6 +18,7 @@ __all__ = ["FileSeries"]
 import io
 import os
 import pathlib
+from functools import partial
 from typing import (
     Iterable,
     List,
@@ -25,6 +26,7 @@ from typing import (
 )
 
 from neptune.attributes.series.series import Series
+from neptune.envs import NEPTUNE_OPERATION_BLOB_THRESHOLD
 from neptune.exceptions import (
     FileNotFound,
     NeptuneUnsupportedFunctionalityException,
@@ -47,22 +49,57 @@ Val = FileSeriesVal
 Data = File
 LogOperation = LogImages
 
+# Images of at least this many bytes are stored next to the operation queue instead of inside it
+DEFAULT_BLOB_THRESHOLD = 1024 * 1024
+
 
 class FileSeries(Series[Val, Data, LogOperation], max_batch_size=1, operation_cls=LogOperation):
-    @classmethod
-    def _map_series_val(cls, value: Val) -> List[ImageValue]:
-        return [
-            ImageValue(
-                data=cls._get_base64_image_content(val),
-                name=value.name,
-                description=value.description,
-            )
-            for val in value.values
-        ]
+    def _map_series_val(self, value: Val) -> List[ImageValue]:
+        return [self._get_image_value(val, name=value.name, description=value.description) for val in value.values]
+
+    def _get_image_value(self, file: File, name: Optional[str], description: Optional[str]) -> ImageValue:
+        content = self._get_image_content(file)
+
+        blob_threshold = int(os.getenv(NEPTUNE_OPERATION_BLOB_THRESHOLD) or DEFAULT_BLOB_THRESHOLD)
+        if 0 < blob_threshold <= len(content):
+            blob = self._container._op_processor.operation_storage.store_blob(content)
+            return ImageValue(data=None, name=name, description=description, blob=blob)
+
+        return ImageValue(data=base64_encode(content), name=name, description=description)
 
     def _get_clear_operation(self) -> Operation:
         return ClearImageLog(self._path)
 
+    def _enqueue_log_operations(self, value: Val, *, wait: bool) -> None:
+        encoding_stage = self._container._encoding_stage
+        if encoding_stage is None or wait:
+            self._flush_encoding_stage()
+            super()._enqueue_log_operations(value, wait=wait)
+            return
+
+        for file in value.values:
+            if file.file_type is FileType.LOCAL_FILE and not os.path.exists(file.path):
+                raise FileNotFound(file.path)
+
+        # Images are validated and encoded by the workers, and the operations are queued in the logging order
+        encoding_stage.submit(
+            encode=partial(self._get_log_operations_from_value, value),
+            emit=partial(self._enqueue_operations, wait=False),
+        )
+
+    def _flush_encoding_stage(self) -> None:
+        encoding_stage = self._container._encoding_stage
+        if encoding_stage is not None:
+            encoding_stage.flush()
+
+    def assign(self, value, wait: bool = False) -> None:
+        self._flush_encoding_stage()
+        super().assign(value, wait=wait)
+
+    def _clear_impl(self, wait: bool = False) -> None:
+        self._flush_encoding_stage()
+        super()._clear_impl(wait=wait)
+
     def _data_to_value(self, values: Iterable, **kwargs) -> Val:
         return FileSeriesVal(values, **kwargs)
 
@@ -70,7 +107,7 @@ class FileSeries(Series[Val, Data, LogOperation], max_batch_size=1, operation_cl
         return isinstance(value, FileSeriesVal)
 
     @staticmethod
-    def _get_base64_image_content(file: File) -> str:
+    def _get_image_content(file: File) -> bytes:
         if file.file_type is FileType.LOCAL_FILE:
             if not os.path.exists(file.path):
                 raise FileNotFound(file.path)
@@ -95,7 +132,7 @@ class FileSeries(Series[Val, Data, LogOperation], max_batch_size=1, operation_cl
         if image_size_exceeds_limit_for_logging(len(file_content)):
             file_content = b""
 
-        return base64_encode(file_content)
+        return file_content
 
     def download(self, destination: Optional[str], progress_bar: Optional[ProgressBarType] = None):
         target_dir = self._get_destination(destination)
@@ -16,6 +16,7 @@
 __all__ = ["Series"]
 
 import abc
+from itertools import islice
 from typing import (
     Collection,
     Generic,
@@ -27,15 +28,18 @@ from typing import (
 )
 
 from neptune.attributes.attribute import Attribute
-from neptune.internal.operation import LogOperation
+from neptune.internal.operation import (
+    LogOperation,
+    LogSeriesValues,
+)
 from neptune.internal.types.stringify_value import StringifyValue
 from neptune.internal.utils import (
     is_collection,
+    is_numeric_array,
     is_stringify_value,
     verify_collection_type,
     verify_type,
 )
-from neptune.internal.utils.iteration import get_batches
 from neptune.types.series.series import Series as SeriesVal
 
 ValTV = TypeVar("ValTV", bound=SeriesVal)
@@ -44,6 +48,8 @@ LogOperationTV = TypeVar("LogOperationTV", bound=LogOperation)
 
 
 class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
+    max_batch_size: int
+
     def __init_subclass__(cls, max_batch_size: int, operation_cls: type(LogOperationTV)):
         cls.max_batch_size = max_batch_size
         cls.operation_cls = operation_cls
@@ -52,15 +58,22 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
         self._clear_impl(wait)
 
     def _get_log_operations_from_value(self, value: ValTV) -> List[LogOperationTV]:
-        mapped_values = self._map_series_val(value)
-        values_with_step_and_ts = zip(mapped_values, value.steps, value.timestamps)
-        log_values = [self.operation_cls.ValueType(val, step=step, ts=ts) for val, step, ts in values_with_step_and_ts]
+        values = list(self._map_series_val(value))
+        steps = list(islice(value.steps, len(values)))
+        timestamps = list(islice(value.timestamps, len(values)))
         return [
-            self.operation_cls(self._path, chunk) for chunk in get_batches(log_values, batch_size=self.max_batch_size)
+            self.operation_cls(
+                self._path,
+                LogSeriesValues(
+                    values[start : start + self.max_batch_size],
+                    steps[start : start + self.max_batch_size],
+                    timestamps[start : start + self.max_batch_size],
+                ),
+            )
+            for start in range(0, len(values), self.max_batch_size)
         ]
 
-    @classmethod
-    def _map_series_val(cls, value: ValTV) -> List[DataTV]:
+    def _map_series_val(self, value: ValTV) -> List[DataTV]:
         return value.values
 
     def _get_config_operation_from_value(self, value: ValTV) -> Optional[LogOperationTV]:
@@ -125,11 +138,7 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
             timestamps = None if timestamp is None else [timestamp]
             value = self._data_to_value([value], steps=steps, timestamps=timestamps, **kwargs)
 
-        ops = self._get_log_operations_from_value(value)
-
-        with self._container.lock():
-            for op in ops:
-                self._enqueue_operation(op, wait=wait)
+        self._enqueue_log_operations(value, wait=wait)
 
     def extend(
         self,
@@ -143,11 +152,15 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
             values = self._handle_stringified_value(values)
 
         if steps is not None:
+            if is_numeric_array(steps):
+                steps = steps.tolist()
             verify_collection_type("steps", steps, (float, int))
             if len(steps) != len(values):
                 raise ValueError(f"Number of steps must be equal to number of values ({len(steps)} != {len(values)}")
 
         if timestamps is not None:
+            if is_numeric_array(timestamps):
+                timestamps = timestamps.tolist()
             verify_collection_type("timestamps", timestamps, (float, int))
             if len(timestamps) != len(values):
                 raise ValueError(
@@ -155,8 +168,12 @@ class Series(Attribute, Generic[ValTV, DataTV, LogOperationTV]):
                 )
 
         value = self._data_to_value(values, steps=steps, timestamps=timestamps, **kwargs)
-        ops = self._get_log_operations_from_value(value)
+        self._enqueue_log_operations(value, wait=wait)
+
+    def _enqueue_log_operations(self, value: ValTV, *, wait: bool) -> None:
+        self._enqueue_operations(self._get_log_operations_from_value(value), wait=wait)
 
+    def _enqueue_operations(self, ops: List[LogOperationTV], *, wait: bool) -> None:
         with self._container.lock():
             for op in ops:
                 self._enqueue_operation(op, wait=wait)
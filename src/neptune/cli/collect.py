@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -22,6 +24,7 @@ from typing import (
     Iterable,
     List,
     NamedTuple,
+    Optional,
     Tuple,
 )
 
@@ -40,13 +43,17 @@ from neptune.constants import (
     ASYNC_DIRECTORY,
     OFFLINE_DIRECTORY,
 )
+from neptune.envs import NEPTUNE_SYNC_LOOKUP_CONCURRENCY
 from neptune.internal.container_type import ContainerType
 from neptune.internal.id_formats import UniqueId
 from neptune.objects.structure_version import StructureVersion
 
 if TYPE_CHECKING:
+    from neptune.internal.backends.api_model import ApiExperiment
     from neptune.internal.backends.neptune_backend import NeptuneBackend
 
+DEFAULT_LOOKUP_CONCURRENCY = 8
+
 
 class CollectedContainers(NamedTuple):
     async_containers: List[AsyncContainer]
@@ -85,9 +92,11 @@ def collect_containers(*, path: Path, backend: "NeptuneBackend") -> CollectedCon
 
 def collect_async_containers(*, path: Path, backend: "NeptuneBackend") -> Iterable[AsyncContainer]:
     container_to_execution_dirs = collect_by_container(base_path=path / ASYNC_DIRECTORY, detect_by=detect_async_dir)
+    experiments = fetch_metadata_containers(backend=backend, container_keys=list(container_to_execution_dirs))
 
-    for (container_type, container_id), execution_dirs in container_to_execution_dirs.items():
-        experiment = get_metadata_container(backend=backend, container_type=container_type, container_id=container_id)
+    for ((container_type, container_id), execution_dirs), experiment in zip(
+        container_to_execution_dirs.items(), experiments
+    ):
         found = experiment is not None
 
         yield AsyncContainer(
@@ -99,6 +108,25 @@ def collect_async_containers(*, path: Path, backend: "NeptuneBackend") -> Iterab
         )
 
 
+def fetch_metadata_containers(
+    *, backend: "NeptuneBackend", container_keys: List[Tuple[ContainerType, UniqueId]]
+) -> List[Optional["ApiExperiment"]]:
+    """Fetches metadata of the containers concurrently, returning `None` for the ones that couldn't be fetched."""
+
+    def fetch(container_key: Tuple[ContainerType, UniqueId]) -> Optional["ApiExperiment"]:
+        container_type, container_id = container_key
+        return get_metadata_container(backend=backend, container_type=container_type, container_id=container_id)
+
+    concurrency = int(os.getenv(NEPTUNE_SYNC_LOOKUP_CONCURRENCY) or str(DEFAULT_LOOKUP_CONCURRENCY))
+    if concurrency <= 1 or len(container_keys) <= 1:
+        return [fetch(container_key) for container_key in container_keys]
+
+    with ThreadPoolExecutor(
+        max_workers=min(concurrency, len(container_keys)), thread_name_prefix="NeptuneSyncLookup"
+    ) as executor:
+        return list(executor.map(fetch, container_keys))
+
+
 def collect_offline_containers(*, path: Path) -> Iterable[OfflineContainer]:
     container_to_execution_dirs = collect_by_container(base_path=path / OFFLINE_DIRECTORY, detect_by=detect_offline_dir)
 
@@ -83,11 +83,22 @@ def status(path: Path) -> None:
     default=False,
     help="synchronize only the offline runs inside '.neptune' directory",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    "jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    metavar="<count>",
+    help="number of objects to synchronize concurrently",
+)
 def sync(
     path: Path,
     object_names: List[str],
     project_name: Optional[str],
     offline_only: Optional[bool],
+    jobs: int,
 ) -> None:
     """Synchronizes objects with unsent data to the server.
 
@@ -127,6 +138,10 @@ def sync(
     \b
     # Synchronize only the offline runs to project "workspace/project"
     neptune sync --project workspace/project --offline-only
+
+    \b
+    # Synchronize all objects in the current directory, up to 8 of them at a time
+    neptune sync --jobs 8
     """
 
     raise NeptuneUnsupportedFunctionalityException
@@ -136,12 +151,14 @@ def sync(
         if object_names:
             raise click.BadParameter("--object and --offline-only are mutually exclusive")
 
-        SyncRunner.sync_all_offline(backend=backend, base_path=path, project_name=project_name)
+        SyncRunner.sync_all_offline(backend=backend, base_path=path, project_name=project_name, jobs=jobs)
 
     elif object_names:
-        SyncRunner.sync_selected(backend=backend, base_path=path, project_name=project_name, object_names=object_names)
+        SyncRunner.sync_selected(
+            backend=backend, base_path=path, project_name=project_name, object_names=object_names, jobs=jobs
+        )
     else:
-        SyncRunner.sync_all(backend=backend, base_path=path, project_name=project_name)
+        SyncRunner.sync_all(backend=backend, base_path=path, project_name=project_name, jobs=jobs)
 
 
 @click.command()
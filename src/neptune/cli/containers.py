@@ -42,12 +42,16 @@ from neptune.cli.utils import get_qualified_name
 from neptune.constants import ASYNC_DIRECTORY
 from neptune.core.components.operation_storage import OperationStorage
 from neptune.core.components.queue.disk_queue import DiskQueue
+from neptune.core.components.queue.group_commit import get_ack_interval
 from neptune.envs import NEPTUNE_SYNC_BATCH_TIMEOUT_ENV
 from neptune.internal.container_type import ContainerType
 from neptune.internal.exceptions import NeptuneConnectionLostException
 from neptune.internal.id_formats import UniqueId
 from neptune.internal.operation import Operation
-from neptune.internal.operation_processors.utils import get_container_dir
+from neptune.internal.operation_processors.utils import (
+    get_container_dir,
+    release_operation_blobs,
+)
 from neptune.internal.utils.logger import get_logger
 from neptune.objects.structure_version import StructureVersion
 
@@ -99,6 +103,8 @@ class ExecutionDirectory:
             to_dict=serializer,
             from_dict=Operation.from_dict,
             lock=threading.RLock(),
+            ack_interval=get_ack_interval(),
+            on_ack_persisted=operation_storage.remove_released_blobs,
         ) as disk_queue:
             while True:
                 raw_batch = disk_queue.get_batch(1000)
@@ -118,9 +124,12 @@ class ExecutionDirectory:
                             operations=batch,
                             operation_storage=operation_storage,
                         )
+                        release_operation_blobs(
+                            operation_storage, batch[:processed_count], first_version=version_to_ack + 1
+                        )
                         version_to_ack += processed_count
                         batch = batch[processed_count:]
-                        disk_queue.ack(version)
+                        disk_queue.ack(version_to_ack)
                         if version_to_ack == version:
                             break
                     except NeptuneConnectionLostException as ex:
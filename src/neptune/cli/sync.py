@@ -16,6 +16,7 @@
 
 __all__ = ["SyncRunner"]
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -40,8 +41,10 @@ from neptune.internal.utils.logger import get_logger
 if TYPE_CHECKING:
     from neptune.cli.containers import (
         AsyncContainer,
+        Container,
         OfflineContainer,
     )
+    from neptune.internal.backends.api_model import Project
     from neptune.internal.backends.neptune_backend import NeptuneBackend
 
 
@@ -50,23 +53,29 @@ logger = get_logger(with_prefix=False)
 
 class SyncRunner:
     @staticmethod
-    def sync_all_offline(*, backend: "NeptuneBackend", base_path: Path, project_name: Optional[str] = None) -> None:
+    def sync_all_offline(
+        *, backend: "NeptuneBackend", base_path: Path, project_name: Optional[str] = None, jobs: int = 1
+    ) -> None:
         containers = collect_containers(path=base_path, backend=backend)
 
         project = get_project(project_name_flag=QualifiedName(project_name) if project_name else None, backend=backend)
         if not project:
             raise CannotSynchronizeOfflineRunsWithoutProject
 
-        for container in containers.offline_containers:
-            container.sync(base_path=base_path, backend=backend, project=project)
+        sync_containers(
+            containers=containers.offline_containers, base_path=base_path, backend=backend, project=project, jobs=jobs
+        )
 
     @staticmethod
-    def sync_all(*, backend: "NeptuneBackend", base_path: Path, project_name: Optional[str] = None) -> None:
+    def sync_all(
+        *, backend: "NeptuneBackend", base_path: Path, project_name: Optional[str] = None, jobs: int = 1
+    ) -> None:
         containers = collect_containers(path=base_path, backend=backend)
 
         if containers.unsynced_containers:
-            for async_container in containers.unsynced_containers:
-                async_container.sync(base_path=base_path, backend=backend, project=None)
+            sync_containers(
+                containers=containers.unsynced_containers, base_path=base_path, backend=backend, project=None, jobs=jobs
+            )
 
         if containers.offline_containers:
             project = get_project(
@@ -75,12 +84,22 @@ class SyncRunner:
             if not project:
                 raise CannotSynchronizeOfflineRunsWithoutProject
 
-            for offline_container in containers.offline_containers:
-                offline_container.sync(base_path=base_path, backend=backend, project=project)
+            sync_containers(
+                containers=containers.offline_containers,
+                base_path=base_path,
+                backend=backend,
+                project=project,
+                jobs=jobs,
+            )
 
     @staticmethod
     def sync_selected(
-        *, backend: "NeptuneBackend", base_path: Path, project_name: Optional[str] = None, object_names: Sequence[str]
+        *,
+        backend: "NeptuneBackend",
+        base_path: Path,
+        project_name: Optional[str] = None,
+        object_names: Sequence[str],
+        jobs: int = 1,
     ) -> None:
         containers = collect_containers(path=base_path, backend=backend)
         async_selected = [QualifiedName(name) for name in object_names if not name.startswith(OFFLINE_NAME_PREFIX)]
@@ -91,6 +110,7 @@ class SyncRunner:
                 base_path=base_path,
                 container_names=async_selected,
                 containers=containers.async_containers,
+                jobs=jobs,
             )
 
         offline_selected = [
@@ -103,6 +123,7 @@ class SyncRunner:
                 container_names=offline_selected,
                 containers=containers.offline_containers,
                 project_name=project_name,
+                jobs=jobs,
             )
 
 
@@ -112,6 +133,7 @@ def sync_selected_async(
     base_path: Path,
     container_names: List["QualifiedName"],
     containers: List["AsyncContainer"],
+    jobs: int = 1,
 ) -> None:
     async_containers_ids = set()
     for container_name in container_names:
@@ -126,8 +148,7 @@ def sync_selected_async(
 
     selected_async_containers = [x for x in containers if x.container_id in async_containers_ids]
 
-    for container in selected_async_containers:
-        container.sync(base_path=base_path, backend=backend, project=None)
+    sync_containers(containers=selected_async_containers, base_path=base_path, backend=backend, project=None, jobs=jobs)
 
 
 def sync_selected_offline(
@@ -137,6 +158,7 @@ def sync_selected_offline(
     container_names: List["UniqueId"],
     containers: List["OfflineContainer"],
     project_name: Optional[str] = None,
+    jobs: int = 1,
 ) -> None:
     project = get_project(project_name_flag=QualifiedName(project_name) if project_name else None, backend=backend)
     if not project:
@@ -151,5 +173,42 @@ def sync_selected_offline(
         else:
             logger.warning("Offline container %s not found on disk.", container_id)
 
-    for container in selected_offline_containers:
-        container.sync(base_path=base_path, backend=backend, project=project)
+    sync_containers(
+        containers=selected_offline_containers, base_path=base_path, backend=backend, project=project, jobs=jobs
+    )
+
+
+def sync_containers(
+    *,
+    containers: Sequence["Container"],
+    base_path: Path,
+    backend: "NeptuneBackend",
+    project: Optional["Project"],
+    jobs: int = 1,
+) -> None:
+    """Synchronizes containers, up to `jobs` of them at a time.
+
+    Each container is handled by a single worker, so operations within its queue are still sent in order.
+    Failures don't stop the remaining containers; the first one is re-raised once all workers are done.
+    """
+    if jobs <= 1 or len(containers) <= 1:
+        for container in containers:
+            container.sync(base_path=base_path, backend=backend, project=project)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(containers)), thread_name_prefix="NeptuneSync") as executor:
+        futures = [
+            executor.submit(container.sync, base_path=base_path, backend=backend, project=project)
+            for container in containers
+        ]
+
+    errors: List[BaseException] = []
+    for container, future in zip(containers, futures):
+        error = future.exception()
+        if error is not None:
+            logger.error("Synchronization of %s failed: %s", container.container_id, error)
+            errors.append(error)
+    logger.info("Synchronized %d of %d objects.", len(containers) - len(errors), len(containers))
+
+    if errors:
+        raise errors[0]
@@ -25,18 +25,14 @@ __all__ = [
 
 import os
 import textwrap
-import threading
 from pathlib import Path
 from typing import (
-    Any,
-    Callable,
-    Dict,
     Optional,
     Tuple,
     Union,
 )
 
-from neptune.core.components.queue.disk_queue import DiskQueue
+from neptune.core.components.queue.disk_queue import read_offsets
 from neptune.envs import PROJECT_ENV_NAME
 from neptune.exceptions import (
     MetadataContainerNotFound,
@@ -53,7 +49,6 @@ from neptune.internal.id_formats import (
     QualifiedName,
     UniqueId,
 )
-from neptune.internal.operation import Operation
 from neptune.internal.utils.logger import get_logger
 from neptune.objects.structure_version import StructureVersion
 
@@ -114,12 +109,12 @@ def get_qualified_name(experiment: ApiExperiment) -> QualifiedName:
 
 
 def is_single_execution_dir_synced(execution_path: Path) -> bool:
-    serializer: Callable[[Operation], Dict[str, Any]] = lambda op: op.to_dict()
+    offsets = read_offsets(execution_path)
+    if offsets is None:
+        return False
 
-    with DiskQueue(execution_path, serializer, Operation.from_dict, threading.RLock()) as disk_queue:
-        is_queue_empty: bool = disk_queue.is_empty()
-
-    return is_queue_empty
+    last_put_version, last_ack_version = offsets
+    return last_put_version == last_ack_version
 
 
 def detect_async_dir(dir_name: str) -> Tuple[ContainerType, UniqueId, StructureVersion]:
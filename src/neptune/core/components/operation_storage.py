@@ -13,20 +13,49 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["OperationStorage"]
+__all__ = ["Blob", "OperationStorage"]
 
+import hashlib
 import os
 import shutil
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
+from typing import (
+    Deque,
+    Iterable,
+    Tuple,
+)
 
 from neptune.core.components.abstract import Resource
 
 UPLOAD_PATH: str = "upload_path"
+BLOBS_PATH: str = "blobs"
+
+
+@dataclass(frozen=True)
+class Blob:
+    """Reference to a payload stored outside the operation queue, in the blob area of operation storage."""
+
+    name: str
+    size: int
+    sha256: str
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "size": self.size, "sha256": self.sha256}
+
+    @staticmethod
+    def from_dict(data: dict) -> "Blob":
+        return Blob(name=data["name"], size=data["size"], sha256=data["sha256"])
 
 
 class OperationStorage(Resource):
     def __init__(self, data_path: Path):
         self._data_path = data_path
+        self._released_blobs: Deque[Tuple[int, Blob]] = deque()
+        self._released_blobs_lock = threading.Lock()
 
         # initialize upload directory
         os.makedirs(self.upload_path, exist_ok=True)
@@ -39,5 +68,52 @@ class OperationStorage(Resource):
     def upload_path(self) -> Path:
         return self._data_path / UPLOAD_PATH
 
+    @property
+    def blobs_path(self) -> Path:
+        return self.upload_path / BLOBS_PATH
+
+    def store_blob(self, content: bytes) -> Blob:
+        sha256 = hashlib.sha256(content).hexdigest()
+        # Blobs are not shared between operations, so each one can be removed once its operation is acknowledged
+        name = f"{sha256}-{uuid.uuid4().hex}"
+
+        os.makedirs(self.blobs_path, exist_ok=True)
+        with open(self.blobs_path / name, "wb") as blob_file:
+            blob_file.write(content)
+
+        return Blob(name=name, size=len(content), sha256=sha256)
+
+    def read_blob(self, blob: Blob) -> bytes:
+        with open(self.blobs_path / blob.name, "rb") as blob_file:
+            content = blob_file.read()
+
+        if len(content) != blob.size or hashlib.sha256(content).hexdigest() != blob.sha256:
+            raise ValueError(f"Content of blob {blob.name} doesn't match its reference")
+
+        return content
+
+    def remove_blob(self, blob: Blob) -> None:
+        try:
+            os.remove(self.blobs_path / blob.name)
+        except FileNotFoundError:
+            pass
+
+    def release_blobs(self, version: int, blobs: Iterable[Blob]) -> None:
+        """Schedules removal of blobs of the processed operation with `version` in the operation queue.
+
+        They are removed by `remove_released_blobs` only once the acknowledgement of that version is persisted,
+        as until then the operation can be read from the queue again (e.g. after a crash).
+        """
+        with self._released_blobs_lock:
+            self._released_blobs.extend((version, blob) for blob in blobs)
+
+    def remove_released_blobs(self, acknowledged_version: int) -> None:
+        while True:
+            with self._released_blobs_lock:
+                if not self._released_blobs or self._released_blobs[0][0] > acknowledged_version:
+                    return
+                _, blob = self._released_blobs.popleft()
+            self.remove_blob(blob)
+
     def cleanup(self) -> None:
         shutil.rmtree(self.upload_path, ignore_errors=True)
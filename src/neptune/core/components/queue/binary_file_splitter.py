@@ -0,0 +1,99 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["BinaryFileSplitter"]
+
+import zlib
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from neptune.core.components.queue.segment_format import (
+    BINARY_SEGMENT_MAGIC,
+    RECORD_HEADER,
+    decode_record_payload,
+)
+from neptune.exceptions import MalformedOperation
+
+
+class BinaryFileSplitter:
+    """Reads length-prefixed records from a binary queue segment.
+
+    Records are located by offset, so no scanning of the payload is needed. A record that is only partially
+    written (e.g. the writer has not flushed it yet) is not consumed and will be returned by a later call.
+    """
+
+    def __init__(self, file_path: Union[str, Path]):
+        self._file: IO[bytes] = open(file_path, "rb")
+        self._offset: int = len(BINARY_SEGMENT_MAGIC)
+
+        if self._file.read(len(BINARY_SEGMENT_MAGIC)) != BINARY_SEGMENT_MAGIC:
+            self.close()
+            raise MalformedOperation(f"{file_path} is not a binary queue segment")
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        return self.get_with_size()[0]
+
+    def get_with_size(self) -> Tuple[Optional[Dict[str, Any]], int]:
+        record = self.read_at(self._offset)
+        if record is None:
+            return None, 0
+
+        data, size = record
+        self._offset += RECORD_HEADER.size + size
+        return data, size
+
+    def read_at(self, offset: int) -> Optional[Tuple[Dict[str, Any], int]]:
+        self._file.seek(offset)
+        header = self._file.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return None
+
+        size, checksum = RECORD_HEADER.unpack(header)
+        payload = self._file.read(size)
+        if len(payload) < size:
+            return None
+
+        if zlib.crc32(payload) != checksum:
+            raise MalformedOperation(f"Checksum mismatch of queue record at offset {offset}")
+
+        return decode_record_payload(payload), size
+
+    def __enter__(self) -> "BinaryFileSplitter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
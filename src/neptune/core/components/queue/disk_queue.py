@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["QueueElement", "DiskQueue"]
+__all__ = ["QueueElement", "DiskQueue", "read_offsets"]
 
 import json
 import os
@@ -26,6 +26,7 @@ from time import time
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Deque,
     Generic,
@@ -34,12 +35,33 @@ from typing import (
     Tuple,
     Type,
     TypeVar,
+    Union,
 )
 
 from neptune.core.components.abstract import WithResources
+from neptune.core.components.queue.binary_file_splitter import BinaryFileSplitter
+from neptune.core.components.queue.group_commit import (
+    Durability,
+    GroupCommitThread,
+)
 from neptune.core.components.queue.json_file_splitter import JsonFileSplitter
 from neptune.core.components.queue.log_file import LogFile
+from neptune.core.components.queue.mmap_offset_file import (
+    OFFSETS_FILE,
+    MmapOffsetFile,
+    MmapOffsetStorage,
+    read_offsets_file,
+)
+from neptune.core.components.queue.segment_format import (
+    SegmentFormat,
+    detect_segment_format,
+    encode_record,
+)
 from neptune.core.components.queue.sync_offset_file import SyncOffsetFile
+from neptune.envs import (
+    NEPTUNE_QUEUE_MMAP_OFFSETS,
+    NEPTUNE_QUEUE_SEGMENT_FORMAT,
+)
 from neptune.exceptions import MalformedOperation
 from neptune.internal.utils.logger import get_logger
 
@@ -49,11 +71,14 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 Timestamp = float
+OffsetFile = Union[SyncOffsetFile, MmapOffsetFile]
+Record = Union[str, bytes]
 
 _logger = get_logger()
 
 
 DEFAULT_MAX_BATCH_SIZE_BYTES = 100 * 1024**2
+DEFAULT_MAX_PENDING = 10_000
 
 
 @dataclass
@@ -75,6 +100,13 @@ class DiskQueue(WithResources, Generic[T]):
         max_file_size: int = 64 * 1024**2,
         max_batch_size_bytes: Optional[int] = None,
         extension: str = "log",
+        segment_format: Optional[SegmentFormat] = None,
+        group_commit_interval: Optional[float] = None,
+        durability: Durability = Durability.NONE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        mmap_offsets: Optional[bool] = None,
+        ack_interval: Optional[float] = None,
+        on_ack_persisted: Optional[Callable[[int], None]] = None,
     ) -> None:
         self._data_path: Path = data_path.resolve()
         self._to_dict: Callable[[T], dict] = to_dict
@@ -84,42 +116,230 @@ class DiskQueue(WithResources, Generic[T]):
             os.environ.get("NEPTUNE_MAX_BATCH_SIZE_BYTES") or str(DEFAULT_MAX_BATCH_SIZE_BYTES)
         )
         self._extension: str = extension
+        self._segment_format: SegmentFormat = segment_format or SegmentFormat(
+            os.environ.get(NEPTUNE_QUEUE_SEGMENT_FORMAT) or SegmentFormat.JSON.value
+        )
 
-        self._last_ack_file = SyncOffsetFile(data_path / "last_ack_version", default=0)
-        self._last_put_file = SyncOffsetFile(data_path / "last_put_version", default=0)
+        if mmap_offsets is None:
+            mmap_offsets = os.getenv(NEPTUNE_QUEUE_MMAP_OFFSETS, "False").lower() in {"true", "1", "y"}
+        self._last_put_file: OffsetFile
+        self._last_ack_file: OffsetFile
+        self._last_put_file, self._last_ack_file = get_offset_files(data_path, mmap_offsets)
 
-        self._log_files: Deque[LogFile] = get_all_log_files(data_path, extension)
+        self._log_files: Deque[LogFile] = get_all_log_files(data_path, extension, self._segment_format)
+        self._log_files_lock = threading.Lock()
         self._write_file_version: int = self._log_files[-1].min_version
         self._writer = self._log_files[-1]
         self._read_file_version: int = self._log_files[0].min_version
-        self._reader = JsonFileSplitter(self._log_files[0].file_path)
+        self._reader = get_segment_reader(self._log_files[0].file_path)
 
         self._should_skip_to_ack = True
 
         self._empty_cond = threading.Condition(lock)
 
+        self._durability: Durability = durability
+        self._max_pending: int = max_pending
+        # Buffered elements are encoded by the writer thread, so `put` only appends them to the buffer and elements
+        # must not be modified once put. An element that can't be encoded is dropped, and its error is raised
+        # by the next `put` or `commit`.
+        self._pending: List[Tuple[T, int, Timestamp]] = []
+        self._pending_lock = threading.Lock()
+        self._encoding_error: Optional[Exception] = None
+        self._commit_lock = threading.Lock()
+        self._last_pending_version: int = self._last_put_file.read_local()
+        self._last_written_version: int = self._last_put_file.read_local()
+
+        # In group-commit mode `put` only buffers elements in memory, and they are written to disk in batches
+        # by a dedicated thread. Versions are visible to consumers (e.g. in `size`) only after being committed.
+        self._group_commit_thread: Optional[GroupCommitThread] = None
+        if group_commit_interval:
+            self._group_commit_thread = GroupCommitThread(
+                commit=self._write_pending, commit_interval=group_commit_interval
+            )
+            self._group_commit_thread.start()
+
+        # With an ack interval, `ack` only updates the version in memory. Persisting it and removing fully
+        # acknowledged log files is done periodically by a dedicated thread, off the consumer's path.
+        self._ack_version: int = self._last_ack_file.read_local()
+        self._ack_persist_lock = threading.Lock()
+        self._on_ack_persisted: Optional[Callable[[int], None]] = on_ack_persisted
+        self._ack_thread: Optional[GroupCommitThread] = None
+        if ack_interval:
+            self._ack_thread = GroupCommitThread(
+                commit=self.persist_ack, commit_interval=ack_interval, name="NeptuneDiskQueueCompactor"
+            )
+            self._ack_thread.start()
+
     @property
     def data_path(self) -> Path:
         return self._data_path
 
     @property
     def resources(self) -> Tuple["Resource", ...]:
+        with self._log_files_lock:
+            log_files = tuple(self._log_files)
+
         return (
             self._last_put_file,
             self._last_ack_file,
-        ) + tuple(self._log_files)
+        ) + log_files
+
+    @property
+    def last_put_version(self) -> int:
+        """Version of the last element written to disk, and so visible to the consumer."""
+        return self._last_put_file.read_local()
 
     def put(self, obj: T) -> int:
+        if self._group_commit_thread is not None:
+            return self._put_pending(obj)
+
         version = self._last_put_file.read_local() + 1
-        serialized_obj = json.dumps(self._serialize(obj=obj, version=version, at=time()))
+        self._write_and_publish([(self._encode(obj=obj, version=version, at=time()), version)])
 
-        self._create_new_writer_if_file_size_exceeded(len(serialized_obj), version)
+        return version
 
-        self._writer.write(serialized_obj)
-        self._last_put_file.write(version)
+    def put_batch(self, objs: List[T]) -> int:
+        """Puts all elements with a single write and a single offset update, returns version of the last one."""
+        if self._group_commit_thread is not None:
+            self._raise_encoding_error()
+            at = time()
+            with self._pending_lock:
+                first_version = self._last_pending_version + 1
+                self._pending.extend((obj, version, at) for version, obj in enumerate(objs, start=first_version))
+                self._last_pending_version += len(objs)
+                version = self._last_pending_version
+                pending_count = len(self._pending)
+
+            # Apply backpressure instead of growing the buffer when the writer thread falls behind
+            if pending_count >= self._max_pending:
+                self.commit()
+
+            return version
+
+        version = self._last_put_file.read_local()
+        if not objs:
+            return version
+
+        records = self._encode_batch(objs, first_version=version + 1)
+        self._write_and_publish(records)
+
+        return records[-1][1]
+
+    def _put_pending(self, obj: T) -> int:
+        self._raise_encoding_error()
+        at = time()
+        with self._pending_lock:
+            version = self._last_pending_version + 1
+            self._pending.append((obj, version, at))
+            self._last_pending_version = version
+            pending_count = len(self._pending)
+
+        # Apply backpressure instead of growing the buffer when the writer thread falls behind
+        if pending_count >= self._max_pending:
+            self.commit()
 
         return version
 
+    def commit(self) -> None:
+        """Writes all buffered elements with a single write and a single offset update.
+
+        Raises the error of an element dropped because it couldn't be encoded, since the previous `put` or `commit`.
+        """
+        self._write_pending()
+        self._raise_encoding_error()
+
+    def _write_pending(self) -> None:
+        with self._commit_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            records = self._encode_pending(batch)
+            if not records:
+                return
+
+            try:
+                self._write_and_publish(records)
+            except Exception:
+                # Elements that didn't reach the disk are retried by the next commit
+                encoded_versions = {version for _, version in records}
+                with self._pending_lock:
+                    self._pending = [
+                        element
+                        for element in batch
+                        if element[1] in encoded_versions and element[1] > self._last_written_version
+                    ] + self._pending
+                raise
+
+    def _encode_pending(self, batch: List[Tuple[T, int, Timestamp]]) -> List[Tuple[Record, int]]:
+        records: List[Tuple[Record, int]] = []
+        for obj, version, at in batch:
+            try:
+                records.append((self._encode(obj=obj, version=version, at=at), version))
+            except Exception as e:
+                _logger.error("Queue element %d couldn't be serialized and was dropped: %s", version, e)
+                with self._pending_lock:
+                    self._encoding_error = self._encoding_error or e
+        return records
+
+    def _raise_encoding_error(self) -> None:
+        with self._pending_lock:
+            error, self._encoding_error = self._encoding_error, None
+        if error is not None:
+            raise error
+
+    def _encode_batch(self, objs: List[T], first_version: int) -> List[Tuple[Record, int]]:
+        at = time()
+        return [
+            (self._encode(obj=obj, version=version, at=at), version)
+            for version, obj in enumerate(objs, start=first_version)
+        ]
+
+    def _write_and_publish(self, records: List[Tuple[Record, int]]) -> None:
+        # Elements written before a failure are published, so their versions are never assigned again
+        try:
+            self._write_records(records)
+        finally:
+            if self._last_written_version > self._last_put_file.read_local():
+                self._last_put_file.write(self._last_written_version)
+                self._apply_durability()
+
+    def _write_records(self, records: List[Tuple[Record, int]]) -> None:
+        separator_size = 0 if self._segment_format == SegmentFormat.BINARY else 1
+        chunk: List[Record] = []
+        chunk_size = 0
+
+        for data, version in records:
+            if self._should_roll_over(chunk_size + len(data)):
+                self._write_chunk(chunk, last_version=version - 1)
+                chunk, chunk_size = [], 0
+                self._roll_over(version)
+
+            chunk.append(data)
+            chunk_size += len(data) + separator_size
+
+        self._write_chunk(chunk, last_version=records[-1][1])
+
+    def _encode(self, obj: T, version: int, at: Timestamp) -> Record:
+        serialized_obj = self._serialize(obj=obj, version=version, at=at)
+        if self._segment_format == SegmentFormat.BINARY:
+            return encode_record(serialized_obj)
+        return json.dumps(serialized_obj)
+
+    def _write_chunk(self, chunk: List[Any], last_version: int) -> None:
+        if not chunk:
+            return
+        if self._segment_format == SegmentFormat.BINARY:
+            self._writer.write_record(b"".join(chunk))
+        else:
+            self._writer.write("\n".join(chunk))
+        self._last_written_version = last_version
+
+    def _apply_durability(self) -> None:
+        if self._durability == Durability.FLUSH:
+            self._writer.flush()
+        elif self._durability == Durability.FSYNC:
+            self._writer.fsync()
+            self._last_put_file.fsync()
+
     def get(self) -> Optional[QueueElement[T]]:
         if self._should_skip_to_ack:
             return self._skip_and_get()
@@ -127,7 +347,7 @@ class DiskQueue(WithResources, Generic[T]):
             return self._get()
 
     def _skip_and_get(self) -> Optional[QueueElement[T]]:
-        ack_version = self._last_ack_file.read_local()
+        ack_version = self._ack_version
         while True:
             top_element = self._get()
             if top_element is None:
@@ -149,11 +369,12 @@ class DiskQueue(WithResources, Generic[T]):
                 return None
 
             self._reader.close()
-            for log_file in self._log_files:
-                if log_file.min_version > self._read_file_version:
-                    self._read_file_version = log_file.min_version
-                    self._reader = JsonFileSplitter(log_file.file_path)
-                    break
+            with self._log_files_lock:
+                for log_file in self._log_files:
+                    if log_file.min_version > self._read_file_version:
+                        self._read_file_version = log_file.min_version
+                        self._reader = get_segment_reader(log_file.file_path)
+                        break
 
             # It is safe. Max recursion level is 2.
             return self._get()
@@ -189,34 +410,51 @@ class DiskQueue(WithResources, Generic[T]):
             return self._empty_cond.wait_for(self.is_empty, timeout=seconds)
 
     def ack(self, version: int) -> None:
-        self._last_ack_file.write(version)
-        self._clean_log_files_up_to(version)
+        self._ack_version = version
+        if self._ack_thread is None:
+            self.persist_ack()
 
         with self._empty_cond:
             if self.is_empty():
                 self._empty_cond.notify_all()
 
-    def _create_new_writer_if_file_size_exceeded(self, size: int, version: int) -> None:
-        if self._writer.file_size + size > self._max_file_size:
-            old_writer = self._writer
-            self._writer = LogFile(self._data_path, version, extension=self._extension)
-            old_writer.flush()
-            old_writer.close()
-            self._write_file_version = version
+    def _should_roll_over(self, size: int) -> bool:
+        # Segments written in a different format (e.g. left by a previous execution) are never appended to
+        return (
+            self._writer.file_size + size > self._max_file_size or self._writer.segment_format != self._segment_format
+        )
+
+    def _roll_over(self, version: int) -> None:
+        old_writer = self._writer
+        self._writer = LogFile(self._data_path, version, extension=self._extension, segment_format=self._segment_format)
+        old_writer.flush()
+        old_writer.close()
+        self._write_file_version = version
+        with self._log_files_lock:
             self._log_files.append(self._writer)
 
-    def _clean_log_files_up_to(self, version: int) -> None:
-        log_versions = [log.min_version for log in self._log_files]
+    def persist_ack(self) -> None:
+        """Writes the last acknowledged version and removes log files holding only acknowledged elements."""
+        with self._ack_persist_lock:
+            version = self._ack_version
+            if version == self._last_ack_file.read_local():
+                return
+
+            self._last_ack_file.write(version)
+            self._clean_log_files_up_to(version)
+            if self._on_ack_persisted is not None:
+                self._on_ack_persisted(version)
 
-        for current_min_version, next_min_version in zip(log_versions, log_versions[1:]):
-            if next_min_version <= version:
+    def _clean_log_files_up_to(self, version: int) -> None:
+        with self._log_files_lock:
+            while len(self._log_files) > 1 and self._log_files[1].min_version <= version:
                 self._log_files.popleft().cleanup()
 
     def is_empty(self) -> bool:
         return self.size() == 0
 
     def size(self) -> int:
-        return self._last_put_file.read_local() - self._last_ack_file.read_local()
+        return self._last_put_file.read_local() - self._ack_version
 
     def _serialize(self, obj: T, version: int, at: Optional[Timestamp] = None) -> dict:
         return {"obj": self._to_dict(obj), "version": version, "at": at}
@@ -224,7 +462,20 @@ class DiskQueue(WithResources, Generic[T]):
     def _deserialize(self, data: dict) -> Tuple[T, int, Optional[Timestamp]]:
         return self._from_dict(data["obj"]), data["version"], data.get("at")
 
+    def flush(self) -> None:
+        self.commit()
+        self.persist_ack()
+        super().flush()
+
     def close(self) -> None:
+        if self._group_commit_thread is not None:
+            self._group_commit_thread.interrupt()
+            self._group_commit_thread.join()
+        if self._ack_thread is not None:
+            self._ack_thread.interrupt()
+            self._ack_thread.join()
+        self._write_pending()
+        self.persist_ack()
         self._reader.close()
         super().close()
 
@@ -243,11 +494,66 @@ class DiskQueue(WithResources, Generic[T]):
             self.cleanup()
 
 
-def get_all_log_files(data_path: Path, extension: str) -> Deque[LogFile]:
+def get_offset_files(data_path: Path, mmap_offsets: bool) -> Tuple[OffsetFile, OffsetFile]:
+    put_path, ack_path = data_path / "last_put_version", data_path / "last_ack_version"
+
+    # Queues already using the memory-mapped offsets are always read with them (e.g. by `neptune sync`)
+    if not mmap_offsets and not (data_path / OFFSETS_FILE).exists():
+        return SyncOffsetFile(put_path, default=0), SyncOffsetFile(ack_path, default=0)
+
+    if not (put_path.exists() or ack_path.exists()):
+        storage = MmapOffsetStorage(data_path / OFFSETS_FILE)
+        return MmapOffsetFile(storage, is_ack=False), MmapOffsetFile(storage, is_ack=True)
+
+    # Migrate offsets written by the legacy offset files. They are removed only once the migrated state is
+    # on disk, so a crash in between leaves at least one of the copies readable.
+    legacy_put, legacy_ack = SyncOffsetFile(put_path, default=0), SyncOffsetFile(ack_path, default=0)
+    storage = MmapOffsetStorage(
+        data_path / OFFSETS_FILE, default_put=legacy_put.read_local(), default_ack=legacy_ack.read_local()
+    )
+    storage.fsync()
+    for legacy_file in (legacy_put, legacy_ack):
+        legacy_file.close()
+        legacy_file.cleanup()
+
+    return MmapOffsetFile(storage, is_ack=False), MmapOffsetFile(storage, is_ack=True)
+
+
+def read_offsets(data_path: Path) -> Optional[Tuple[int, int]]:
+    """Returns the last put and last ack versions of the queue stored in `data_path`.
+
+    Unlike opening a `DiskQueue`, only the offset files are read, and nothing on disk is created or modified.
+    Returns `None` if the memory-mapped offsets file exists but holds no complete state.
+    """
+    offsets_path = data_path / OFFSETS_FILE
+    if offsets_path.exists():
+        # The legacy offset files may already be gone, so they can't be used in place of an unreadable state
+        return read_offsets_file(offsets_path)
+
+    return _read_legacy_offset(data_path / "last_put_version"), _read_legacy_offset(data_path / "last_ack_version")
+
+
+def _read_legacy_offset(path: Path) -> int:
+    try:
+        content = path.read_text()
+    except OSError:
+        return 0
+    return int(content) if content else 0
+
+
+def get_segment_reader(file_path: Path) -> Union[JsonFileSplitter, BinaryFileSplitter]:
+    if detect_segment_format(file_path) == SegmentFormat.BINARY:
+        return BinaryFileSplitter(file_path)
+    return JsonFileSplitter(file_path)
+
+
+def get_all_log_files(
+    data_path: Path, extension: str, segment_format: SegmentFormat = SegmentFormat.JSON
+) -> Deque[LogFile]:
     local_data_files = glob(f"{data_path}/data-*.{extension}")
 
     if not local_data_files:
-        return deque([LogFile(data_path, 1, extension=extension)])
+        return deque([LogFile(data_path, 1, extension=extension, segment_format=segment_format)])
 
     sorted_local_data_files = sorted(
         local_data_files, key=lambda file_path: extract_version_from_file_name(Path(file_path), extension)
@@ -255,7 +561,12 @@ def get_all_log_files(data_path: Path, extension: str) -> Deque[LogFile]:
 
     return deque(
         [
-            LogFile(data_path, extract_version_from_file_name(Path(file_path), extension), extension=extension)
+            LogFile(
+                data_path,
+                extract_version_from_file_name(Path(file_path), extension),
+                extension=extension,
+                segment_format=segment_format,
+            )
             for file_path in sorted_local_data_files
         ]
     )
@@ -0,0 +1,71 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["Durability", "GroupCommitThread", "get_group_commit_interval", "get_ack_interval", "get_durability"]
+
+import os
+from enum import Enum
+from typing import (
+    Callable,
+    Optional,
+)
+
+from neptune.envs import (
+    NEPTUNE_QUEUE_ACK_INTERVAL_MS,
+    NEPTUNE_QUEUE_COMMIT_INTERVAL_MS,
+    NEPTUNE_QUEUE_DURABILITY,
+)
+from neptune.internal.threading.daemon import Daemon
+from neptune.internal.utils.logger import get_logger
+
+_logger = get_logger()
+
+
+class Durability(str, Enum):
+    # Data stays in the process buffers until they are full or the queue is flushed
+    NONE = "none"
+    # Data is handed over to the operating system after every commit
+    FLUSH = "flush"
+    # Data is forced to the storage device after every commit
+    FSYNC = "fsync"
+
+
+class GroupCommitThread(Daemon):
+    def __init__(
+        self, commit: Callable[[], None], commit_interval: float, name: str = "NeptuneDiskQueueWriter"
+    ) -> None:
+        super().__init__(sleep_time=commit_interval, name=name)
+        self._commit = commit
+
+    def work(self) -> None:
+        # A failed commit leaves its data in place for the next one, so the thread keeps running
+        try:
+            self._commit()
+        except Exception:
+            _logger.exception("Unexpected error occurred in Neptune background thread: %s", self.name)
+
+
+def get_group_commit_interval() -> Optional[float]:
+    interval_ms = float(os.getenv(NEPTUNE_QUEUE_COMMIT_INTERVAL_MS) or "0")
+    return interval_ms / 1000 if interval_ms > 0 else None
+
+
+def get_ack_interval() -> Optional[float]:
+    interval_ms = float(os.getenv(NEPTUNE_QUEUE_ACK_INTERVAL_MS) or "0")
+    return interval_ms / 1000 if interval_ms > 0 else None
+
+
+def get_durability() -> Durability:
+    return Durability(os.getenv(NEPTUNE_QUEUE_DURABILITY, Durability.NONE.value).lower())
@@ -13,16 +13,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import os
 from pathlib import Path
+from typing import (
+    IO,
+    Any,
+)
 
 from neptune.core.components.abstract import Resource
+from neptune.core.components.queue.segment_format import (
+    BINARY_SEGMENT_MAGIC,
+    SegmentFormat,
+    detect_segment_format,
+)
 from neptune.internal.utils.logger import get_logger
 
 logger = get_logger()
 
 
 class LogFile(Resource):
-    def __init__(self, data_path: Path, min_version: int, extension: str = "log") -> None:
+    def __init__(
+        self,
+        data_path: Path,
+        min_version: int,
+        extension: str = "log",
+        segment_format: SegmentFormat = SegmentFormat.JSON,
+    ) -> None:
         self._data_path: Path = data_path
         self._min_version: int = min_version
         self._extension: str = extension
@@ -31,7 +47,20 @@ class LogFile(Resource):
         if (data_path / f"data-{min_version}.{extension}").exists():
             self._file_size = self.file_path.stat().st_size
 
-        self._writer = open(self.file_path, "a")
+        # Format of a non-empty segment is fixed by its content, the requested one applies only to new segments
+        self._segment_format: SegmentFormat = (
+            detect_segment_format(self.file_path) if self._file_size > 0 else segment_format
+        )
+
+        self._writer: IO[Any]
+        if self._segment_format == SegmentFormat.BINARY:
+            self._writer = open(self.file_path, "ab")
+            if self._file_size == 0:
+                self._writer.write(BINARY_SEGMENT_MAGIC)
+                self._writer.flush()
+                self._file_size = len(BINARY_SEGMENT_MAGIC)
+        else:
+            self._writer = open(self.file_path, "a")
 
     @property
     def data_path(self) -> Path:
@@ -45,6 +74,10 @@ class LogFile(Resource):
     def file_size(self) -> int:
         return self._file_size
 
+    @property
+    def segment_format(self) -> SegmentFormat:
+        return self._segment_format
+
     @property
     def file_name(self) -> str:
         return f"data-{self._min_version}.{self._extension}"
@@ -57,6 +90,10 @@ class LogFile(Resource):
         self._writer.write(data + "\n")
         self._file_size += len(data) + 1
 
+    def write_record(self, record: bytes) -> None:
+        self._writer.write(record)
+        self._file_size += len(record)
+
     def cleanup(self) -> None:
         self.close()
         try:
@@ -70,6 +107,11 @@ class LogFile(Resource):
         if not self._writer.closed:
             self._writer.flush()
 
+    def fsync(self) -> None:
+        if not self._writer.closed:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+
     def close(self) -> None:
         if not self._writer.closed:
             self._writer.close()
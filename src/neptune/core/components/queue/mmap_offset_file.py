@@ -0,0 +1,193 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["OFFSETS_FILE", "MmapOffsetStorage", "MmapOffsetFile", "read_offsets_file"]
+
+import mmap
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import (
+    IO,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from neptune.core.components.abstract import Resource
+
+OFFSETS_FILE: str = "offsets"
+
+# Every slot holds the generation, last put version and last ack version followed by their CRC32 checksum
+_STATE = struct.Struct("<Qqq")
+_CHECKSUM = struct.Struct("<I")
+_SLOT_SIZE = 32
+_SLOTS_COUNT = 2
+_FILE_SIZE = _SLOT_SIZE * _SLOTS_COUNT
+
+
+class MmapOffsetStorage:
+    """Keeps both last put and last ack versions of a queue in a single memory-mapped file.
+
+    Every write goes to the slot not holding the current state and bumps the generation counter, so a torn write
+    (e.g. caused by a crash) never corrupts the last complete state. Readers pick the valid slot with the highest
+    generation.
+    """
+
+    def __init__(self, path: Path, default_put: int = 0, default_ack: int = 0) -> None:
+        self._path: Path = path
+        exists = path.exists() and path.stat().st_size == _FILE_SIZE
+
+        self._file: IO[bytes] = open(path, "r+b" if exists else "w+b")
+        if not exists:
+            self._file.write(b"\0" * _FILE_SIZE)
+            self._file.flush()
+        self._mmap: mmap.mmap = mmap.mmap(self._file.fileno(), _FILE_SIZE)
+
+        self._lock = threading.Lock()
+        self._generation: int = 0
+        self._put: int = default_put
+        self._ack: int = default_ack
+        state = self._read_state()
+        if state is not None:
+            self._generation, self._put, self._ack = state
+        else:
+            self._write_state()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def put(self) -> int:
+        return self._put
+
+    @property
+    def ack(self) -> int:
+        return self._ack
+
+    def read(self) -> Tuple[int, int]:
+        state = self._read_state()
+        if state is not None:
+            _, put, ack = state
+            return put, ack
+        return self._put, self._ack
+
+    def write_put(self, put: int) -> None:
+        with self._lock:
+            self._put = put
+            self._write_state()
+
+    def write_ack(self, ack: int) -> None:
+        with self._lock:
+            self._ack = ack
+            self._write_state()
+
+    def _write_state(self) -> None:
+        self._generation += 1
+        offset = (self._generation % _SLOTS_COUNT) * _SLOT_SIZE
+        state = _STATE.pack(self._generation, self._put, self._ack)
+        self._mmap[offset : offset + _STATE.size] = state
+        _CHECKSUM.pack_into(self._mmap, offset + _STATE.size, zlib.crc32(state))
+
+    def _read_state(self) -> Optional[Tuple[int, int, int]]:
+        return _parse_state(self._mmap)
+
+    def fsync(self) -> None:
+        if not self._mmap.closed:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        if not self._mmap.closed:
+            self._mmap.close()
+        if not self._file.closed:
+            self._file.close()
+
+    def cleanup(self) -> None:
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+
+def read_offsets_file(path: Path) -> Optional[Tuple[int, int]]:
+    """Reads the last put and last ack versions without mapping or modifying the file.
+
+    Returns `None` if the file doesn't exist or holds no complete state.
+    """
+    try:
+        with open(path, "rb") as file:
+            content = file.read(_FILE_SIZE)
+    except OSError:
+        return None
+
+    if len(content) != _FILE_SIZE:
+        return None
+
+    state = _parse_state(content)
+    if state is None:
+        return None
+    _, put, ack = state
+    return put, ack
+
+
+def _parse_state(buffer: Union[bytes, mmap.mmap]) -> Optional[Tuple[int, int, int]]:
+    latest: Optional[Tuple[int, int, int]] = None
+    for slot in range(_SLOTS_COUNT):
+        offset = slot * _SLOT_SIZE
+        state = buffer[offset : offset + _STATE.size]
+        (checksum,) = _CHECKSUM.unpack_from(buffer, offset + _STATE.size)
+        if zlib.crc32(state) != checksum:
+            continue
+        generation, put, ack = _STATE.unpack(state)
+        if latest is None or generation > latest[0]:
+            latest = generation, put, ack
+    return latest
+
+
+class MmapOffsetFile(Resource):
+    """Offset file-like view of one of the versions kept by `MmapOffsetStorage`."""
+
+    def __init__(self, storage: MmapOffsetStorage, is_ack: bool) -> None:
+        self._storage: MmapOffsetStorage = storage
+        self._is_ack: bool = is_ack
+
+    @property
+    def data_path(self) -> Path:
+        return self._storage.path.parent
+
+    def write(self, offset: int) -> None:
+        if self._is_ack:
+            self._storage.write_ack(offset)
+        else:
+            self._storage.write_put(offset)
+
+    def read(self) -> int:
+        put, ack = self._storage.read()
+        return ack if self._is_ack else put
+
+    def read_local(self) -> int:
+        return self._storage.ack if self._is_ack else self._storage.put
+
+    def fsync(self) -> None:
+        self._storage.fsync()
+
+    def close(self) -> None:
+        self._storage.close()
+
+    def cleanup(self) -> None:
+        self._storage.cleanup()
@@ -0,0 +1,66 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = [
+    "SegmentFormat",
+    "BINARY_SEGMENT_MAGIC",
+    "RECORD_HEADER",
+    "encode_record",
+    "decode_record_payload",
+    "detect_segment_format",
+]
+
+import struct
+import zlib
+from enum import Enum
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Union,
+)
+
+import msgpack
+
+# Written once at the beginning of every binary segment. Legacy JSON segments always start with `{` or are empty.
+BINARY_SEGMENT_MAGIC: bytes = b"NPTQ\x01"
+
+# Every binary record is prefixed with its payload length and CRC32 checksum (both little-endian uint32).
+RECORD_HEADER: struct.Struct = struct.Struct("<II")
+
+
+class SegmentFormat(str, Enum):
+    JSON = "json"
+    BINARY = "binary"
+
+
+def encode_record(data: Dict[str, Any]) -> bytes:
+    payload: bytes = msgpack.packb(data, use_bin_type=True)
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def decode_record_payload(payload: bytes) -> Dict[str, Any]:
+    data: Dict[str, Any] = msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    return data
+
+
+def detect_segment_format(file_path: Union[str, Path]) -> SegmentFormat:
+    try:
+        with open(file_path, "rb") as file:
+            if file.read(len(BINARY_SEGMENT_MAGIC)) == BINARY_SEGMENT_MAGIC:
+                return SegmentFormat.BINARY
+    except FileNotFoundError:
+        pass
+    return SegmentFormat.JSON
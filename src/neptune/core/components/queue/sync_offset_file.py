@@ -54,6 +54,10 @@ class SyncOffsetFile(Resource):
     def flush(self) -> None:
         self._file.flush()
 
+    def fsync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
     def close(self) -> None:
         self._file.close()
 
@@ -24,6 +24,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    List,
     Optional,
     Tuple,
 )
@@ -115,6 +116,20 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
         if wait:
             self.wait()
 
+    @ensure_disk_not_overutilize
+    def enqueue_operations(self, ops: List[Operation], *, wait: bool) -> None:
+        if not self._accepts_operations:
+            warn_once("Not accepting operations", exception=NeptuneWarning)
+            return
+
+        if ops:
+            self._last_version = self.processing_resources.disk_queue.put_batch(ops)
+
+        if _queue_has_enough_space(self.processing_resources.disk_queue.size(), self._processing_resources.batch_size):
+            self._consumer.wake_up()
+        if wait:
+            self.wait()
+
     def start(self) -> None:
         self._consumer.start()
 
@@ -37,6 +37,11 @@ from neptune.core.components.abstract import (
 from neptune.core.components.metadata_file import MetadataFile
 from neptune.core.components.operation_storage import OperationStorage
 from neptune.core.components.queue.disk_queue import DiskQueue
+from neptune.core.components.queue.group_commit import (
+    get_ack_interval,
+    get_durability,
+    get_group_commit_interval,
+)
 from neptune.core.operation_processors.utils import (
     common_metadata,
     get_container_full_path,
@@ -73,6 +78,9 @@ class ProcessingResources(WithResources):
             to_dict=serializer,
             from_dict=Operation.from_dict,
             lock=lock,
+            group_commit_interval=get_group_commit_interval(),
+            durability=get_durability(),
+            ack_interval=get_ack_interval(),
         )
 
         self.waiting_cond = threading.Condition()
@@ -22,6 +22,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    List,
     Optional,
     Tuple,
 )
@@ -78,6 +79,10 @@ class OfflineOperationProcessor(WithResources, OperationProcessor):
     def enqueue_operation(self, op: Operation, *, wait: bool) -> None:
         self._queue.put(op)
 
+    @ensure_disk_not_overutilize
+    def enqueue_operations(self, ops: List[Operation], *, wait: bool) -> None:
+        self._queue.put_batch(ops)
+
     def wait(self) -> None:
         self.flush()
 
@@ -18,6 +18,7 @@ __all__ = ("OperationProcessor",)
 import abc
 from typing import (
     TYPE_CHECKING,
+    List,
     Optional,
 )
 
@@ -30,6 +31,12 @@ class OperationProcessor(abc.ABC):
     @abc.abstractmethod
     def enqueue_operation(self, op: "Operation", *, wait: bool) -> None: ...
 
+    def enqueue_operations(self, ops: List["Operation"], *, wait: bool) -> None:
+        for op in ops:
+            self.enqueue_operation(op, wait=False)
+        if wait:
+            self.wait()
+
     @property
     def operation_storage(self) -> "OperationStorage":
         raise NotImplementedError()
@@ -24,8 +24,10 @@ __all__ = [
     "NEPTUNE_NOTEBOOK_PATH",
     "NEPTUNE_RETRIES_TIMEOUT_ENV",
     "NEPTUNE_SYNC_BATCH_TIMEOUT_ENV",
+    "NEPTUNE_SYNC_LOOKUP_CONCURRENCY",
     "NEPTUNE_SUBPROCESS_KILL_TIMEOUT",
     "NEPTUNE_FETCH_TABLE_STEP_SIZE",
+    "NEPTUNE_FETCH_TABLE_PREFETCH_PAGES",
     "NEPTUNE_SYNC_AFTER_STOP_TIMEOUT",
     "NEPTUNE_REQUEST_TIMEOUT",
     "NEPTUNE_MAX_DISK_USAGE",
@@ -34,6 +36,22 @@ __all__ = [
     "NEPTUNE_ENABLE_DEFAULT_ASYNC_NO_PROGRESS_CALLBACK",
     "NEPTUNE_USE_PROTOCOL_BUFFERS",
     "NEPTUNE_ASYNC_BATCH_SIZE",
+    "NEPTUNE_ASYNC_PREFETCH_DEPTH",
+    "NEPTUNE_SYNC_MODE_BATCH_SIZE",
+    "NEPTUNE_SYNC_MODE_BATCH_INTERVAL_MS",
+    "NEPTUNE_HEARTBEAT_WORKERS",
+    "NEPTUNE_STD_CAPTURE_FLUSH_INTERVAL_MS",
+    "NEPTUNE_STD_CAPTURE_MAX_BYTES_PER_SECOND",
+    "NEPTUNE_QUEUE_SEGMENT_FORMAT",
+    "NEPTUNE_QUEUE_COMMIT_INTERVAL_MS",
+    "NEPTUNE_QUEUE_DURABILITY",
+    "NEPTUNE_QUEUE_ACK_INTERVAL_MS",
+    "NEPTUNE_QUEUE_MMAP_OFFSETS",
+    "NEPTUNE_UPLOAD_CONCURRENCY",
+    "NEPTUNE_UPLOAD_COMPRESSION_LEVEL",
+    "NEPTUNE_STREAM_FILE_SET_UPLOADS",
+    "NEPTUNE_IMAGE_ENCODING_WORKERS",
+    "NEPTUNE_OPERATION_BLOB_THRESHOLD",
     "S3_ENDPOINT_URL",
 ]
 
@@ -58,10 +76,14 @@ NEPTUNE_NOTEBOOK_PATH = "NEPTUNE_NOTEBOOK_PATH"
 
 NEPTUNE_SYNC_BATCH_TIMEOUT_ENV = "NEPTUNE_SYNC_BATCH_TIMEOUT"
 
+NEPTUNE_SYNC_LOOKUP_CONCURRENCY = "NEPTUNE_SYNC_LOOKUP_CONCURRENCY"
+
 NEPTUNE_SUBPROCESS_KILL_TIMEOUT = "NEPTUNE_SUBPROCESS_KILL_TIMEOUT"
 
 NEPTUNE_FETCH_TABLE_STEP_SIZE = "NEPTUNE_FETCH_TABLE_STEP_SIZE"
 
+NEPTUNE_FETCH_TABLE_PREFETCH_PAGES = "NEPTUNE_FETCH_TABLE_PREFETCH_PAGES"
+
 NEPTUNE_SYNC_AFTER_STOP_TIMEOUT = "NEPTUNE_SYNC_AFTER_STOP_TIMEOUT"
 
 NEPTUNE_REQUEST_TIMEOUT = "NEPTUNE_REQUEST_TIMEOUT"
@@ -76,6 +98,38 @@ NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED = "NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_
 
 NEPTUNE_ASYNC_BATCH_SIZE = "NEPTUNE_ASYNC_BATCH_SIZE"
 
+NEPTUNE_ASYNC_PREFETCH_DEPTH = "NEPTUNE_ASYNC_PREFETCH_DEPTH"
+
+NEPTUNE_SYNC_MODE_BATCH_SIZE = "NEPTUNE_SYNC_MODE_BATCH_SIZE"
+
+NEPTUNE_SYNC_MODE_BATCH_INTERVAL_MS = "NEPTUNE_SYNC_MODE_BATCH_INTERVAL_MS"
+
+NEPTUNE_HEARTBEAT_WORKERS = "NEPTUNE_HEARTBEAT_WORKERS"
+
+NEPTUNE_STD_CAPTURE_FLUSH_INTERVAL_MS = "NEPTUNE_STD_CAPTURE_FLUSH_INTERVAL_MS"
+
+NEPTUNE_STD_CAPTURE_MAX_BYTES_PER_SECOND = "NEPTUNE_STD_CAPTURE_MAX_BYTES_PER_SECOND"
+
 NEPTUNE_USE_PROTOCOL_BUFFERS = "NEPTUNE_USE_PROTOCOL_BUFFERS"
 
+NEPTUNE_QUEUE_SEGMENT_FORMAT = "NEPTUNE_QUEUE_SEGMENT_FORMAT"
+
+NEPTUNE_QUEUE_COMMIT_INTERVAL_MS = "NEPTUNE_QUEUE_COMMIT_INTERVAL_MS"
+
+NEPTUNE_QUEUE_DURABILITY = "NEPTUNE_QUEUE_DURABILITY"
+
+NEPTUNE_QUEUE_ACK_INTERVAL_MS = "NEPTUNE_QUEUE_ACK_INTERVAL_MS"
+
+NEPTUNE_QUEUE_MMAP_OFFSETS = "NEPTUNE_QUEUE_MMAP_OFFSETS"
+
+NEPTUNE_UPLOAD_CONCURRENCY = "NEPTUNE_UPLOAD_CONCURRENCY"
+
+NEPTUNE_UPLOAD_COMPRESSION_LEVEL = "NEPTUNE_UPLOAD_COMPRESSION_LEVEL"
+
+NEPTUNE_STREAM_FILE_SET_UPLOADS = "NEPTUNE_STREAM_FILE_SET_UPLOADS"
+
+NEPTUNE_IMAGE_ENCODING_WORKERS = "NEPTUNE_IMAGE_ENCODING_WORKERS"
+
+NEPTUNE_OPERATION_BLOB_THRESHOLD = "NEPTUNE_OPERATION_BLOB_THRESHOLD"
+
 S3_ENDPOINT_URL = "S3_ENDPOINT_URL"
@@ -52,6 +52,7 @@ from neptune.internal.utils import (
     is_dict_like,
     is_float,
     is_float_like,
+    is_numeric_array,
     is_string,
     is_stringify_value,
     verify_collection_type,
@@ -809,7 +810,7 @@ class ExtendUtils:
         if isinstance(values, Namespace) or is_dict_like(values):
             for val in values.values():
                 yield from ExtendUtils.generate_leaf_collection_lengths(val)
-        elif is_collection(values):
+        elif is_collection(values) or is_numeric_array(values):
             yield len(values)
         else:
             raise NeptuneUserApiInputException("Values must be a collection or namespace leafs must be collections")
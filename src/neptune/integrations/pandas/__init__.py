@@ -15,17 +15,22 @@
 #
 from __future__ import annotations
 
-__all__ = ["to_pandas"]
+__all__ = ["to_pandas", "to_arrow"]
 
+from array import array
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
+    Iterable,
+    List,
     Optional,
     Tuple,
     Union,
 )
 
+import numpy as np
 import pandas as pd
 
 from neptune.api.models import (
@@ -47,6 +52,7 @@ from neptune.api.models import (
     StringSeriesField,
     StringSetField,
 )
+from neptune.internal.utils.requirement_check import require_installed
 
 if TYPE_CHECKING:
     from neptune.table import Table
@@ -102,17 +108,6 @@ class FieldToPandasValueVisitor(FieldVisitor[PANDAS_AVAILABLE_TYPES]):
         return field.hash
 
 
-def make_row(entry: LeaderboardEntry, to_value_visitor: FieldVisitor) -> Dict[str, PANDAS_AVAILABLE_TYPES]:
-    row: Dict[str, PANDAS_AVAILABLE_TYPES] = dict()
-
-    for field in entry.fields:
-        value = to_value_visitor.visit(field)
-        if value is not None:
-            row[field.path] = value
-
-    return row
-
-
 def sort_key(field: str) -> Tuple[int, str]:
     domain = field.split("/")[0]
     if domain == "sys":
@@ -122,12 +117,98 @@ def sort_key(field: str) -> Tuple[int, str]:
     return 1, field
 
 
+class ColumnarTableBuilder:
+    """Collects values of leaderboard entries column by column.
+
+    Each column keeps only the row numbers and values that are present, so no per-row dictionaries
+    are created and missing values don't take any space until the final frame is built. Entries without
+    any values are skipped, and rows are labeled with the position of their entry.
+    """
+
+    def __init__(self, to_value_visitor: Optional[FieldVisitor] = None) -> None:
+        self._to_value_visitor = to_value_visitor or FieldToPandasValueVisitor()
+        self._columns: Dict[str, Tuple["array[int]", List[PANDAS_AVAILABLE_TYPES]]] = {}
+        self._row_count = 0
+        self._row_labels: "array[int]" = array("q")
+        self._entry_count = 0
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    def add_entries(self, entries: Iterable[LeaderboardEntry]) -> None:
+        for entry in entries:
+            self.add_entry(entry)
+
+    def add_entry(self, entry: LeaderboardEntry) -> None:
+        row = self._row_count
+        has_values = False
+        for field in entry.fields:
+            value = self._to_value_visitor.visit(field)
+            if value is not None:
+                column = self._columns.get(field.path)
+                if column is None:
+                    column = self._columns[field.path] = (array("q"), [])
+                column[0].append(row)
+                column[1].append(value)
+                has_values = True
+
+        if has_values:
+            self._row_labels.append(self._entry_count)
+            self._row_count += 1
+        self._entry_count += 1
+
+    def _sorted_columns(self) -> List[str]:
+        return sorted(self._columns, key=sort_key)
+
+    def _dense_column(self, path: str, missing: Optional[float] = None) -> List[PANDAS_AVAILABLE_TYPES]:
+        rows, values = self._columns[path]
+        if len(rows) == self._row_count:
+            return values
+        dense: List[PANDAS_AVAILABLE_TYPES] = [missing] * self._row_count
+        for row, value in zip(rows, values):
+            dense[row] = value
+        return dense
+
+    def _pandas_column(self, path: str) -> Union[np.ndarray, List[PANDAS_AVAILABLE_TYPES]]:
+        rows, values = self._columns[path]
+        if isinstance(values[0], float):
+            typed_values = np.asarray(values)
+            if typed_values.dtype.kind == "f":
+                column = np.full(self._row_count, np.nan)
+                column[np.frombuffer(rows, dtype=np.int64)] = typed_values
+                return column
+        return self._dense_column(path, missing=np.nan)
+
+    def to_pandas(self) -> pd.DataFrame:
+        columns = self._sorted_columns()
+        data = {path: self._pandas_column(path) for path in columns}
+        return pd.DataFrame(data, index=pd.Index(np.frombuffer(self._row_labels, dtype=np.int64)), columns=columns)
+
+    def to_arrow(self) -> Any:  # pyarrow.Table
+        require_installed("pyarrow")
+        import pyarrow
+
+        arrays = []
+        for path in self._sorted_columns():
+            column = self._dense_column(path)
+            try:
+                arrays.append(pyarrow.array(column))
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                # the same attribute can hold values of different types in different runs
+                arrays.append(pyarrow.array([None if value is None else str(value) for value in column]))
+        return pyarrow.Table.from_arrays(arrays, names=self._sorted_columns())
+
+
 def to_pandas(table: Table) -> pd.DataFrame:
+    builder = ColumnarTableBuilder()
+    builder.add_entries(table._entries)
+
+    return builder.to_pandas()
 
-    to_value_visitor = FieldToPandasValueVisitor()
-    rows = dict((n, make_row(entry, to_value_visitor)) for (n, entry) in enumerate(table._entries))
 
-    df = pd.DataFrame.from_dict(data=rows, orient="index")
-    df = df.reindex(sorted(df.columns, key=sort_key), axis="columns")
+def to_arrow(table: Table) -> Any:  # pyarrow.Table
+    builder = ColumnarTableBuilder()
+    builder.add_entries(table._entries)
 
-    return df
+    return builder.to_arrow()
@@ -74,11 +74,11 @@ class LocalArtifactDriver(ArtifactDriver):
         stored_files: typing.List[ArtifactFileData] = list()
 
         files_to_check = source_location.rglob("*") if source_location.is_dir() else [source_location]
-        for file in files_to_check:
-            # symlink dirs are omitted by rglob('*')
-            if not file.is_file():
-                continue
+        # symlink dirs are omitted by rglob('*')
+        files = [file for file in files_to_check if file.is_file()]
+        file_hashes = FileHasher.get_local_file_hashes(files)
 
+        for file, file_hash in zip(files, file_hashes):
             if source_location.is_dir():
                 file_path = file.relative_to(source_location).as_posix()
             else:
@@ -88,7 +88,7 @@ class LocalArtifactDriver(ArtifactDriver):
             stored_files.append(
                 ArtifactFileData(
                     file_path=file_path,
-                    file_hash=FileHasher.get_local_file_hash(file),
+                    file_hash=file_hash,
                     type=ArtifactFileType.LOCAL.value,
                     size=file.stat().st_size,
                     metadata=cls._serialize_metadata(
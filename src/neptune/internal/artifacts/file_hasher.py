@@ -17,7 +17,9 @@ __all__ = ["FileHasher"]
 
 import datetime
 import hashlib
+import os
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from neptune.internal.artifacts.local_file_hash_storage import LocalFileHashStorage
@@ -36,29 +38,57 @@ class FileHasher:
     SERVER_LONG_BYTES = 8
     SERVER_BYTE_ORDER = "big"
     HASH_LENGTH = 64  # sha-256
+    PARALLEL_HASHING_MIN_FILES = 64
+    PARALLEL_HASHING_MAX_WORKERS = 8
 
     @classmethod
     def get_local_file_hash(cls, file_path: typing.Union[str, Path]) -> str:
-        local_storage = LocalFileHashStorage()
-
-        absolute = Path(file_path).resolve()
-        modification_date = datetime.datetime.fromtimestamp(absolute.stat().st_mtime).strftime("%Y%m%d_%H%M%S%f")
-
-        stored_file_hash = local_storage.fetch_one(absolute)
+        return cls.get_local_file_hashes([file_path])[0]
 
-        if stored_file_hash:
-            if stored_file_hash.modification_date >= modification_date:
-                computed_hash = stored_file_hash.file_hash
-            else:
-                computed_hash = sha1(absolute)
-                local_storage.update(absolute, computed_hash, modification_date)
-        else:
-            computed_hash = sha1(absolute)
-            local_storage.insert(absolute, computed_hash, modification_date)
+    @classmethod
+    def get_local_file_hashes(cls, file_paths: typing.Sequence[typing.Union[str, Path]]) -> typing.List[str]:
+        """Returns hashes of local files, computing only those not stored or modified since they were stored."""
+        local_storage = LocalFileHashStorage()
 
-        local_storage.close()
+        try:
+            absolute_paths = [Path(file_path).resolve() for file_path in file_paths]
+            modification_dates = {
+                absolute: datetime.datetime.fromtimestamp(absolute.stat().st_mtime).strftime("%Y%m%d_%H%M%S%f")
+                for absolute in absolute_paths
+            }
+            stored_file_hashes = local_storage.fetch_many(modification_dates)
+
+            hashes: typing.Dict[Path, str] = {}
+            to_insert, to_update = [], []
+            for absolute, modification_date in modification_dates.items():
+                stored_file_hash = stored_file_hashes.get(str(absolute))
+                if stored_file_hash is None:
+                    to_insert.append(absolute)
+                elif stored_file_hash.modification_date >= modification_date:
+                    hashes[absolute] = stored_file_hash.file_hash
+                else:
+                    to_update.append(absolute)
+
+            hashes.update(cls._compute_hashes(to_insert + to_update))
+
+            local_storage.save_many(
+                inserted=[(path, hashes[path], modification_dates[path]) for path in to_insert],
+                updated=[(path, hashes[path], modification_dates[path]) for path in to_update],
+            )
+        finally:
+            local_storage.close()
+
+        return [hashes[absolute] for absolute in absolute_paths]
 
-        return computed_hash
+    @classmethod
+    def _compute_hashes(cls, paths: typing.List[Path]) -> typing.Dict[Path, str]:
+        if len(paths) < cls.PARALLEL_HASHING_MIN_FILES:
+            return {path: sha1(path) for path in paths}
+
+        # hashlib releases the GIL while hashing, so threads are enough to use multiple cores
+        max_workers = min(cls.PARALLEL_HASHING_MAX_WORKERS, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="NeptuneFileHasher") as executor:
+            return dict(zip(paths, executor.map(sha1, paths)))
 
     @classmethod
     def _number_to_bytes(cls, int_value: int, bytes_cnt):
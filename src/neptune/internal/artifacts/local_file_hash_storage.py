@@ -19,9 +19,17 @@ import os
 import sqlite3 as sql
 from dataclasses import dataclass
 from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Tuple,
+)
 
 
 class LocalFileHashStorage:
+    # Stays well below SQLite's default limit of host parameters in a single statement
+    MAX_LOOKUP_BATCH_SIZE = 500
+
     @dataclass
     class LocalFileHash:
         file_path: str
@@ -37,6 +45,7 @@ class LocalFileHashStorage:
         self.cursor.execute(
             "CREATE TABLE IF NOT EXISTS local_file_hashes (file_path text, file_hash text, modification_date text)"
         )
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS local_file_hashes_file_path ON local_file_hashes (file_path)")
         self.session.commit()
 
     def insert(self, path: Path, computed_hash: str, modification_date: str):
@@ -64,5 +73,36 @@ class LocalFileHashStorage:
         )
         self.session.commit()
 
+    def fetch_many(self, paths: Iterable[Path]) -> Dict[str, "LocalFileHash"]:
+        str_paths = list(dict.fromkeys(str(path) for path in paths))
+        found: Dict[str, LocalFileHashStorage.LocalFileHash] = {}
+        for start in range(0, len(str_paths), self.MAX_LOOKUP_BATCH_SIZE):
+            batch = str_paths[start : start + self.MAX_LOOKUP_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            for row in self.cursor.execute(
+                "SELECT file_path, file_hash, modification_date FROM local_file_hashes"
+                f" WHERE file_path IN ({placeholders})",
+                batch,
+            ):
+                found.setdefault(row[0], LocalFileHashStorage.LocalFileHash(*row))
+
+        return found
+
+    def save_many(
+        self,
+        inserted: Iterable[Tuple[Path, str, str]],
+        updated: Iterable[Tuple[Path, str, str]],
+    ) -> None:
+        """Inserts and updates (path, hash, modification date) entries in a single transaction."""
+        self.cursor.executemany(
+            "INSERT INTO local_file_hashes (file_path, file_hash, modification_date) VALUES (?, ?, ?)",
+            [(str(path), computed_hash, modification_date) for path, computed_hash, modification_date in inserted],
+        )
+        self.cursor.executemany(
+            "UPDATE local_file_hashes SET file_hash=?, modification_date=? WHERE file_path = ?",
+            [(computed_hash, modification_date, str(path)) for path, computed_hash, modification_date in updated],
+        )
+        self.session.commit()
+
     def close(self) -> None:
         self.session.close()
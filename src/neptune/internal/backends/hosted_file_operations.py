@@ -22,12 +22,14 @@ __all__ = [
 
 import collections
 import enum
+import functools
 import json
 import os
 import time
 from contextlib import ExitStack
 from io import BytesIO
 from typing import (
+    TYPE_CHECKING,
     AnyStr,
     Dict,
     Iterable,
@@ -48,6 +50,7 @@ from requests import (
     Response,
 )
 
+from neptune.envs import NEPTUNE_STREAM_FILE_SET_UPLOADS
 from neptune.exceptions import (
     FileUploadError,
     MetadataInconsistency,
@@ -73,8 +76,10 @@ from neptune.internal.storage import (
     AttributeUploadConfiguration,
     FileChunk,
     FileChunker,
+    TarGzStream,
     UploadEntry,
     compress_to_tar_gz_in_memory,
+    get_compression_level,
     normalize_file_name,
     scan_unique_upload_entries,
     split_upload_files,
@@ -86,6 +91,9 @@ from neptune.internal.utils import (
 from neptune.internal.utils.logger import get_logger
 from neptune.typing import ProgressBarType
 
+if TYPE_CHECKING:
+    from neptune.internal.backends.upload_executor import UploadExecutor
+
 logger = get_logger()
 BYTES_IN_ONE_MB = 2**20
 DEFAULT_CHUNK_SIZE = 5 * BYTES_IN_ONE_MB
@@ -104,6 +112,7 @@ def upload_file_attribute(
     source: Union[str, bytes],
     ext: str,
     multipart_config: Optional[MultipartConfig],
+    executor: Optional["UploadExecutor"] = None,
 ) -> List[NeptuneException]:
     if isinstance(source, str) and not os.path.isfile(source):
         return [FileUploadError(source, "Path not found or is a not a file.")]
@@ -124,6 +133,7 @@ def upload_file_attribute(
             swagger_client=swagger_client,
             multipart_config=multipart_config,
             target=FileUploadTarget.FILE_ATOM,
+            executor=executor,
         )
     except MetadataInconsistency as e:
         return [e]
@@ -136,6 +146,7 @@ def upload_file_set_attribute(
     file_globs: Iterable[str],
     reset: bool,
     multipart_config: Optional[MultipartConfig],
+    executor: Optional["UploadExecutor"] = None,
 ) -> List[NeptuneException]:
     unique_upload_entries = get_unique_upload_entries(file_globs)
 
@@ -154,7 +165,13 @@ def upload_file_set_attribute(
             )
 
             if uploading_multiple_entries or creating_a_single_empty_dir or package.is_empty():
-                data = compress_to_tar_gz_in_memory(upload_entries=package.items)
+                data: Union[bytes, TarGzStream]
+                if _should_stream_file_sets():
+                    data = TarGzStream(upload_entries=package.items, compression_level=get_compression_level())
+                else:
+                    data = compress_to_tar_gz_in_memory(
+                        upload_entries=package.items, compression_level=get_compression_level()
+                    )
                 url = build_operation_url(
                     swagger_client.swagger_spec.api_url,
                     swagger_client.api.uploadFileSetAttributeTar.operation.path_name,
@@ -183,6 +200,7 @@ def upload_file_set_attribute(
                     swagger_client=swagger_client,
                     multipart_config=multipart_config,
                     target=FileUploadTarget.FILE_SET,
+                    executor=executor,
                 )
 
             reset = False
@@ -193,6 +211,10 @@ def upload_file_set_attribute(
             return [MetadataInconsistency(desc) for desc in e.args]
 
 
+def _should_stream_file_sets() -> bool:
+    return os.getenv(NEPTUNE_STREAM_FILE_SET_UPLOADS, "False").lower() in {"true", "1", "y"}
+
+
 def get_unique_upload_entries(file_globs: Iterable[str]) -> Set[UploadEntry]:
     absolute_paths = get_absolute_paths(file_globs)
     common_root = get_common_root(absolute_paths)
@@ -281,11 +303,12 @@ def _multichunk_upload_with_retry(
     query_params: dict,
     multipart_config: Optional[MultipartConfig],
     target: FileUploadTarget,
+    executor: Optional["UploadExecutor"] = None,
 ):
     urlset = _build_multipart_urlset(swagger_client, target)
     while True:
         try:
-            return _multichunk_upload(upload_entry, swagger_client, query_params, multipart_config, urlset)
+            return _multichunk_upload(upload_entry, swagger_client, query_params, multipart_config, urlset, executor)
         except UploadedFileChanged as e:
             logger.error(str(e))
 
@@ -296,6 +319,7 @@ def _multichunk_upload(
     query_params: dict,
     multipart_config: Optional[MultipartConfig],
     urlset: MultipartUrlSet,
+    executor: Optional["UploadExecutor"] = None,
 ):
     if multipart_config is None:
         multipart_config = MultipartConfig.get_default()
@@ -330,19 +354,26 @@ def _multichunk_upload(
                 entry_length,
                 multipart_config,
             )
-            for idx, chunk in enumerate(chunker.generate()):
-                result = upload_raw_data(
-                    http_client=swagger_client.swagger_spec.http_client,
+            chunk_uploads = (
+                functools.partial(
+                    _upload_chunk,
+                    swagger_client=swagger_client,
                     url=urlset.send_chunk,
-                    data=chunk.data,
-                    headers={"X-Range": _build_x_range(chunk, entry_length)},
+                    chunk=chunk,
+                    total_size=entry_length,
                     query_params={
                         "uploadId": upload_id,
                         "uploadPartIdx": idx,
                         **no_ext_query_params,
                     },
                 )
-                _attribute_upload_response_handler(result)
+                for idx, chunk in enumerate(chunker.generate())
+            )
+            if executor is None:
+                for upload_chunk in chunk_uploads:
+                    upload_chunk()
+            else:
+                executor.run_chunks(chunk_uploads)
 
             result = urlset.finish_chunked(**no_ext_query_params, uploadId=upload_id).response().result
             if result.errors:
@@ -352,6 +383,19 @@ def _multichunk_upload(
         file_stream.close()
 
 
+def _upload_chunk(
+    swagger_client: SwaggerClientWrapper, url: str, chunk: FileChunk, total_size: int, query_params: dict
+) -> None:
+    result = upload_raw_data(
+        http_client=swagger_client.swagger_spec.http_client,
+        url=url,
+        data=chunk.data,
+        headers={"X-Range": _build_x_range(chunk, total_size)},
+        query_params=query_params,
+    )
+    _attribute_upload_response_handler(result)
+
+
 def _build_x_range(chunk: FileChunk, total_size: int) -> str:
     return "bytes=%d-%d/%d" % (
         chunk.start,
@@ -364,7 +408,7 @@ def _build_x_range(chunk: FileChunk, total_size: int) -> str:
 def upload_raw_data(
     http_client: RequestsClient,
     url: str,
-    data: AnyStr,
+    data: Union[AnyStr, Iterable[bytes]],
     path_params: Optional[Dict[str, str]] = None,
     query_params: Optional[Dict[str, str]] = None,
     headers: Optional[Dict[str, str]] = None,
@@ -15,6 +15,7 @@
 #
 __all__ = ["HostedNeptuneBackend"]
 
+import functools
 import itertools
 import os
 import re
@@ -38,6 +39,7 @@ from bravado.exception import (
     HTTPUnprocessableEntity,
 )
 
+from neptune.api.field_visitor import FieldToValueVisitor
 from neptune.api.models import (
     ArtifactField,
     BoolField,
@@ -54,6 +56,7 @@ from neptune.api.models import (
     IntField,
     LeaderboardEntry,
     NextPage,
+    ObjectStateField,
     QueryFieldDefinitionsResult,
     QueryFieldsResult,
     StringField,
@@ -67,6 +70,7 @@ from neptune.api.proto.neptune_pb.api.model.series_values_pb2 import ProtoFloatS
 from neptune.api.searching_entries import iter_over_pages
 from neptune.core.components.operation_storage import OperationStorage
 from neptune.envs import (
+    NEPTUNE_FETCH_TABLE_PREFETCH_PAGES,
     NEPTUNE_FETCH_TABLE_STEP_SIZE,
     NEPTUNE_USE_PROTOCOL_BUFFERS,
 )
@@ -86,6 +90,7 @@ from neptune.exceptions import (
 from neptune.internal.artifacts.types import ArtifactFileData
 from neptune.internal.backends.api_model import (
     ApiExperiment,
+    MultipartConfig,
     OptionalFeatures,
     Project,
     Workspace,
@@ -116,6 +121,10 @@ from neptune.internal.backends.nql import NQLQuery
 from neptune.internal.backends.operation_api_name_visitor import OperationApiNameVisitor
 from neptune.internal.backends.operation_api_object_converter import OperationApiObjectConverter
 from neptune.internal.backends.operations_preprocessor import OperationsPreprocessor
+from neptune.internal.backends.upload_executor import (
+    UploadExecutor,
+    get_upload_concurrency,
+)
 from neptune.internal.backends.utils import (
     ExecuteOperationsBatchingManager,
     MissingApiClient,
@@ -143,11 +152,17 @@ from neptune.internal.operation import (
     UploadFileSet,
 )
 from neptune.internal.utils import base64_decode
-from neptune.internal.utils.generic_attribute_mapper import map_attribute_result_to_value
+from neptune.internal.utils.generic_attribute_mapper import (
+    NoValue,
+    atomic_attribute_types_map,
+    map_attribute_result_to_value,
+)
 from neptune.internal.utils.git import GitInfo
+from neptune.internal.utils.iteration import get_batches
 from neptune.internal.utils.logger import get_logger
 from neptune.internal.utils.paths import path_to_str
 from neptune.internal.utils.patterns import PROJECT_QUALIFIED_NAME_PATTERN
+from neptune.internal.utils.run_state import RunState
 from neptune.internal.warnings import (
     NeptuneWarning,
     warn_once,
@@ -174,6 +189,9 @@ ATOMIC_ATTRIBUTE_TYPES = {
     FieldType.OBJECT_STATE.value,
 }
 
+# Keeps requests filtering attributes by path small, even when values of the whole container are fetched
+ATTRIBUTE_PATHS_FILTER_BATCH_SIZE = 500
+
 
 class HostedNeptuneBackend(NeptuneBackend):
     def __init__(self, credentials: Credentials, proxies: Optional[Dict[str, str]] = None):
@@ -197,6 +215,15 @@ class HostedNeptuneBackend(NeptuneBackend):
             # create a stub
             self.artifacts_client = MissingApiClient(OptionalFeatures.ARTIFACTS)
 
+        upload_concurrency = get_upload_concurrency()
+        self._upload_executor: Optional[UploadExecutor] = (
+            UploadExecutor(max_workers=upload_concurrency) if upload_concurrency > 1 else None
+        )
+
+    def close(self) -> None:
+        if self._upload_executor is not None:
+            self._upload_executor.shutdown()
+
     def verify_feature_available(self, feature_name: str):
         if not self._client_config.has_feature(feature_name):
             raise NeptuneFeatureNotAvailableException(feature_name)
@@ -502,6 +529,7 @@ class HostedNeptuneBackend(NeptuneBackend):
                 container_id,
                 container_type,
                 operations=assign_artifact_operations + preprocessed_operations.other_operations,
+                operation_storage=operation_storage,
             )
         )
 
@@ -537,45 +565,82 @@ class HostedNeptuneBackend(NeptuneBackend):
         else:
             multipart_config = None
 
-        for op in upload_operations:
-            if isinstance(op, UploadFile):
-                upload_errors = upload_file_attribute(
-                    swagger_client=self.leaderboard_client,
-                    container_id=container_id,
-                    attribute=path_to_str(op.path),
-                    source=op.get_absolute_path(operation_storage),
-                    ext=op.ext,
-                    multipart_config=multipart_config,
-                )
-                if upload_errors:
-                    errors.extend(upload_errors)
-            elif isinstance(op, UploadFileContent):
-                upload_errors = upload_file_attribute(
-                    swagger_client=self.leaderboard_client,
-                    container_id=container_id,
-                    attribute=path_to_str(op.path),
-                    source=base64_decode(op.file_content),
-                    ext=op.ext,
-                    multipart_config=multipart_config,
-                )
-                if upload_errors:
-                    errors.extend(upload_errors)
-            elif isinstance(op, UploadFileSet):
-                upload_errors = upload_file_set_attribute(
-                    swagger_client=self.leaderboard_client,
-                    container_id=container_id,
-                    attribute=path_to_str(op.path),
-                    file_globs=op.file_globs,
-                    reset=op.reset,
-                    multipart_config=multipart_config,
+        upload_operation = functools.partial(
+            self._execute_upload_operation,
+            container_id=container_id,
+            operation_storage=operation_storage,
+            multipart_config=multipart_config,
+        )
+
+        if self._upload_executor is None:
+            for op in upload_operations:
+                errors.extend(upload_operation(op))
+            return errors
+
+        # Uploads to the same attribute keep their order, different attributes are uploaded concurrently
+        operations_by_path: Dict[Tuple[str, ...], List[Tuple[int, Operation]]] = {}
+        for idx, op in enumerate(upload_operations):
+            operations_by_path.setdefault(tuple(op.path), []).append((idx, op))
+
+        def upload_path_operations(ops: List[Tuple[int, Operation]]) -> List[Tuple[int, List[NeptuneException]]]:
+            return [(idx, upload_operation(path_op)) for idx, path_op in ops]
+
+        # Errors are reported in the order of operations, not of attributes
+        operation_errors = sorted(
+            itertools.chain.from_iterable(
+                self._upload_executor.run_all(
+                    [functools.partial(upload_path_operations, ops) for ops in operations_by_path.values()]
                 )
-                if upload_errors:
-                    errors.extend(upload_errors)
-            else:
-                raise InternalClientError("Upload operation in neither File or FileSet")
+            ),
+            key=lambda idx_errors: idx_errors[0],
+        )
+        for _, op_errors in operation_errors:
+            errors.extend(op_errors)
 
         return errors
 
+    def _execute_upload_operation(
+        self,
+        op: Operation,
+        container_id: str,
+        operation_storage: OperationStorage,
+        multipart_config: Optional[MultipartConfig],
+    ) -> List[NeptuneException]:
+        if isinstance(op, UploadFile):
+            upload_errors = upload_file_attribute(
+                swagger_client=self.leaderboard_client,
+                container_id=container_id,
+                attribute=path_to_str(op.path),
+                source=op.get_absolute_path(operation_storage),
+                ext=op.ext,
+                multipart_config=multipart_config,
+                executor=self._upload_executor,
+            )
+        elif isinstance(op, UploadFileContent):
+            upload_errors = upload_file_attribute(
+                swagger_client=self.leaderboard_client,
+                container_id=container_id,
+                attribute=path_to_str(op.path),
+                source=base64_decode(op.file_content),
+                ext=op.ext,
+                multipart_config=multipart_config,
+                executor=self._upload_executor,
+            )
+        elif isinstance(op, UploadFileSet):
+            upload_errors = upload_file_set_attribute(
+                swagger_client=self.leaderboard_client,
+                container_id=container_id,
+                attribute=path_to_str(op.path),
+                file_globs=op.file_globs,
+                reset=op.reset,
+                multipart_config=multipart_config,
+                executor=self._upload_executor,
+            )
+        else:
+            raise InternalClientError("Upload operation in neither File or FileSet")
+
+        return upload_errors or []
+
     def _execute_upload_operations_with_400_retry(
         self,
         container_id: str,
@@ -648,13 +713,15 @@ class HostedNeptuneBackend(NeptuneBackend):
         container_id: UniqueId,
         container_type: ContainerType,
         operations: List[Operation],
+        operation_storage: Optional[OperationStorage] = None,
     ) -> List[MetadataInconsistency]:
+        converter = OperationApiObjectConverter(operation_storage)
         kwargs = {
             "experimentId": container_id,
             "operations": [
                 {
                     "path": path_to_str(op.path),
-                    OperationApiNameVisitor().visit(op): OperationApiObjectConverter().convert(op),
+                    OperationApiNameVisitor().visit(op): converter.convert(op),
                 }
                 for op in operations
             ],
@@ -1041,21 +1108,56 @@ class HostedNeptuneBackend(NeptuneBackend):
     @with_api_exceptions_handler
     def fetch_atom_attribute_values(
         self, container_id: str, container_type: ContainerType, path: List[str]
+    ) -> List[Tuple[str, FieldType, Any]]:
+        namespace_prefix = path_to_str(path)
+        if not namespace_prefix:
+            return self._fetch_all_attribute_values(container_id, container_type)
+
+        # don't want to catch "ns/attribute/other" while looking for "ns/attr"
+        namespace_prefix += "/"
+        all_definitions = self.get_fields_definitions(container_id, container_type)
+        definitions = [definition for definition in all_definitions if definition.path.startswith(namespace_prefix)]
+        if 2 * len(definitions) > len(all_definitions):
+            # Values of the whole container are fetched with a single request, instead of many filtered ones
+            return [
+                attribute
+                for attribute in self._fetch_all_attribute_values(container_id, container_type)
+                if attribute[0].startswith(namespace_prefix)
+            ]
+
+        # Only definitions are listed for the whole container, values are fetched just for the atoms under the prefix
+        atom_paths = [
+            definition.path for definition in definitions if definition.type.value in atomic_attribute_types_map
+        ]
+        # object state and notebook ref fields have no protobuf decoders
+        fields = [
+            field
+            for batch in get_batches(atom_paths, batch_size=ATTRIBUTE_PATHS_FILTER_BATCH_SIZE)
+            for field in self.get_fields_with_paths_filter(container_id, container_type, batch, use_proto=False)
+        ]
+        visitor = FieldToValueVisitor()
+        values = {
+            # object state is reported with its API value, as by `getExperimentAttributes`
+            field.path: (
+                RunState.from_string(field.value).to_api()
+                if isinstance(field, ObjectStateField)
+                else field.accept(visitor)
+            )
+            for field in fields
+        }
+        return [
+            (definition.path, definition.type.value, values.get(definition.path, NoValue)) for definition in definitions
+        ]
+
+    def _fetch_all_attribute_values(
+        self, container_id: str, container_type: ContainerType
     ) -> List[Tuple[str, FieldType, Any]]:
         params = {
             "experimentId": container_id,
         }
         try:
-            namespace_prefix = path_to_str(path)
-            if namespace_prefix:
-                # don't want to catch "ns/attribute/other" while looking for "ns/attr"
-                namespace_prefix += "/"
             result = self.leaderboard_client.api.getExperimentAttributes(**params).response().result
-            return [
-                (attr.name, attr.type, map_attribute_result_to_value(attr))
-                for attr in result.attributes
-                if attr.name.startswith(namespace_prefix)
-            ]
+            return [(attr.name, attr.type, map_attribute_result_to_value(attr)) for attr in result.attributes]
         except HTTPNotFound as e:
             raise ContainerUUIDNotFound(container_id, container_type) from e
 
@@ -1129,6 +1231,7 @@ class HostedNeptuneBackend(NeptuneBackend):
                 sort_by_column_type=sort_by_column_type,
                 progress_bar=progress_bar,
                 use_proto=use_proto,
+                prefetch_pages=int(os.getenv(NEPTUNE_FETCH_TABLE_PREFETCH_PAGES, "1")),
             )
         except HTTPNotFound:
             raise ProjectNotFound(project_id)
@@ -15,6 +15,9 @@
 #
 __all__ = ["OperationApiObjectConverter"]
 
+from typing import Optional
+
+from neptune.core.components.operation_storage import OperationStorage
 from neptune.internal.exceptions import InternalClientError
 from neptune.internal.operation import (
     AddStrings,
@@ -50,6 +53,9 @@ from neptune.internal.operation_visitor import (
 
 
 class OperationApiObjectConverter(OperationVisitor[dict]):
+    def __init__(self, operation_storage: Optional[OperationStorage] = None):
+        self._operation_storage = operation_storage
+
     def convert(self, op: Operation) -> dict:
         return op.accept(self)
 
@@ -109,14 +115,14 @@ class OperationApiObjectConverter(OperationVisitor[dict]):
             "entries": [
                 {
                     "value": {
-                        "data": value.value.data,
+                        "data": data,
                         "name": value.value.name,
                         "description": value.value.description,
                     },
                     "step": value.step,
                     "timestampMilliseconds": int(value.ts * 1000),
                 }
-                for value in op.values
+                for value, data in op.get_values_with_data(self._operation_storage)
             ]
         }
 
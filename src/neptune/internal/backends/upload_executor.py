@@ -0,0 +1,140 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["UploadExecutor", "get_upload_concurrency"]
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    Callable,
+    Deque,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from neptune.envs import NEPTUNE_UPLOAD_CONCURRENCY
+
+T = TypeVar("T")
+
+
+def get_upload_concurrency() -> int:
+    return max(int(os.getenv(NEPTUNE_UPLOAD_CONCURRENCY) or "1"), 1)
+
+
+class UploadExecutor:
+    """Runs file uploads on bounded thread pools.
+
+    Whole attributes and chunks of a single multipart upload use separate pools, so an attribute upload
+    waiting for its chunks never starves them of workers.
+
+    Pools are created on first use and again in a forked child process, as their worker threads don't survive
+    a fork. Once the executor is shut down, tasks are run sequentially in the calling thread.
+    """
+
+    def __init__(self, max_workers: int):
+        self._max_workers: int = max_workers
+        self._lock = threading.Lock()
+        self._pools: Optional[Tuple[ThreadPoolExecutor, ThreadPoolExecutor]] = None
+        self._pools_pid: Optional[int] = None
+        self._shut_down: bool = False
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _get_pools(self) -> Optional[Tuple[ThreadPoolExecutor, ThreadPoolExecutor]]:
+        with self._lock:
+            if self._shut_down:
+                return None
+            if self._pools is None or self._pools_pid != os.getpid():
+                self._pools = (
+                    ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="NeptuneUpload"),
+                    ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="NeptuneUploadChunk"),
+                )
+                self._pools_pid = os.getpid()
+            return self._pools
+
+    def run_all(self, tasks: Sequence[Callable[[], T]]) -> List[T]:
+        """Runs tasks concurrently and returns their results in order.
+
+        All tasks are finished before the first exception, if any, is re-raised.
+        """
+        pools = self._get_pools()
+        if pools is None:
+            return [task() for task in tasks]
+
+        futures = [self._submit(pools[0], task) for task in tasks]
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def run_chunks(self, tasks: Iterable[Callable[[], None]]) -> None:
+        """Runs chunk uploads with at most `max_workers` of them in flight.
+
+        Tasks are pulled from `tasks` lazily, so only the chunks being sent are kept in memory.
+        """
+        pools = self._get_pools()
+        if pools is None:
+            for task in tasks:
+                task()
+            return
+
+        in_flight: Deque["Future[None]"] = deque()
+        try:
+            for task in tasks:
+                if len(in_flight) >= self._max_workers:
+                    in_flight.popleft().result()
+                in_flight.append(self._submit(pools[1], task))
+
+            while in_flight:
+                in_flight.popleft().result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+            wait(in_flight)
+
+    def _submit(self, pool: ThreadPoolExecutor, task: Callable[[], T]) -> "Future[T]":
+        try:
+            return pool.submit(task)
+        except RuntimeError:
+            if not self._shut_down:
+                raise
+
+        # The executor was shut down while tasks were being submitted
+        future: "Future[T]" = Future()
+        try:
+            future.set_result(task())
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self) -> None:
+        """Stops the pools without waiting, uploads still running are finished by their worker threads."""
+        with self._lock:
+            self._shut_down = True
+            pools, self._pools = self._pools, None
+        # Pools inherited from the parent process have no worker threads to stop
+        if pools is not None and self._pools_pid == os.getpid():
+            for pool in pools:
+                pool.shutdown(wait=False)
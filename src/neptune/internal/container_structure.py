@@ -18,9 +18,11 @@ __all__ = ["ContainerStructure"]
 from collections import deque
 from typing import (
     Callable,
+    Dict,
     Generic,
     List,
     Optional,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -44,6 +46,8 @@ class ContainerStructure(Generic[T, Node]):
         self._structure = node_factory(path=[])
         self._node_factory = node_factory
         self._node_type = type(self._structure)
+        # Flat index of the leaves, so repeated lookups of the same attribute don't walk the tree
+        self._leaves: Dict[Tuple[str, ...], T] = {}
 
     def get_structure(self) -> Node:
         return self._structure
@@ -65,6 +69,10 @@ class ContainerStructure(Generic[T, Node]):
             yield path_to_str(path)
 
     def get(self, path: List[str]) -> Union[T, Node, None]:
+        leaf = self._leaves.get(tuple(path))
+        if leaf is not None:
+            return leaf
+
         ref = self._structure
 
         for index, part in enumerate(path):
@@ -100,9 +108,14 @@ class ContainerStructure(Generic[T, Node]):
             raise MetadataInconsistency("Cannot set attribute '{}'. It's a namespace".format(path_to_str(path)))
 
         ref[attribute_name] = attr
+        if isinstance(attr, self._node_type):
+            self._leaves.pop(tuple(path), None)
+        else:
+            self._leaves[tuple(path)] = attr
 
     def pop(self, path: List[str]) -> None:
         self._pop_impl(self._structure, path, path)
+        self._leaves.pop(tuple(path), None)
 
     def _pop_impl(self, ref, sub_path: List[str], attr_path: List[str]):
         if not sub_path:
@@ -125,3 +138,4 @@ class ContainerStructure(Generic[T, Node]):
 
     def clear(self):
         self._structure.clear()
+        self._leaves.clear()
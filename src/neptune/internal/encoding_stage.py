@@ -0,0 +1,111 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["EncodingStage", "get_image_encoding_workers"]
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Tuple,
+    TypeVar,
+)
+
+from neptune.envs import NEPTUNE_IMAGE_ENCODING_WORKERS
+from neptune.internal.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+
+def get_image_encoding_workers() -> int:
+    return int(os.getenv(NEPTUNE_IMAGE_ENCODING_WORKERS) or "0")
+
+
+class EncodingStage:
+    """Encodes values on a pool of worker threads and emits the results in the order they were submitted.
+
+    Results are emitted while holding `lock`, the lock guarding the operation processor of the object. Worker
+    threads never wait for it. A dedicated emitter thread does, so results are emitted as soon as the lock is
+    released, even if nothing else is logged or flushed in the meantime.
+    """
+
+    def __init__(self, lock: threading.RLock, max_workers: int) -> None:
+        self._lock: threading.RLock = lock
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="NeptuneEncoding")
+        self._pending: Deque[Tuple["Future[Any]", Callable[[Any], None]]] = deque()
+        self._pending_cond = threading.Condition(threading.Lock())
+        self._closed = False
+        self._emitter = threading.Thread(target=self._run_emitter, name="NeptuneEncodingEmitter", daemon=True)
+        self._emitter.start()
+
+    def submit(self, encode: Callable[[], T], emit: Callable[[T], None]) -> None:
+        future = self._executor.submit(encode)
+        with self._pending_cond:
+            self._pending.append((future, emit))
+            self._pending_cond.notify_all()
+        self._emit_ready()
+
+    def flush(self) -> None:
+        """Waits until all submitted values are encoded and emits them."""
+        with self._pending_cond:
+            futures = [future for future, _ in self._pending]
+        wait(futures)
+        self._emit_ready()
+
+    def shutdown(self) -> None:
+        self.flush()
+        with self._pending_cond:
+            self._closed = True
+            self._pending_cond.notify_all()
+        # The emitter isn't joined, as the caller may hold the lock the emitter is waiting for
+        self._executor.shutdown(wait=True)
+
+    def _run_emitter(self) -> None:
+        while True:
+            with self._pending_cond:
+                self._pending_cond.wait_for(lambda: self._pending or self._closed)
+                if self._closed:
+                    return
+                future = self._pending[0][0]
+            wait([future])
+            self._emit_ready()
+
+    def _emit_ready(self) -> None:
+        with self._lock:
+            while True:
+                with self._pending_cond:
+                    if not self._pending or not self._pending[0][0].done():
+                        return
+                    future, emit = self._pending.popleft()
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error("Failed to encode value, it will not be logged: %s", e)
+                    continue
+                emit(result)
@@ -19,16 +19,26 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Callable,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
     TypeVar,
+    Union,
+    overload,
 )
 
-from neptune.core.components.operation_storage import OperationStorage
+from neptune.core.components.operation_storage import (
+    Blob,
+    OperationStorage,
+)
 from neptune.exceptions import MalformedOperation
 from neptune.internal.container_type import ContainerType
 from neptune.internal.exceptions import (
@@ -36,6 +46,9 @@ from neptune.internal.exceptions import (
     NeptuneException,
 )
 from neptune.internal.types.file_types import FileType
+from neptune.internal.utils import base64_encode
+from neptune.internal.utils.logger import get_logger
+from neptune.internal.utils.paths import path_to_str
 from neptune.types.atoms.file import File
 
 if TYPE_CHECKING:
@@ -46,6 +59,8 @@ if TYPE_CHECKING:
 Ret = TypeVar("Ret")
 T = TypeVar("T")
 
+logger = get_logger()
+
 
 def all_subclasses(cls):
     return set(cls.__subclasses__()).union([s for c in cls.__subclasses__() for s in all_subclasses(c)])
@@ -63,6 +78,9 @@ class Operation(abc.ABC):
     def clean(self, operation_storage: OperationStorage):
         pass
 
+    def get_blobs(self) -> List[Blob]:
+        return []
+
     def to_dict(self) -> dict:
         return {"type": self.__class__.__name__, "path": self.path}
 
@@ -310,19 +328,98 @@ class LogSeriesValue(Generic[T]):
         return LogSeriesValue[T](value_deserializer(data["value"]), data.get("step", None), data["ts"])
 
 
+class LogSeriesValues(Sequence[LogSeriesValue[T]]):
+    """Values of a log operation kept as separate lists of values, steps and timestamps.
+
+    `LogSeriesValue` objects are created only when the values are accessed, they aren't needed for serialization.
+    """
+
+    __slots__ = ("_values", "_steps", "_timestamps")
+
+    def __init__(self, values: List[T], steps: List[Optional[float]], timestamps: List[float]):
+        self._values = values
+        self._steps = steps
+        self._timestamps = timestamps
+
+    @staticmethod
+    def copy_of(values: Sequence[LogSeriesValue[T]]) -> "LogSeriesValues[T]":
+        """Returns values that can be extended without modifying `values`."""
+        if isinstance(values, LogSeriesValues):
+            return LogSeriesValues(list(values._values), list(values._steps), list(values._timestamps))
+        return LogSeriesValues(
+            [value.value for value in values], [value.step for value in values], [value.ts for value in values]
+        )
+
+    def extend(self, values: Sequence[LogSeriesValue[T]]) -> None:
+        if isinstance(values, LogSeriesValues):
+            self._values.extend(values._values)
+            self._steps.extend(values._steps)
+            self._timestamps.extend(values._timestamps)
+            return
+        for value in values:
+            self._values.append(value.value)
+            self._steps.append(value.step)
+            self._timestamps.append(value.ts)
+
+    def to_dicts(self, value_serializer: Callable[[T], Any] = lambda x: x) -> List[dict]:
+        return [
+            {"value": value_serializer(value), "step": step, "ts": ts}
+            for value, step, ts in zip(self._values, self._steps, self._timestamps)
+        ]
+
+    @overload
+    def __getitem__(self, index: int) -> LogSeriesValue[T]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LogSeriesValues[T]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[LogSeriesValue[T], "LogSeriesValues[T]"]:
+        if isinstance(index, slice):
+            return LogSeriesValues(self._values[index], self._steps[index], self._timestamps[index])
+        return LogSeriesValue(self._values[index], self._steps[index], self._timestamps[index])
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[LogSeriesValue[T]]:
+        return map(LogSeriesValue, self._values, self._steps, self._timestamps)
+
+    def __add__(self, other: Iterable[LogSeriesValue[T]]) -> List[LogSeriesValue[T]]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: Iterable[LogSeriesValue[T]]) -> List[LogSeriesValue[T]]:
+        return list(other) + list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LogSeriesValues):
+            return (self._values, self._steps, self._timestamps) == (other._values, other._steps, other._timestamps)
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LogSeriesValues({list(self)!r})"
+
+
+def _log_values_to_dicts(values: Sequence[LogSeriesValue[T]], value_serializer=lambda x: x) -> List[dict]:
+    if isinstance(values, LogSeriesValues):
+        return values.to_dicts(value_serializer)
+    return [value.to_dict(value_serializer) for value in values]
+
+
 @dataclass
 class LogFloats(LogOperation):
 
     ValueType = LogSeriesValue[float]
 
-    values: List[ValueType]
+    values: Sequence[ValueType]
 
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_log_floats(self)
 
     def to_dict(self) -> dict:
         ret = super().to_dict()
-        ret["values"] = [value.to_dict() for value in self.values]
+        ret["values"] = _log_values_to_dicts(self.values)
         return ret
 
     @staticmethod
@@ -338,14 +435,14 @@ class LogStrings(LogOperation):
 
     ValueType = LogSeriesValue[str]
 
-    values: List[ValueType]
+    values: Sequence[ValueType]
 
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_log_strings(self)
 
     def to_dict(self) -> dict:
         ret = super().to_dict()
-        ret["values"] = [value.to_dict() for value in self.values]
+        ret["values"] = _log_values_to_dicts(self.values)
         return ret
 
     @staticmethod
@@ -361,9 +458,21 @@ class ImageValue:
     data: Optional[str]
     name: Optional[str]
     description: Optional[str]
+    # Large images are kept out of the queue, in the blob area of operation storage, and only referenced here
+    blob: Optional[Blob] = None
+
+    def get_data(self, operation_storage: Optional[OperationStorage]) -> Optional[str]:
+        if self.blob is None:
+            return self.data
+        if operation_storage is None:
+            raise InternalClientError("Operation storage is required to read image stored as a blob")
+
+        return base64_encode(operation_storage.read_blob(self.blob))
 
     @staticmethod
     def serializer(obj: "ImageValue"):
+        if obj.blob is not None:
+            return dict(blob=obj.blob.to_dict(), name=obj.name, description=obj.description)
         return dict(data=obj.data, name=obj.name, description=obj.description)
 
     @staticmethod
@@ -373,6 +482,10 @@ class ImageValue:
         if isinstance(obj, str):
             return ImageValue(data=obj, name=None, description=None)
         if isinstance(obj, dict):
+            if "blob" in obj:
+                return ImageValue(
+                    data=None, name=obj["name"], description=obj["description"], blob=Blob.from_dict(obj["blob"])
+                )
             return ImageValue(data=obj["data"], name=obj["name"], description=obj["description"])
         else:
             raise InternalClientError("Run data on disk is malformed or was saved by newer version of Neptune Library")
@@ -388,9 +501,29 @@ class LogImages(LogOperation):
     def accept(self, visitor: "OperationVisitor[Ret]") -> Ret:
         return visitor.visit_log_images(self)
 
+    def get_blobs(self) -> List[Blob]:
+        return [value.value.blob for value in self.values if value.value.blob is not None]
+
+    def get_values_with_data(
+        self, operation_storage: Optional[OperationStorage]
+    ) -> List[Tuple["LogImages.ValueType", Optional[str]]]:
+        """Returns values with their image data, skipping images that couldn't be read from their blobs."""
+        values_with_data = []
+        for value in self.values:
+            try:
+                values_with_data.append((value, value.value.get_data(operation_storage)))
+            except (OSError, ValueError) as e:
+                logger.error(
+                    "Image data of '%s' at step %s couldn't be read, it will not be logged: %s",
+                    path_to_str(self.path),
+                    value.step,
+                    e,
+                )
+        return values_with_data
+
     def to_dict(self) -> dict:
         ret = super().to_dict()
-        ret["values"] = [value.to_dict(ImageValue.serializer) for value in self.values]
+        ret["values"] = _log_values_to_dicts(self.values, ImageValue.serializer)
         return ret
 
     @staticmethod
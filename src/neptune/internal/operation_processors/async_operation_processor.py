@@ -17,6 +17,8 @@ __all__ = ("AsyncOperationProcessor",)
 
 import os
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from queue import Queue
 from time import (
@@ -27,27 +29,41 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
     Dict,
     List,
     Optional,
     Tuple,
 )
 
+from neptune.attributes.series.float_series import FloatSeries
+from neptune.attributes.series.string_series import StringSeries
 from neptune.constants import ASYNC_DIRECTORY
 from neptune.core.components.abstract import WithResources
 from neptune.core.components.metadata_file import MetadataFile
 from neptune.core.components.operation_storage import OperationStorage
 from neptune.core.components.queue.disk_queue import DiskQueue
+from neptune.core.components.queue.group_commit import (
+    get_ack_interval,
+    get_durability,
+    get_group_commit_interval,
+)
 from neptune.core.operation_processors.operation_processor import OperationProcessor
 from neptune.envs import NEPTUNE_SYNC_AFTER_STOP_TIMEOUT
 from neptune.exceptions import NeptuneSynchronizationAlreadyStoppedException
 from neptune.internal.exceptions import NeptuneException
 from neptune.internal.init.parameters import DEFAULT_STOP_TIMEOUT
-from neptune.internal.operation import Operation
+from neptune.internal.operation import (
+    LogFloats,
+    LogStrings,
+    Operation,
+)
+from neptune.internal.operation_processors.operation_coalescer import LogOperationCoalescer
 from neptune.internal.operation_processors.operation_logger import ProcessorStopLogger
 from neptune.internal.operation_processors.utils import (
     common_metadata,
     get_container_full_path,
+    release_operation_blobs,
 )
 from neptune.internal.signals_processing.utils import (
     signal_batch_lag,
@@ -63,7 +79,10 @@ from neptune.internal.warnings import (
 )
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from neptune.core.components.abstract import Resource
+    from neptune.core.components.queue.disk_queue import QueueElement
     from neptune.internal.backends.neptune_backend import NeptuneBackend
     from neptune.internal.container_type import ContainerType
     from neptune.internal.id_formats import UniqueId
@@ -79,6 +98,7 @@ serializer: Callable[[Operation], Dict[str, Any]] = lambda op: op.to_dict()
 class AsyncOperationProcessor(WithResources, OperationProcessor):
     STOP_QUEUE_STATUS_UPDATE_FREQ_SECONDS = 30.0
     STOP_QUEUE_MAX_TIME_NO_CONNECTION_SECONDS = float(os.getenv(NEPTUNE_SYNC_AFTER_STOP_TIMEOUT, DEFAULT_STOP_TIMEOUT))
+    COALESCING_MAX_DELAY_SECONDS = 1.0
 
     def __init__(
         self,
@@ -91,6 +111,7 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
         batch_size: int = 1000,
         data_path: Optional[Path] = None,
         should_print_logs: bool = True,
+        prefetch_depth: int = 0,
     ):
         self._should_print_logs: bool = should_print_logs
 
@@ -111,6 +132,10 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
             to_dict=serializer,
             from_dict=Operation.from_dict,
             lock=lock,
+            group_commit_interval=get_group_commit_interval(),
+            durability=get_durability(),
+            ack_interval=get_ack_interval(),
+            on_ack_persisted=self._operation_storage.remove_released_blobs,
         )
 
         self._container_id: "UniqueId" = container_id
@@ -119,7 +144,7 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
         self._batch_size: int = batch_size
         self._last_version: int = 0
         self._consumed_version: int = 0
-        self._consumer: Daemon = self.ConsumerThread(self, sleep_time, batch_size)
+        self._consumer: Daemon = self.ConsumerThread(self, sleep_time, batch_size, prefetch_depth)
         self._lock: threading.RLock = lock
         self._signals_queue: "Queue[Signal]" = queue
         self._accepts_operations: bool = True
@@ -127,6 +152,12 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
         # Caller is responsible for taking this lock
         self._waiting_cond = threading.Condition(lock=lock)
 
+        # Consecutive series appends to the same attribute are merged before they are written to the queue
+        self._coalescer = LogOperationCoalescer(
+            max_batch_sizes={LogFloats: FloatSeries.max_batch_size, LogStrings: StringSeries.max_batch_size},
+            max_delay=self.COALESCING_MAX_DELAY_SECONDS,
+        )
+
     @property
     def operation_storage(self) -> "OperationStorage":
         return self._operation_storage
@@ -145,13 +176,38 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
             warn_once("Not accepting operations", exception=NeptuneWarning)
             return
 
-        self._last_version = self._queue.put(op)
+        for ready_op in self._coalescer.add(op):
+            self._last_version = self._queue.put(ready_op)
+
+        if self._check_queue_size():
+            self._consumer.wake_up()
+        if wait:
+            self.wait()
+
+    @ensure_disk_not_overutilize
+    def enqueue_operations(self, ops: List[Operation], *, wait: bool) -> None:
+        if not self._accepts_operations:
+            warn_once("Not accepting operations", exception=NeptuneWarning)
+            return
+
+        ready_ops = [ready_op for op in ops for ready_op in self._coalescer.add(op)]
+        if ready_ops:
+            self._last_version = self._queue.put_batch(ready_ops)
 
         if self._check_queue_size():
             self._consumer.wake_up()
         if wait:
             self.wait()
 
+    def _put_coalesced_operations(self) -> None:
+        with self._lock:
+            for op in self._coalescer.flush():
+                self._last_version = self._queue.put(op)
+
+    def flush(self) -> None:
+        self._put_coalesced_operations()
+        super().flush()
+
     def start(self) -> None:
         self._consumer.start()
 
@@ -164,7 +220,8 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
 
     def wait(self) -> None:
         self.flush()
-        waiting_for_version = self._last_version
+        # Operations dropped by the queue because they couldn't be serialized are never consumed
+        waiting_for_version = min(self._last_version, self._queue.last_put_version)
         self._consumer.wake_up()
 
         # Probably reentering lock just for sure
@@ -277,6 +334,7 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
             pass
 
     def close(self) -> None:
+        self._put_coalesced_operations()
         self._accepts_operations = False
         super().close()
 
@@ -286,12 +344,23 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
             processor: "AsyncOperationProcessor",
             sleep_time: float,
             batch_size: int,
+            prefetch_depth: int = 0,
         ):
             super().__init__(sleep_time=sleep_time, name="NeptuneAsyncOpProcessor")
             self._processor: "AsyncOperationProcessor" = processor
             self._batch_size: int = batch_size
             self._last_flush: float = 0.0
 
+            # With a positive prefetch depth, up to that many batches are read and decoded from the disk queue
+            # in the background while the current batch is being sent. Batches are still sent and acked in order.
+            self._prefetch_depth: int = prefetch_depth
+            self._prefetched: Deque["Future[List[QueueElement[Operation]]]"] = deque()
+            self._prefetch_executor: Optional[ThreadPoolExecutor] = (
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix="NeptuneAsyncOpPrefetch")
+                if prefetch_depth > 0
+                else None
+            )
+
         def run(self) -> None:
             try:
                 super().run()
@@ -299,15 +368,52 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
                 with self._processor._waiting_cond:
                     self._processor._waiting_cond.notify_all()
                 raise
+            finally:
+                self._stop_prefetching()
+
+        def _stop_prefetching(self) -> None:
+            if self._prefetch_executor is None:
+                return
+
+            # Read-ahead batches are dropped without being acked, so they are read again after a restart
+            while self._prefetched:
+                self._prefetched.popleft().cancel()
+            self._prefetch_executor.shutdown(wait=True)
+
+        def _get_batch(self) -> List["QueueElement[Operation]"]:
+            if self._prefetch_executor is None:
+                return self._processor._queue.get_batch(self._batch_size)
+
+            if not self._prefetched:
+                self._prefetch()
+
+            while self._prefetched:
+                batch = self._prefetched.popleft().result()
+                if batch:
+                    self._prefetch()
+                    return batch
+                # Reads scheduled after an empty one may already see new data, so they are not thrown away
+
+            return []
+
+        def _prefetch(self) -> None:
+            assert self._prefetch_executor is not None
+            while len(self._prefetched) < self._prefetch_depth:
+                self._prefetched.append(
+                    self._prefetch_executor.submit(self._processor._queue.get_batch, self._batch_size)
+                )
 
         def work(self) -> None:
+            if len(self._processor._coalescer) > 0:
+                self._processor._put_coalesced_operations()
+
             ts = time()
             if ts - self._last_flush >= self._sleep_time:
                 self._last_flush = ts
                 self._processor._queue.flush()
 
             while True:
-                batch = self._processor._queue.get_batch(self._batch_size)
+                batch = self._get_batch()
                 if not batch:
                     return
 
@@ -344,6 +450,9 @@ class AsyncOperationProcessor(WithResources, OperationProcessor):
                 )
 
                 signal_batch_processed(queue=self._processor._signals_queue)
+                release_operation_blobs(
+                    self._processor._operation_storage, batch[:processed_count], first_version=version_to_ack + 1
+                )
                 version_to_ack += processed_count
                 batch = batch[processed_count:]
 
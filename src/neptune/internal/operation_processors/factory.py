@@ -24,7 +24,12 @@ from typing import TYPE_CHECKING
 from neptune.core.operation_processors.offline_operation_processor import OfflineOperationProcessor
 from neptune.core.operation_processors.operation_processor import OperationProcessor
 from neptune.core.operation_processors.read_only_operation_processor import ReadOnlyOperationProcessor
-from neptune.envs import NEPTUNE_ASYNC_BATCH_SIZE
+from neptune.envs import (
+    NEPTUNE_ASYNC_BATCH_SIZE,
+    NEPTUNE_ASYNC_PREFETCH_DEPTH,
+    NEPTUNE_SYNC_MODE_BATCH_INTERVAL_MS,
+    NEPTUNE_SYNC_MODE_BATCH_SIZE,
+)
 from neptune.internal.backends.neptune_backend import NeptuneBackend
 from neptune.internal.container_type import ContainerType
 from neptune.internal.id_formats import UniqueId
@@ -53,6 +58,7 @@ def build_async_operation_processor(
         lock=lock,
         sleep_time=sleep_time,
         batch_size=int(os.environ.get(NEPTUNE_ASYNC_BATCH_SIZE) or "1000"),
+        prefetch_depth=int(os.environ.get(NEPTUNE_ASYNC_PREFETCH_DEPTH) or "0"),
         queue=queue,
     )
 
@@ -76,7 +82,13 @@ def get_operation_processor(
             queue=queue,
         )
     elif mode == Mode.SYNC:
-        return SyncOperationProcessor(container_id, container_type, backend)
+        return SyncOperationProcessor(
+            container_id,
+            container_type,
+            backend,
+            batch_size=int(os.environ.get(NEPTUNE_SYNC_MODE_BATCH_SIZE) or "1"),
+            batch_interval=float(os.environ.get(NEPTUNE_SYNC_MODE_BATCH_INTERVAL_MS) or "0") / 1000,
+        )
     elif mode == Mode.DEBUG:
         return SyncOperationProcessor(container_id, container_type, backend)
     elif mode == Mode.OFFLINE:
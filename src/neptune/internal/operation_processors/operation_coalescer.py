@@ -0,0 +1,115 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["LogOperationCoalescer"]
+
+from dataclasses import dataclass
+from time import monotonic
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from neptune.internal.operation import (
+    LogFloats,
+    LogSeriesValues,
+    LogStrings,
+    Operation,
+)
+
+CoalescedOperation = Union[LogFloats, LogStrings]
+
+
+@dataclass
+class _PendingOperation:
+    operation_cls: Type[CoalescedOperation]
+    path: List[str]
+    # Values are merged as plain lists, the operation is created only once it's released
+    values: LogSeriesValues
+    max_size: int
+
+    def to_operation(self) -> CoalescedOperation:
+        return self.operation_cls(self.path, self.values)
+
+
+class LogOperationCoalescer:
+    """Merges consecutive `LogFloats` and `LogStrings` operations logged to the same attribute.
+
+    Operations returned by `add` and `flush` are ready to be put into the queue. Operations logged to a single
+    path keep their relative order, as a pending log operation is always released before any other operation
+    on its path.
+    """
+
+    def __init__(self, max_batch_sizes: Dict[Type[Operation], int], max_delay: float) -> None:
+        self._max_batch_sizes: Dict[Type[Operation], int] = max_batch_sizes
+        self._max_delay: float = max_delay
+        self._pending: Dict[Tuple[str, ...], _PendingOperation] = dict()
+        self._oldest_pending_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, op: Operation) -> List[Operation]:
+        path = tuple(op.path)
+        pending = self._pending.get(path)
+
+        if not isinstance(op, (LogFloats, LogStrings)) or type(op) not in self._max_batch_sizes:
+            # All operations pending on the path need to be released before any other operation on it
+            if pending is None:
+                return [op]
+            del self._pending[path]
+            return [pending.to_operation(), op]
+
+        ready: List[Operation] = []
+        if pending is not None:
+            if pending.operation_cls is type(op) and len(pending.values) + len(op.values) <= pending.max_size:
+                pending.values.extend(op.values)
+                if len(pending.values) >= pending.max_size:
+                    del self._pending[path]
+                    ready.append(pending.to_operation())
+                return ready + self._flush_if_delayed()
+
+            del self._pending[path]
+            ready.append(pending.to_operation())
+
+        max_size = self._max_batch_sizes[type(op)]
+        if len(op.values) >= max_size:
+            ready.append(op)
+        else:
+            # Merging is done on a copy, so operations created by the caller are never modified
+            self._pending[path] = _PendingOperation(
+                operation_cls=type(op), path=op.path, values=LogSeriesValues.copy_of(op.values), max_size=max_size
+            )
+            if self._oldest_pending_at is None:
+                self._oldest_pending_at = monotonic()
+
+        return ready + self._flush_if_delayed()
+
+    def flush(self) -> List[Operation]:
+        ready: List[Operation] = [pending.to_operation() for pending in self._pending.values()]
+        self._pending.clear()
+        self._oldest_pending_at = None
+        return ready
+
+    def _flush_if_delayed(self) -> List[Operation]:
+        if not self._pending:
+            self._oldest_pending_at = None
+        elif self._oldest_pending_at is not None and monotonic() - self._oldest_pending_at >= self._max_delay:
+            return self.flush()
+        return []
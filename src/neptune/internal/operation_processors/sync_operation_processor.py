@@ -15,9 +15,12 @@
 #
 __all__ = ("SyncOperationProcessor",)
 
+import threading
 from pathlib import Path
+from time import monotonic
 from typing import (
     TYPE_CHECKING,
+    List,
     Optional,
     Tuple,
 )
@@ -31,7 +34,12 @@ from neptune.internal.operation_processors.utils import (
     common_metadata,
     get_container_full_path,
 )
+from neptune.internal.threading.periodic_scheduler import (
+    PeriodicTask,
+    get_shared_scheduler,
+)
 from neptune.internal.utils.disk_utilization import ensure_disk_not_overutilize
+from neptune.internal.utils.logger import get_logger
 
 if TYPE_CHECKING:
     from neptune.core.components.abstract import Resource
@@ -40,12 +48,35 @@ if TYPE_CHECKING:
     from neptune.internal.id_formats import UniqueId
     from neptune.internal.operation import Operation
 
+logger = get_logger()
+
 
 class SyncOperationProcessor(WithResources, OperationProcessor):
-    def __init__(self, container_id: "UniqueId", container_type: "ContainerType", backend: "NeptuneBackend"):
+    """Sends operations to the backend in the calling thread.
+
+    With `batch_size` greater than 1, operations are buffered and sent as a single request once the batch is full,
+    `batch_interval` seconds have passed since the first buffered operation, or on `wait`, `flush` and `stop`.
+    Errors of buffered operations are raised by the call sending them. Batches expiring between calls are sent
+    from the shared scheduler once the processor is started, and their errors are logged.
+    """
+
+    def __init__(
+        self,
+        container_id: "UniqueId",
+        container_type: "ContainerType",
+        backend: "NeptuneBackend",
+        batch_size: int = 1,
+        batch_interval: float = 0,
+    ):
         self._container_id: "UniqueId" = container_id
         self._container_type: "ContainerType" = container_type
         self._backend: "NeptuneBackend" = backend
+        self._batch_size: int = batch_size
+        self._batch_interval: float = batch_interval
+        self._pending: List["Operation"] = []
+        self._pending_since: float = 0
+        self._pending_lock = threading.RLock()
+        self._flush_task: Optional[PeriodicTask] = None
 
         self._data_path = get_container_full_path(SYNC_DIRECTORY, container_id, container_type)
 
@@ -72,20 +103,92 @@ class SyncOperationProcessor(WithResources, OperationProcessor):
 
     @ensure_disk_not_overutilize
     def enqueue_operation(self, op: "Operation", *, wait: bool) -> None:
+        self._enqueue_operations([op], wait=wait)
+
+    @ensure_disk_not_overutilize
+    def enqueue_operations(self, ops: List["Operation"], *, wait: bool) -> None:
+        self._enqueue_operations(ops, wait=wait)
+
+    def _enqueue_operations(self, ops: List["Operation"], *, wait: bool) -> None:
+        if self._batch_size <= 1:
+            self._execute_operations(ops)
+            return
+
+        with self._pending_lock:
+            if not self._pending:
+                self._pending_since = monotonic()
+            self._pending.extend(ops)
+
+            batch_expired = self._batch_interval > 0 and monotonic() - self._pending_since >= self._batch_interval
+            if wait or batch_expired or len(self._pending) >= self._batch_size:
+                self._send_pending()
+
+    def _send_pending(self) -> None:
+        with self._pending_lock:
+            ops, self._pending = self._pending, []
+            self._execute_operations(ops)
+
+    def _send_expired_batch(self) -> Optional[float]:
+        with self._pending_lock:
+            if not self._pending:
+                return None
+
+            time_left = self._pending_since + self._batch_interval - monotonic()
+            if time_left > 0:
+                return time_left
+
+            try:
+                self._send_pending()
+            except Exception as e:
+                logger.error("Error occurred during synchronous operation processing: %s", e)
+            return None
+
+    def start(self) -> None:
+        if self._batch_size > 1 and self._batch_interval > 0 and self._flush_task is None:
+            self._flush_task = get_shared_scheduler().schedule(
+                self._send_expired_batch, period=self._batch_interval, name="NeptuneSyncBatchFlush"
+            )
+
+    def _stop_flush_task(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task.join()
+            self._flush_task = None
+
+    def _execute_operations(self, ops: List["Operation"]) -> None:
+        if not ops:
+            return
+
         _, errors = self._backend.execute_operations(
             container_id=self._container_id,
             container_type=self._container_type,
-            operations=[op],
+            operations=ops,
             operation_storage=self._operation_storage,
         )
+        # Operations aren't kept anywhere else, so they are never read again once sent
+        for op in ops:
+            for blob in op.get_blobs():
+                self._operation_storage.remove_blob(blob)
         if errors:
             raise errors[0]
 
+    def wait(self) -> None:
+        self._send_pending()
+
+    def flush(self) -> None:
+        self._send_pending()
+        super().flush()
+
     def stop(self, seconds: Optional[float] = None) -> None:
+        self._stop_flush_task()
         self.flush()
         self.close()
         self.cleanup()
 
+    def close(self) -> None:
+        self._stop_flush_task()
+        super().close()
+
     def cleanup(self) -> None:
         super().cleanup()
         try:
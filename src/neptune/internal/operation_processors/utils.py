@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-__all__ = ["common_metadata", "get_container_full_path", "get_container_dir"]
+__all__ = ["common_metadata", "get_container_full_path", "get_container_dir", "release_operation_blobs"]
 
 import os
 import platform
@@ -29,14 +29,17 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Sequence,
 )
 
 from neptune.constants import NEPTUNE_DATA_DIRECTORY
 from neptune.objects.structure_version import StructureVersion
 
 if TYPE_CHECKING:
+    from neptune.core.components.operation_storage import OperationStorage
     from neptune.internal.container_type import ContainerType
     from neptune.internal.id_formats import UniqueId
+    from neptune.internal.operation import Operation
 
 
 RANDOM_KEY_LENGTH = 8
@@ -73,3 +76,11 @@ def get_container_full_path(type_dir: str, container_id: "UniqueId", container_t
 def random_key(length: int) -> str:
     characters = string.ascii_lowercase + string.digits
     return "".join(random.choice(characters) for _ in range(length))
+
+
+def release_operation_blobs(
+    operation_storage: "OperationStorage", operations: Sequence["Operation"], first_version: int
+) -> None:
+    """Schedules removal of blobs of processed operations, read from the queue starting at `first_version`."""
+    for version, operation in enumerate(operations, start=first_version):
+        operation_storage.release_blobs(version, operation.get_blobs())
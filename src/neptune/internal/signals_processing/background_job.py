@@ -24,6 +24,10 @@ from typing import (
 
 from neptune.internal.background_job import BackgroundJob
 from neptune.internal.signals_processing.signals_processor import SignalsProcessor
+from neptune.internal.threading.periodic_scheduler import (
+    PeriodicTask,
+    get_shared_scheduler,
+)
 
 if TYPE_CHECKING:
     from neptune.internal.signals_processing.signals import Signal
@@ -42,7 +46,7 @@ class CallbacksMonitor(BackgroundJob):
     ) -> None:
         self._period: float = period
         self._queue: "Queue[Signal]" = queue
-        self._thread: Optional["SignalsProcessor"] = None
+        self._task: Optional[PeriodicTask] = None
         self._started: bool = False
         self._async_lag_threshold: float = async_lag_threshold
         self._async_no_progress_threshold: float = async_no_progress_threshold
@@ -50,7 +54,7 @@ class CallbacksMonitor(BackgroundJob):
         self._async_no_progress_callback: Optional[Callable[["NeptuneObject"], None]] = async_no_progress_callback
 
     def start(self, container: "NeptuneObject") -> None:
-        self._thread = SignalsProcessor(
+        processor = SignalsProcessor(
             period=self._period,
             container=container,
             queue=self._queue,
@@ -59,21 +63,22 @@ class CallbacksMonitor(BackgroundJob):
             async_lag_callback=self._async_lag_callback,
             async_no_progress_callback=self._async_no_progress_callback,
         )
-        self._thread.start()
+        # Signals are processed from the scheduler shared by all objects of the process, instead of a thread per object
+        self._task = get_shared_scheduler().schedule(processor.work, period=self._period, name="CallbacksMonitor")
         self._started = True
 
     def stop(self) -> None:
-        if self._thread and self._started:
-            self._thread.interrupt()
+        if self._task and self._started:
+            self._task.cancel()
 
     def join(self, seconds: Optional[float] = None) -> None:
-        if self._thread and self._started:
-            self._thread.join(seconds)
+        if self._task and self._started:
+            self._task.join(seconds)
 
     def pause(self) -> None:
-        if self._thread:
-            self._thread.pause()
+        if self._task:
+            self._task.pause()
 
     def resume(self) -> None:
-        if self._thread:
-            self._thread.resume()
+        if self._task:
+            self._task.resume()
@@ -22,12 +22,16 @@ __all__ = [
     "FileChunk",
     "FileChunker",
     "compress_to_tar_gz_in_memory",
+    "get_compression_level",
+    "TarGzStream",
 ]
 
 from neptune.internal.storage.datastream import (
     FileChunk,
     FileChunker,
+    TarGzStream,
     compress_to_tar_gz_in_memory,
+    get_compression_level,
 )
 from neptune.internal.storage.storage_utils import (
     AttributeUploadConfiguration,
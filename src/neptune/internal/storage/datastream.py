@@ -18,12 +18,22 @@ import io
 import math
 import os
 import tarfile
+import threading
+import zlib
+from queue import (
+    Full,
+    Queue,
+)
 from typing import (
     Any,
+    Callable,
     Generator,
+    Iterator,
     Optional,
+    Union,
 )
 
+from neptune.envs import NEPTUNE_UPLOAD_COMPRESSION_LEVEL
 from neptune.internal.backends.api_model import MultipartConfig
 from neptune.internal.exceptions import (
     InternalClientError,
@@ -78,13 +88,117 @@ class FileChunker:
                 last_offset = new_offset
 
 
-def compress_to_tar_gz_in_memory(upload_entries) -> bytes:
+DEFAULT_COMPRESSION_LEVEL = 9
+DEFAULT_STREAM_CHUNK_SIZE = 2**20
+DEFAULT_STREAM_MAX_PENDING_CHUNKS = 4
+
+
+def get_compression_level() -> int:
+    return int(os.getenv(NEPTUNE_UPLOAD_COMPRESSION_LEVEL) or DEFAULT_COMPRESSION_LEVEL)
+
+
+def compress_to_tar_gz_in_memory(upload_entries, compression_level: int = DEFAULT_COMPRESSION_LEVEL) -> bytes:
     f = io.BytesIO(b"")
 
-    with tarfile.TarFile.open(fileobj=f, mode="w|gz", dereference=True) as archive:
+    _write_tar_gz(upload_entries, _GzipWriter(sink=f.write, compression_level=compression_level))
+
+    return f.getvalue()
+
+
+class TarGzStream:
+    """Tar.gz archive of upload entries produced in chunks of bounded size.
+
+    The archive is written by a background thread which is blocked while `max_pending_chunks` chunks wait
+    to be consumed, so memory usage does not depend on the size of archived files. Every iteration
+    produces the archive from scratch, so the stream can be used as a request body that may be retried.
+    """
+
+    def __init__(
+        self,
+        upload_entries,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        max_pending_chunks: int = DEFAULT_STREAM_MAX_PENDING_CHUNKS,
+    ):
+        self._upload_entries = list(upload_entries)
+        self._compression_level = compression_level
+        self._chunk_size = chunk_size
+        self._max_pending_chunks = max_pending_chunks
+
+    def __iter__(self) -> Iterator[bytes]:
+        chunks: "Queue[Union[bytes, BaseException, None]]" = Queue(maxsize=self._max_pending_chunks)
+        cancelled = threading.Event()
+        producer = threading.Thread(
+            target=self._produce, args=(chunks, cancelled), name="NeptuneTarGzStream", daemon=True
+        )
+        producer.start()
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    return
+                if isinstance(chunk, BaseException):
+                    raise chunk
+                yield chunk
+        finally:
+            cancelled.set()
+            producer.join()
+
+    def _produce(self, chunks: "Queue[Union[bytes, BaseException, None]]", cancelled: threading.Event) -> None:
+        def put(item: Union[bytes, BaseException, None]) -> None:
+            while not cancelled.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return
+                except Full:
+                    pass
+            raise _StreamCancelled()
+
+        buffer = bytearray()
+
+        def sink(data: bytes) -> None:
+            buffer.extend(data)
+            while len(buffer) >= self._chunk_size:
+                put(bytes(buffer[: self._chunk_size]))
+                del buffer[: self._chunk_size]
+
+        try:
+            try:
+                _write_tar_gz(self._upload_entries, _GzipWriter(sink=sink, compression_level=self._compression_level))
+            except _StreamCancelled:
+                return
+            except BaseException as e:
+                put(e)
+                return
+            if buffer:
+                put(bytes(buffer))
+            put(None)
+        except _StreamCancelled:
+            pass
+
+
+class _StreamCancelled(Exception):
+    pass
+
+
+class _GzipWriter:
+    def __init__(self, sink: Callable[[bytes], Any], compression_level: int):
+        self._sink = sink
+        # wbits above 16 make zlib produce the gzip container
+        self._compressor = zlib.compressobj(compression_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def write(self, data: bytes) -> int:
+        compressed = self._compressor.compress(data)
+        if compressed:
+            self._sink(compressed)
+        return len(data)
+
+    def close(self) -> None:
+        self._sink(self._compressor.flush())
+
+
+def _write_tar_gz(upload_entries, writer: _GzipWriter) -> None:
+    with tarfile.TarFile.open(fileobj=writer, mode="w|", dereference=True) as archive:
         for entry in upload_entries:
             archive.add(name=entry.source, arcname=entry.target_path, recursive=True)
-
-    f.seek(0)
-    data = f.read()
-    return data
+    writer.close()
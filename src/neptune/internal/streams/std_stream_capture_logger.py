@@ -15,28 +15,157 @@
 #
 __all__ = ["StdoutCaptureLogger", "StderrCaptureLogger"]
 
+import os
 import sys
 import threading
-from queue import Queue
-from typing import TextIO
-
+import time
+from queue import (
+    Empty,
+    Queue,
+)
+from typing import (
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+from neptune.envs import (
+    NEPTUNE_STD_CAPTURE_FLUSH_INTERVAL_MS,
+    NEPTUNE_STD_CAPTURE_MAX_BYTES_PER_SECOND,
+)
 from neptune.internal.threading.daemon import Daemon
 from neptune.objects import NeptuneObject
+from neptune.types.series.string_series import MAX_STRING_SERIES_VALUE_LENGTH
+
+# Line buffering and throttling are opt-in, by default every captured write is reported as it is
+DEFAULT_FLUSH_INTERVAL_MS = 0
+DEFAULT_MAX_BYTES_PER_SECOND = 0
+
+
+def _collapse_carriage_returns(text: str) -> str:
+    # progress bars redraw the current line with "\r", only its last rendering is worth keeping;
+    # trailing "\r" characters ("\r\n" line endings, a bar about to be redrawn) do not start a new rendering
+    return text[text.rstrip("\r").rfind("\r") + 1 :]
+
+
+class CapturedLinesBuffer:
+    def __init__(self, max_line_length: int = MAX_STRING_SERIES_VALUE_LENGTH):
+        self._max_line_length = max_line_length
+        self._partial_line = ""
+        self._partial_line_timestamp = 0.0
+        self._lines: List[str] = []
+        self._timestamps: List[float] = []
+
+    def feed(self, data: str, timestamp: float) -> None:
+        *lines, partial_line = (self._partial_line + data).split("\n")
+        for line in lines:
+            self._lines.append(_collapse_carriage_returns(line).rstrip("\r"))
+            self._timestamps.append(timestamp)
+
+        partial_line = _collapse_carriage_returns(partial_line)
+        while len(partial_line) > self._max_line_length:
+            self._lines.append(partial_line[: self._max_line_length])
+            self._timestamps.append(timestamp)
+            partial_line = partial_line[self._max_line_length :]
+        self._partial_line = partial_line
+        self._partial_line_timestamp = timestamp
+
+    def has_lines(self) -> bool:
+        return bool(self._lines)
+
+    def is_empty(self) -> bool:
+        return not self._lines and not self._partial_line.rstrip("\r")
+
+    def drain(self, include_partial_line: bool = False) -> Tuple[List[str], List[float]]:
+        if include_partial_line and self._partial_line.rstrip("\r"):
+            self._lines.append(self._partial_line.rstrip("\r"))
+            self._timestamps.append(self._partial_line_timestamp)
+            self._partial_line = ""
+
+        lines, timestamps = self._lines, self._timestamps
+        self._lines, self._timestamps = [], []
+        return lines, timestamps
 
 
 class StdStreamCaptureLogger:
-    def __init__(self, container: NeptuneObject, attribute_name: str, stream: TextIO):
+    def __init__(
+        self,
+        container: NeptuneObject,
+        attribute_name: str,
+        stream: TextIO,
+        flush_interval: Optional[float] = None,
+        max_bytes_per_second: Optional[int] = None,
+    ):
         self._container = container
         self._attribute_name = attribute_name
         self.stream = stream
         self._thread_local = threading.local()
         self.enabled = True
-        self._log_data_queue = Queue()
+        self._flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else float(os.getenv(NEPTUNE_STD_CAPTURE_FLUSH_INTERVAL_MS) or DEFAULT_FLUSH_INTERVAL_MS) / 1000
+        )
+        self._max_bytes_per_second = (
+            max_bytes_per_second
+            if max_bytes_per_second is not None
+            else int(os.getenv(NEPTUNE_STD_CAPTURE_MAX_BYTES_PER_SECOND) or DEFAULT_MAX_BYTES_PER_SECOND)
+        )
+        self._bytes_allowance = float(self._max_bytes_per_second)
+        self._last_allowance_refill = time.monotonic()
+        self._flush_deadline: Optional[float] = None
+        self._buffer = CapturedLinesBuffer()
+        self._log_data_queue: "Queue[Optional[Tuple[str, float]]]" = Queue()
         self._logging_thread = self.ReportingThread(self, "NeptuneThread_" + attribute_name)
         self._logging_thread.start()
 
-    def log_data(self, data):
-        self._container[self._attribute_name].append(data)
+    def log_data(self, data: str, timestamp: float) -> None:
+        # throttling applies to buffered lines, it is only enabled together with buffering
+        if self._flush_interval <= 0:
+            self._container[self._attribute_name].append(data)
+            return
+
+        self._buffer.feed(data, timestamp)
+        if self._buffer.is_empty():
+            return
+
+        now = time.monotonic()
+        if self._flush_deadline is None:
+            self._flush_deadline = now + self._flush_interval
+        if now >= self._flush_deadline:
+            self.flush()
+
+    def flush(self) -> None:
+        self._flush_deadline = None
+        lines, timestamps = self._buffer.drain(include_partial_line=True)
+        if self._max_bytes_per_second > 0:
+            lines, timestamps = self._throttle(lines, timestamps)
+        if lines:
+            self._container[self._attribute_name].extend(lines, timestamps=timestamps)
+
+    def _throttle(self, lines: List[str], timestamps: List[float]) -> Tuple[List[str], List[float]]:
+        now = time.monotonic()
+        self._bytes_allowance = min(
+            float(self._max_bytes_per_second),
+            self._bytes_allowance + (now - self._last_allowance_refill) * self._max_bytes_per_second,
+        )
+        self._last_allowance_refill = now
+
+        for kept, line in enumerate(lines):
+            line_size = len(line.encode("utf-8", errors="replace"))
+            if line_size > self._bytes_allowance:
+                break
+            self._bytes_allowance -= line_size
+        else:
+            return lines, timestamps
+
+        dropped = len(lines) - kept
+        summary = (
+            f"[{dropped} line{'s' if dropped > 1 else ''} of output not captured:"
+            f" exceeded the limit of {self._max_bytes_per_second} bytes per second]"
+        )
+        return lines[:kept] + [summary], timestamps[:kept] + [timestamps[-1]]
 
     def pause(self):
         self._log_data_queue.put_nowait(None)
@@ -47,7 +176,7 @@ class StdStreamCaptureLogger:
 
     def write(self, data: str):
         self.stream.write(data)
-        self._log_data_queue.put_nowait(data)
+        self._log_data_queue.put_nowait((data, time.time()))
 
     def __getattr__(self, attr):
         return getattr(self.stream, attr)
@@ -67,10 +196,18 @@ class StdStreamCaptureLogger:
         @Daemon.ConnectionRetryWrapper(kill_message="Killing Neptune STD capturing thread.")
         def work(self) -> None:
             while True:
-                data = self._logger._log_data_queue.get()
-                if data is None:
+                deadline = self._logger._flush_deadline
+                try:
+                    item = self._logger._log_data_queue.get(
+                        timeout=None if deadline is None else max(deadline - time.monotonic(), 0.0)
+                    )
+                except Empty:
+                    self._logger.flush()
+                    continue
+                if item is None:
+                    self._logger.flush()
                     break
-                self._logger.log_data(data)
+                self._logger.log_data(*item)
 
 
 class StdoutCaptureLogger(StdStreamCaptureLogger):
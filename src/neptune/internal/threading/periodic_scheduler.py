@@ -0,0 +1,197 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+__all__ = ["PeriodicTask", "PeriodicScheduler", "get_shared_scheduler"]
+
+import heapq
+import itertools
+import os
+import threading
+from time import monotonic
+from typing import (
+    Callable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from neptune.envs import NEPTUNE_HEARTBEAT_WORKERS
+from neptune.internal.utils.logger import get_logger
+
+logger = get_logger()
+
+DEFAULT_HEARTBEAT_WORKERS = 2
+
+
+class PeriodicTask:
+    """Handle of a job run periodically by `PeriodicScheduler`.
+
+    `work` returns the number of seconds until its next run, or `None` to wait for the regular `period`.
+    """
+
+    def __init__(
+        self, scheduler: "PeriodicScheduler", work: Callable[[], Optional[float]], period: float, name: str
+    ) -> None:
+        self._scheduler: "PeriodicScheduler" = scheduler
+        self.work: Callable[[], Optional[float]] = work
+        self.period: float = period
+        self.name: str = name
+        self.paused: bool = False
+        self.cancelled: bool = False
+        # Whether the task waits for `resume`, instead of being in the scheduler's queue
+        self.parked: bool = False
+        self.running_in: Optional[int] = None
+
+    def pause(self) -> None:
+        self._scheduler.pause(self)
+
+    def resume(self) -> None:
+        self._scheduler.resume(self)
+
+    def cancel(self) -> None:
+        self._scheduler.cancel(self)
+
+    def join(self, seconds: Optional[float] = None) -> None:
+        self._scheduler.join(self, seconds)
+
+
+class PeriodicScheduler:
+    """Runs periodic jobs of any number of objects on a fixed number of worker threads.
+
+    Worker threads are started lazily, with the first scheduled tasks, and are kept for the lifetime of the process.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_HEARTBEAT_WORKERS) -> None:
+        self._max_workers: int = max(max_workers, 1)
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[float, int, PeriodicTask]] = []
+        self._counter = itertools.count()
+        self._workers: List[threading.Thread] = []
+
+    def schedule(self, work: Callable[[], Optional[float]], period: float, name: str) -> PeriodicTask:
+        """Runs `work` right away, and then every `period` seconds until the returned task is cancelled."""
+        task = PeriodicTask(self, work=work, period=period, name=name)
+        with self._cond:
+            self._push(task, delay=0)
+            if len(self._workers) < self._max_workers:
+                worker = threading.Thread(
+                    target=self._run_worker, name=f"NeptuneScheduler-{len(self._workers)}", daemon=True
+                )
+                self._workers.append(worker)
+                worker.start()
+        return task
+
+    def pause(self, task: PeriodicTask) -> None:
+        with self._cond:
+            task.paused = True
+            self._wait_until_idle(task, timeout=None)
+
+    def resume(self, task: PeriodicTask) -> None:
+        with self._cond:
+            task.paused = False
+            if task.parked and not task.cancelled:
+                task.parked = False
+                self._push(task, delay=0)
+
+    def cancel(self, task: PeriodicTask) -> None:
+        with self._cond:
+            task.cancelled = True
+            self._cond.notify_all()
+
+    def join(self, task: PeriodicTask, seconds: Optional[float] = None) -> None:
+        with self._cond:
+            self._wait_until_idle(task, timeout=seconds)
+
+    def _wait_until_idle(self, task: PeriodicTask, timeout: Optional[float]) -> None:
+        # A task pausing or joining itself would wait forever
+        if task.running_in == threading.get_ident():
+            return
+        self._cond.wait_for(lambda: task.running_in is None, timeout=timeout)
+
+    def _push(self, task: PeriodicTask, delay: float) -> None:
+        heapq.heappush(self._queue, (monotonic() + delay, next(self._counter), task))
+        self._cond.notify_all()
+
+    def _next_task(self) -> PeriodicTask:
+        with self._cond:
+            while True:
+                if not self._queue:
+                    self._cond.wait()
+                    continue
+
+                run_at, _, task = self._queue[0]
+                if not task.cancelled and not task.paused:
+                    delay = run_at - monotonic()
+                    if delay > 0:
+                        self._cond.wait(timeout=delay)
+                        continue
+
+                heapq.heappop(self._queue)
+                if task.cancelled:
+                    continue
+                if task.paused:
+                    task.parked = True
+                    continue
+
+                task.running_in = threading.get_ident()
+                return task
+
+    def _run_worker(self) -> None:
+        while True:
+            task = self._next_task()
+            delay: Optional[float] = None
+            try:
+                delay = task.work()
+            except Exception:
+                logger.error("Unexpected error occurred in Neptune background task %s", task.name, exc_info=True)
+                task.cancelled = True
+
+            with self._cond:
+                task.running_in = None
+                if task.cancelled:
+                    pass
+                elif task.paused:
+                    task.parked = True
+                else:
+                    self._push(task, delay=task.period if delay is None else delay)
+                self._cond.notify_all()
+
+
+_shared_scheduler: Optional[PeriodicScheduler] = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_shared_scheduler() -> PeriodicScheduler:
+    """Returns the scheduler shared by all objects of the process, so the number of threads doesn't grow with them."""
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = PeriodicScheduler(
+                max_workers=int(os.getenv(NEPTUNE_HEARTBEAT_WORKERS) or DEFAULT_HEARTBEAT_WORKERS)
+            )
+        return _shared_scheduler
+
+
+def _reset_shared_scheduler() -> None:
+    # Worker threads don't survive a fork, so the child process starts with a new scheduler
+    global _shared_scheduler, _shared_scheduler_lock
+    _shared_scheduler = None
+    _shared_scheduler_lock = threading.Lock()
+
+
+try:
+    os.register_at_fork(after_in_child=_reset_shared_scheduler)
+except AttributeError:
+    pass
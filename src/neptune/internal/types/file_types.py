@@ -17,6 +17,7 @@ __all__ = [
     "FileComposite",
     "LocalFileComposite",
     "InMemoryComposite",
+    "DeferredInMemoryComposite",
     "FileComposite",
     "StreamComposite",
 ]
@@ -25,9 +26,11 @@ import abc
 import enum
 import io
 import os
+import threading
 from functools import wraps
 from io import IOBase
 from typing import (
+    Callable,
     Optional,
     Union,
 )
@@ -110,12 +113,29 @@ class InMemoryComposite(FileComposite):
 
     def save(self, path):
         with open(path, "wb") as f:
-            f.write(self._content)
+            f.write(self.content)
 
     def __str__(self):
         return "File(content=...)"
 
 
+class DeferredInMemoryComposite(InMemoryComposite):
+    """In-memory file with content produced on first access, e.g. by encoding a snapshot of an image."""
+
+    def __init__(self, produce: Callable[[], bytes], extension: str):
+        super().__init__(b"", extension)
+        self._produce: Optional[Callable[[], bytes]] = produce
+        self._produce_lock = threading.Lock()
+
+    @property
+    def content(self):
+        with self._produce_lock:
+            if self._produce is not None:
+                self._content = self._produce()
+                self._produce = None
+        return self._content
+
+
 def read_once(f):
     """Decorator for validating read once on STREAM objects"""
 
@@ -29,6 +29,7 @@ __all__ = [
     "verify_collection_type",
     "verify_optional_callable",
     "is_collection",
+    "is_numeric_array",
     "base64_encode",
     "base64_decode",
     "get_absolute_paths",
@@ -66,16 +67,17 @@ def replace_patch_version(version: str):
 
 
 def verify_type(var_name: str, var, expected_type: Union[type, tuple]):
-    try:
-        if isinstance(expected_type, tuple):
-            type_name = " or ".join(get_type_name(t) for t in expected_type)
-        else:
-            type_name = get_type_name(expected_type)
-    except Exception as e:
-        # Just to be sure that nothing weird will be raised here
-        raise TypeError("Incorrect type of {}".format(var_name)) from e
-
     if not isinstance(var, expected_type):
+        # The message is only built on failure, as this check runs on every logging call
+        try:
+            if isinstance(expected_type, tuple):
+                type_name = " or ".join(get_type_name(t) for t in expected_type)
+            else:
+                type_name = get_type_name(expected_type)
+        except Exception as e:
+            # Just to be sure that nothing weird will be raised here
+            raise TypeError("Incorrect type of {}".format(var_name)) from e
+
         raise TypeError("{} must be a {} (was {})".format(var_name, type_name, type(var)))
 
     if isinstance(var, IOBase) and not hasattr(var, "read"):
@@ -137,6 +139,8 @@ def get_type_name(_type: Union[type, tuple]):
 
 def verify_collection_type(var_name: str, var, expected_type: Union[type, tuple]):
     verify_type(var_name, var, (list, set, tuple))
+    if all(isinstance(value, expected_type) for value in var):
+        return
     for value in var:
         verify_type("elements of collection '{}'".format(var_name), value, expected_type)
 
@@ -150,6 +154,15 @@ def is_collection(var) -> bool:
     return isinstance(var, (list, set, tuple))
 
 
+def is_numeric_array(var) -> bool:
+    """One-dimensional array of numbers backed by NumPy, e.g. `numpy.ndarray` or `pandas.Series`."""
+    return (
+        hasattr(var, "__array__")
+        and getattr(var, "ndim", None) == 1
+        and getattr(getattr(var, "dtype", None), "kind", None) in ("b", "i", "u", "f")
+    )
+
+
 def base64_encode(data: bytes) -> str:
     return base64.b64encode(data).decode("utf-8")
 
@@ -22,6 +22,7 @@ from abc import (
     abstractmethod,
 )
 from functools import wraps
+from time import monotonic
 from typing import (
     Any,
     Callable,
@@ -42,6 +43,11 @@ from neptune.internal.warnings import (
     warn_once,
 )
 
+# Seconds after which the cached disk utilization is sampled again
+DISK_UTILIZATION_SAMPLING_INTERVAL = 1.0
+# Percentage points below the limit from which the disk utilization is sampled on every check
+DISK_UTILIZATION_NEAR_LIMIT_MARGIN = 1.0
+
 
 def get_neptune_data_directory() -> str:
     return os.getenv("NEPTUNE_DATA_DIRECTORY", NEPTUNE_DATA_DIRECTORY)
@@ -78,6 +84,37 @@ def get_max_disk_utilization_from_env() -> Optional[float]:
         return None
 
 
+class DiskUtilizationMonitor:
+    """Caches the disk utilization, so it isn't checked with a system call for every operation.
+
+    The utilization is sampled again once the cached value is older than `sampling_interval` seconds,
+    and on every check when it's unknown or within `near_limit_margin` percentage points of the limit.
+    """
+
+    def __init__(
+        self,
+        max_disk_utilization: float,
+        sampling_interval: float = DISK_UTILIZATION_SAMPLING_INTERVAL,
+        near_limit_margin: float = DISK_UTILIZATION_NEAR_LIMIT_MARGIN,
+    ) -> None:
+        self._sampling_threshold: float = max_disk_utilization - near_limit_margin
+        self._sampling_interval: float = sampling_interval
+        self._utilization: Optional[float] = None
+        self._sampled_at: float = 0.0
+
+    def get(self) -> Optional[float]:
+        now = monotonic()
+        utilization = self._utilization
+        if (
+            utilization is None
+            or utilization >= self._sampling_threshold
+            or now - self._sampled_at >= self._sampling_interval
+        ):
+            utilization = get_disk_utilization_percent()
+            self._utilization, self._sampled_at = utilization, now
+        return utilization
+
+
 class DiskUtilizationErrorHandlerTemplate(ABC):
     def __init__(self, max_disk_utilization: Optional[float], func: Callable[..., None], *args: Any, **kwargs: Any):
         self.max_disk_utilization = max_disk_utilization
@@ -97,11 +134,11 @@ class DiskUtilizationErrorHandlerTemplate(ABC):
     @abstractmethod
     def handle_limit_exceeded(self, current_utilization: float) -> None: ...  # pragma: no cover
 
-    def run(self) -> None:
+    def run(self, monitor: Optional[DiskUtilizationMonitor] = None) -> None:
         if not self.max_disk_utilization:
             return self.handle_limit_not_set()
 
-        current_utilization = get_disk_utilization_percent()
+        current_utilization = monitor.get() if monitor is not None else get_disk_utilization_percent()
 
         if current_utilization is None:
             return self.handle_utilization_calculation_error()
@@ -165,9 +202,10 @@ def ensure_disk_not_overutilize(func: Callable[..., None]) -> Callable[..., None
     max_disk_utilization = get_max_disk_utilization_from_env()
 
     error_handler = RaisingErrorHandler if raising_on_disk_issue else NonRaisingErrorHandler
+    monitor = DiskUtilizationMonitor(max_disk_utilization) if max_disk_utilization else None
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> None:
-        error_handler(max_disk_utilization, func, *args, **kwargs).run()
+        error_handler(max_disk_utilization, func, *args, **kwargs).run(monitor)
 
     return wrapper
@@ -17,6 +17,8 @@ from __future__ import annotations
 
 __all__ = [
     "get_image_content",
+    "is_image_array",
+    "snapshot_image_array",
     "get_html_content",
     "get_pickle_content",
     "is_numpy_array",
@@ -75,6 +77,21 @@ def get_image_content(image, autoscale=True) -> Optional[bytes]:
     return content
 
 
+def is_image_array(image) -> bool:
+    return is_numpy_array(image) or _is_torch_tensor(image) or _is_tensorflow_tensor(image)
+
+
+def snapshot_image_array(image) -> np.ndarray:
+    """Copies an array-like image, so it can be encoded later even if the original array is modified."""
+    if _is_torch_tensor(image):
+        image = image.detach().numpy()
+    elif _is_tensorflow_tensor(image):
+        image = image.numpy()
+
+    _verify_image_array_shape(image)
+    return numpy_array(image, copy=True)
+
+
 def get_html_content(chart) -> Optional[str]:
     content = _to_html(chart)
 
@@ -201,18 +218,19 @@ def _image_content_to_html(content: bytes) -> str:
 
 
 def _get_numpy_as_image(array: np.ndarray, autoscale: bool) -> bytes:
-    array = array.copy()  # prevent original array from modifying
+    _verify_image_array_shape(array)
     if autoscale:
         array = _scale_array(array)
 
-    if len(array.shape) == 2:
-        return _get_pil_image_data(pilimage_fromarray(array.astype(numpy_uint8)))
-    if len(array.shape) == 3:
-        if array.shape[2] == 1:
-            array2d = numpy_array([[col[0] for col in row] for row in array])
-            return _get_pil_image_data(pilimage_fromarray(array2d.astype(numpy_uint8)))
-        if array.shape[2] in (3, 4):
-            return _get_pil_image_data(pilimage_fromarray(array.astype(numpy_uint8)))
+    if array.ndim == 3 and array.shape[2] == 1:
+        array = array[:, :, 0]
+    # `astype` doesn't modify the original array, and returns it as is if it's already of the target type
+    return _get_pil_image_data(pilimage_fromarray(array.astype(numpy_uint8, copy=False)))
+
+
+def _verify_image_array_shape(array: np.ndarray) -> None:
+    if array.ndim == 2 or (array.ndim == 3 and array.shape[2] in (1, 3, 4)):
+        return
     raise ValueError(
         "Incorrect size of numpy.ndarray. Should be 2-dimensional or"
         "3-dimensional with 3rd dimension of size 1, 3 or 4."
@@ -15,15 +15,27 @@
 #
 __all__ = ["parse_path", "path_to_str", "join_paths"]
 
-from typing import List
+from functools import lru_cache
+from typing import (
+    List,
+    Tuple,
+)
+
+PARSED_PATHS_CACHE_SIZE = 4096
 
 
 def _remove_empty_paths(paths: List[str]) -> List[str]:
     return list(filter(bool, paths))
 
 
+@lru_cache(maxsize=PARSED_PATHS_CACHE_SIZE)
+def _parse_path(path: str) -> Tuple[str, ...]:
+    return tuple(filter(bool, path.split("/")))
+
+
 def parse_path(path: str) -> List[str]:
-    return _remove_empty_paths(str(path).split("/"))
+    # The same few paths are parsed on every logging call, a fresh list keeps the cached parts immutable
+    return list(_parse_path(str(path)))
 
 
 def path_to_str(path: List[str]) -> str:
@@ -15,13 +15,19 @@
 #
 __all__ = ["PingBackgroundJob"]
 
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Optional,
 )
 
 from neptune.internal.background_job import BackgroundJob
+from neptune.internal.exceptions import NeptuneConnectionLostException
 from neptune.internal.threading.daemon import Daemon
+from neptune.internal.threading.periodic_scheduler import (
+    PeriodicTask,
+    get_shared_scheduler,
+)
 from neptune.internal.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -31,42 +37,58 @@ _logger = get_logger()
 
 
 class PingBackgroundJob(BackgroundJob):
+    """Pings the backend on behalf of the object, from the scheduler shared by all objects of the process."""
+
     def __init__(self, period: float = 10):
         self._period = period
-        self._thread: PingBackgroundJob.ReportingThread = None
+        self._task: Optional[PeriodicTask] = None
         self._started = False
+        self._last_backoff_time: float = 0
 
     def start(self, container: "NeptuneObject"):
-        self._thread = self.ReportingThread(self._period, container)
-        self._thread.start()
+        self._task = get_shared_scheduler().schedule(
+            partial(self._ping, container), period=self._period, name="NeptunePing"
+        )
         self._started = True
 
     def stop(self):
         if not self._started:
             return
-        self._thread.interrupt()
+        self._task.cancel()
 
     def pause(self):
-        self._thread.pause()
+        if self._task is not None:
+            self._task.pause()
 
     def resume(self):
-        self._thread.resume()
+        if self._task is not None:
+            self._task.resume()
 
     def join(self, seconds: Optional[float] = None):
         if not self._started:
             return
-        self._thread.join(seconds)
+        self._task.join(seconds)
 
-    class ReportingThread(Daemon):
-        def __init__(self, period: float, container: "NeptuneObject"):
-            super().__init__(sleep_time=period, name="NeptunePing")
-            self._container = container
+    def _ping(self, container: "NeptuneObject") -> Optional[float]:
+        # Retried with a backoff instead of waiting, so other objects are pinged in the meantime
+        try:
+            container.ping()
+        except NeptuneConnectionLostException as e:
+            if self._last_backoff_time == 0:
+                _logger.warning(
+                    "Experiencing connection interruptions."
+                    " Will try to reestablish communication with Neptune."
+                    " Internal exception was: %s",
+                    e.cause.__class__.__name__,
+                )
+                self._last_backoff_time = Daemon.ConnectionRetryWrapper.INITIAL_RETRY_BACKOFF
+            else:
+                self._last_backoff_time = min(
+                    self._last_backoff_time * 2, Daemon.ConnectionRetryWrapper.MAX_RETRY_BACKOFF
+                )
+            return self._last_backoff_time
 
-        @Daemon.ConnectionRetryWrapper(
-            kill_message=(
-                "Killing Neptune ping thread. Your run's status will not be updated and"
-                " the run will be shown as inactive."
-            )
-        )
-        def work(self) -> None:
-            self._container.ping()
+        if self._last_backoff_time > 0:
+            self._last_backoff_time = 0
+            _logger.info("Communication with Neptune restored!")
+        return None
@@ -23,7 +23,10 @@ import os
 import threading
 import time
 import traceback
-from contextlib import AbstractContextManager
+from contextlib import (
+    AbstractContextManager,
+    contextmanager,
+)
 from functools import (
     partial,
     wraps,
@@ -35,6 +38,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Union,
@@ -68,6 +72,10 @@ from neptune.internal.backgroud_job_list import BackgroundJobList
 from neptune.internal.background_job import BackgroundJob
 from neptune.internal.container_structure import ContainerStructure
 from neptune.internal.container_type import ContainerType
+from neptune.internal.encoding_stage import (
+    EncodingStage,
+    get_image_encoding_workers,
+)
 from neptune.internal.exceptions import UNIX_STYLES
 from neptune.internal.id_formats import (
     QualifiedName,
@@ -80,7 +88,10 @@ from neptune.internal.init.parameters import (
     ASYNC_NO_PROGRESS_THRESHOLD,
     DEFAULT_FLUSH_PERIOD,
 )
-from neptune.internal.operation import DeleteAttribute
+from neptune.internal.operation import (
+    DeleteAttribute,
+    Operation,
+)
 from neptune.internal.operation_processors.factory import get_operation_processor
 from neptune.internal.signals_processing.background_job import CallbacksMonitor
 from neptune.internal.state import ContainerState
@@ -188,6 +199,8 @@ class NeptuneObject(AbstractContextManager):
             flush_period=flush_period,
             queue=self._signals_queue,
         )
+        self._encoding_stage: Optional[EncodingStage] = self._create_encoding_stage()
+        self._operations_batch: Optional[List[Operation]] = None
 
         self._bg_job: BackgroundJobList = self._prepare_background_jobs_if_non_read_only()
         self._structure: ContainerStructure[Attribute, NamespaceAttr] = ContainerStructure(NamespaceBuilder(self))
@@ -267,6 +280,7 @@ class NeptuneObject(AbstractContextManager):
                     )
                 )
             self._bg_job = BackgroundJobList(jobs)
+            self._encoding_stage = self._create_encoding_stage()
 
         with self._forking_cond:
             self._forking_state = False
@@ -278,9 +292,20 @@ class NeptuneObject(AbstractContextManager):
             self._forking_state = True
 
         if self._state == ContainerState.STARTED:
+            self._flush_encoding_stage()
             self._bg_job.pause()
             self._op_processor.pause()
 
+    def _create_encoding_stage(self) -> Optional[EncodingStage]:
+        max_workers = get_image_encoding_workers()
+        if max_workers <= 0 or self._mode == Mode.READ_ONLY:
+            return None
+        return EncodingStage(lock=self._lock, max_workers=max_workers)
+
+    def _flush_encoding_stage(self) -> None:
+        if self._encoding_stage is not None:
+            self._encoding_stage.flush()
+
     def _prepare_background_jobs_if_non_read_only(self) -> BackgroundJobList:
         jobs = []
 
@@ -454,6 +479,10 @@ class NeptuneObject(AbstractContextManager):
         self._bg_job.join(seconds)
         self._logger.info("Done!")
 
+        if self._encoding_stage is not None:
+            self._encoding_stage.shutdown()
+            self._encoding_stage = None
+
         sec_left = None if seconds is None else seconds - (time.time() - ts)
         self._op_processor.stop(sec_left)
         self._backend.close()
@@ -577,8 +606,28 @@ class NeptuneObject(AbstractContextManager):
 
     def _pop_impl(self, parsed_path: List[str], *, wait: bool):
         self._structure.pop(parsed_path)
+        self._flush_encoding_stage()
         self._op_processor.enqueue_operation(DeleteAttribute(parsed_path), wait=wait)
 
+    @contextmanager
+    def _batch_operations(self, *, wait: bool) -> Iterator[None]:
+        """Collects operations enqueued by attributes and passes them to the processor as a single group."""
+        with self._lock:
+            if self._operations_batch is not None:
+                yield
+                return
+
+            self._flush_encoding_stage()
+            self._operations_batch = []
+            try:
+                yield
+            finally:
+                ops, self._operations_batch = self._operations_batch, None
+                if ops:
+                    self._op_processor.enqueue_operations(ops, wait=wait)
+                elif wait:
+                    self._op_processor.wait()
+
     def lock(self) -> threading.RLock:
         return self._lock
 
@@ -593,6 +642,7 @@ class NeptuneObject(AbstractContextManager):
             https://docs.neptune.ai/api/universal/#wait
         """
         with self._lock:
+            self._flush_encoding_stage()
             if disk_only:
                 self._op_processor.flush()
             else:
@@ -622,6 +672,7 @@ class NeptuneObject(AbstractContextManager):
         """
         with self._lock:
             if wait:
+                self._flush_encoding_stage()
                 self._op_processor.wait()
             attributes = self._backend.get_attributes(self._id, self.container_type)
             self._structure.clear()
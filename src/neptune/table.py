@@ -21,16 +21,21 @@ from typing import (
     Generator,
     List,
     Optional,
+    Sequence,
 )
 
 from neptune.api.field_visitor import FieldToValueVisitor
 from neptune.api.models import (
     Field,
+    Fields,
     FieldType,
     LeaderboardEntry,
 )
 from neptune.exceptions import MetadataInconsistency
-from neptune.integrations.pandas import to_pandas
+from neptune.integrations.pandas import (
+    to_arrow,
+    to_pandas,
+)
 from neptune.internal.backends.neptune_backend import NeptuneBackend
 from neptune.internal.container_type import ContainerType
 from neptune.internal.utils.logger import get_logger
@@ -53,28 +58,28 @@ class TableEntry:
         backend: NeptuneBackend,
         container_type: ContainerType,
         _id: str,
-        attributes: List[Field],
+        attributes: Sequence[Field],
     ):
         self._backend = backend
         self._container_type = container_type
         self._id = _id
-        self._fields = attributes
+        self._fields = attributes if isinstance(attributes, Fields) else Fields(attributes)
         self._field_to_value_visitor = FieldToValueVisitor()
 
     def __getitem__(self, path: str) -> "LeaderboardHandler":
         return LeaderboardHandler(table_entry=self, path=path)
 
     def get_attribute_type(self, path: str) -> FieldType:
-        for field in self._fields:
-            if field.path == path:
-                return field.type
+        field = self._fields.get(path)
+        if field is not None:
+            return field.type
 
         raise ValueError(f"Could not find {path} field")
 
     def get_attribute_value(self, path: str) -> Any:
-        for field in self._fields:
-            if field.path == path:
-                return self._field_to_value_visitor.visit(field)
+        field = self._fields.get(path)
+        if field is not None:
+            return self._field_to_value_visitor.visit(field)
         raise ValueError("Could not find {} attribute".format(path))
 
     def download_file_attribute(
@@ -83,20 +88,20 @@ class TableEntry:
         destination: Optional[str],
         progress_bar: Optional[ProgressBarType] = None,
     ) -> None:
-        for attr in self._fields:
-            if attr.path == path:
-                _type = attr.type
-                if _type == FieldType.FILE:
-                    self._backend.download_file(
-                        container_id=self._id,
-                        container_type=self._container_type,
-                        path=parse_path(path),
-                        destination=destination,
-                        progress_bar=progress_bar,
-                    )
-                    return
-                raise MetadataInconsistency("Cannot download file from attribute of type {}".format(_type))
-        raise ValueError("Could not find {} attribute".format(path))
+        attr = self._fields.get(path)
+        if attr is None:
+            raise ValueError("Could not find {} attribute".format(path))
+
+        _type = attr.type
+        if _type != FieldType.FILE:
+            raise MetadataInconsistency("Cannot download file from attribute of type {}".format(_type))
+        self._backend.download_file(
+            container_id=self._id,
+            container_type=self._container_type,
+            path=parse_path(path),
+            destination=destination,
+            progress_bar=progress_bar,
+        )
 
     def download_file_set_attribute(
         self,
@@ -104,20 +109,20 @@ class TableEntry:
         destination: Optional[str],
         progress_bar: Optional[ProgressBarType] = None,
     ) -> None:
-        for attr in self._fields:
-            if attr.path == path:
-                _type = attr.type
-                if _type == FieldType.FILE_SET:
-                    self._backend.download_file_set(
-                        container_id=self._id,
-                        container_type=self._container_type,
-                        path=parse_path(path),
-                        destination=destination,
-                        progress_bar=progress_bar,
-                    )
-                    return
-                raise MetadataInconsistency("Cannot download ZIP archive from attribute of type {}".format(_type))
-        raise ValueError("Could not find {} attribute".format(path))
+        attr = self._fields.get(path)
+        if attr is None:
+            raise ValueError("Could not find {} attribute".format(path))
+
+        _type = attr.type
+        if _type != FieldType.FILE_SET:
+            raise MetadataInconsistency("Cannot download ZIP archive from attribute of type {}".format(_type))
+        self._backend.download_file_set(
+            container_id=self._id,
+            container_type=self._container_type,
+            path=parse_path(path),
+            destination=destination,
+            progress_bar=progress_bar,
+        )
 
 
 class LeaderboardHandler:
@@ -170,3 +175,6 @@ class Table:
 
     def to_pandas(self) -> "pandas.DataFrame":
         return to_pandas(self)
+
+    def to_arrow(self) -> Any:  # pyarrow.Table
+        return to_arrow(self)
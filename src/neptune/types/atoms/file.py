@@ -17,6 +17,7 @@ __all__ = [
     "File",
 ]
 
+from functools import partial
 from io import IOBase
 from typing import (
     TYPE_CHECKING,
@@ -25,7 +26,9 @@ from typing import (
     Union,
 )
 
+from neptune.internal.encoding_stage import get_image_encoding_workers
 from neptune.internal.types.file_types import (
+    DeferredInMemoryComposite,
     FileComposite,
     InMemoryComposite,
     LocalFileComposite,
@@ -38,12 +41,14 @@ from neptune.internal.utils.images import (
     get_pickle_content,
     is_altair_chart,
     is_bokeh_figure,
+    is_image_array,
     is_matplotlib_figure,
     is_numpy_array,
     is_pandas_dataframe,
     is_pil_image,
     is_plotly_figure,
     is_seaborn_figure,
+    snapshot_image_array,
 )
 from neptune.types.atoms.atom import Atom
 
@@ -209,8 +214,13 @@ class File(Atom):
             - How to log images: https://docs.neptune.ai/logging/images/
             - API referene: https://docs.neptune.ai/api/field_types#as_image
         """
-        content_bytes = get_image_content(image, autoscale=autoscale)
-        return File.from_content(content_bytes if content_bytes is not None else b"", extension="png")
+        if is_image_array(image) and get_image_encoding_workers() > 0:
+            # Arrays are only copied here and encoded when the content is first needed,
+            # which can happen outside the calling thread (e.g. when logged to a FileSeries).
+            encode = partial(_get_image_content_or_empty, snapshot_image_array(image), autoscale)
+            return File(file_composite=DeferredInMemoryComposite(encode, extension="png"))
+
+        return File.from_content(_get_image_content_or_empty(image, autoscale), extension="png")
 
     @staticmethod
     def as_html(chart) -> "File":
@@ -323,3 +333,8 @@ class File(Atom):
     def is_convertable_to_html(value):
         convertable_to_html_predicates = (is_altair_chart, is_bokeh_figure, is_plotly_figure, is_seaborn_figure)
         return any(predicate(value) for predicate in convertable_to_html_predicates)
+
+
+def _get_image_content_or_empty(image, autoscale: bool) -> bytes:
+    content_bytes = get_image_content(image, autoscale=autoscale)
+    return content_bytes if content_bytes is not None else b""
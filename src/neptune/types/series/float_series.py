@@ -16,7 +16,7 @@
 __all__ = ["FloatSeries"]
 
 import time
-from itertools import cycle
+from itertools import compress
 from typing import (
     TYPE_CHECKING,
     Optional,
@@ -25,9 +25,14 @@ from typing import (
     Union,
 )
 
+import numpy
+
 from neptune.internal.types.stringify_value import extract_if_stringify_value
 from neptune.internal.types.utils import is_unsupported_float
-from neptune.internal.utils import is_collection
+from neptune.internal.utils import (
+    is_collection,
+    is_numeric_array,
+)
 from neptune.internal.warnings import (
     NeptuneUnsupportedValue,
     warn_once,
@@ -52,33 +57,40 @@ class FloatSeries(Series):
     ):
         values = extract_if_stringify_value(values)
 
-        if not is_collection(values):
+        if not is_collection(values) and not is_numeric_array(values):
             raise TypeError("`values` is not a collection")
 
-        self._values = [float(value) for value in values]
         self._min = min
         self._max = max
         self._unit = unit
 
-        if steps is None:
-            filled_steps = cycle([None])
-        else:
+        if steps is not None:
             assert len(values) == len(steps)
-            filled_steps = steps
 
-        if timestamps is None:
-            filled_timestamps = cycle([time.time()])
-        else:
+        if timestamps is not None:
             assert len(values) == len(timestamps)
-            filled_timestamps = timestamps
 
-        clean_values, self._steps, self._timestamps = self.filter_unsupported_values(
-            values=values,
-            steps=filled_steps,
-            timestamps=filled_timestamps,
-            filter_by=self.is_unsupported_float_with_warn,
-        )
-        self._values = [float(value) for value in clean_values]
+        if is_numeric_array(values):
+            float_values = numpy.asarray(values, dtype=float)
+        else:
+            # Conversion of each element keeps errors of `float()` for values that are not numbers, like `None`
+            float_values = numpy.array([float(value) for value in values], dtype=float)
+
+        steps = _as_list(steps) if steps is not None else [None] * len(float_values)
+        timestamps = _as_list(timestamps) if timestamps is not None else [time.time()] * len(float_values)
+
+        supported = numpy.isfinite(float_values)
+        if not supported.all():
+            for value in numpy.unique(float_values[~supported]):
+                self.is_unsupported_float_with_warn(float(value))
+
+            float_values = float_values[supported]
+            steps = list(compress(steps, supported))
+            timestamps = list(compress(timestamps, supported))
+
+        self._values = float_values.tolist()
+        self._steps = steps
+        self._timestamps = timestamps
 
     @property
     def steps(self):
@@ -120,12 +132,7 @@ class FloatSeries(Series):
             return False
         return True
 
-    def filter_unsupported_values(self, values, steps, timestamps, filter_by):
-        filtered = [
-            (value, step, timestamp) for value, step, timestamp in zip(values, steps, timestamps) if filter_by(value)
-        ]
-        return (
-            [value for value, _, _ in filtered],
-            [step for _, step, _ in filtered],
-            [timestamp for _, _, timestamp in filtered],
-        )
+
+def _as_list(values) -> list:
+    # `tolist` converts NumPy scalars to Python numbers, which can be serialized to JSON
+    return values.tolist() if is_numeric_array(values) else list(values)
@@ -66,10 +66,6 @@ def cast_value(value: Any) -> Optional[Value]:
         return ValueCopy(value)
     elif isinstance(value, argparse.Namespace):
         return Namespace(vars(value))
-    elif File.is_convertable_to_image(value):
-        return File.as_image(value)
-    elif File.is_convertable_to_html(value):
-        return File.as_html(value)
     elif is_bool(value):
         return Boolean(value)
     elif is_int(value):
@@ -78,6 +74,10 @@ def cast_value(value: Any) -> Optional[Value]:
         return Float(value)
     elif is_string(value):
         return String(value)
+    elif File.is_convertable_to_image(value):
+        return File.as_image(value)
+    elif File.is_convertable_to_html(value):
+        return File.as_html(value)
     elif isinstance(value, datetime):
         return Datetime(value)
     elif is_float_like(value):
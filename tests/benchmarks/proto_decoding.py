@@ -0,0 +1,156 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Micro-benchmark of decoding protobuf leaderboard entries into `neptune.api.models`.
+
+Compares the type-keyed decoders against resolving the properties attribute name of every field at decoding time,
+both when decoding whole entries and when reading a single column of every entry.
+
+Usage:
+    python -m tests.benchmarks.proto_decoding [--entries 1000] [--fields 500] [--repeat 5]
+"""
+import argparse
+import timeit
+from typing import (
+    Any,
+    List,
+)
+
+from neptune.api.models import (
+    Field,
+    FieldType,
+    LeaderboardEntriesSearchResult,
+    LeaderboardEntry,
+    camel_to_snake,
+)
+from neptune.api.proto.neptune_pb.api.model.leaderboard_entries_pb2 import (
+    ProtoAttributeDTO,
+    ProtoAttributesDTO,
+    ProtoFloatAttributeDTO,
+    ProtoFloatSeriesAttributeDTO,
+    ProtoLeaderboardEntriesSearchResultDTO,
+    ProtoStringAttributeDTO,
+)
+
+WITH_PROTO_SUPPORT = {
+    FieldType.STRING.value,
+    FieldType.BOOL.value,
+    FieldType.INT.value,
+    FieldType.FLOAT.value,
+    FieldType.DATETIME.value,
+    FieldType.STRING_SET.value,
+    FieldType.FLOAT_SERIES.value,
+}
+
+
+def legacy_field_from_proto(data: Any) -> Field:
+    field_type = str(data.type)
+    return Field._registry[field_type].from_proto(data.__getattribute__(f"{camel_to_snake(field_type)}_properties"))
+
+
+def legacy_entry_from_proto(data: ProtoAttributesDTO) -> LeaderboardEntry:
+    return LeaderboardEntry(
+        object_id=data.experiment_id,
+        fields=[legacy_field_from_proto(field) for field in data.attributes if str(field.type) in WITH_PROTO_SUPPORT],
+    )
+
+
+def legacy_result_from_proto(data: ProtoLeaderboardEntriesSearchResultDTO) -> LeaderboardEntriesSearchResult:
+    return LeaderboardEntriesSearchResult(
+        entries=[legacy_entry_from_proto(entry) for entry in data.entries],
+        matching_item_count=data.matching_item_count,
+    )
+
+
+def make_attributes(fields: int) -> List[ProtoAttributeDTO]:
+    attributes = []
+    for i in range(fields):
+        if i % 3 == 0:
+            name = f"metrics/loss_{i}"
+            attributes.append(
+                ProtoAttributeDTO(
+                    name=name,
+                    type="floatSeries",
+                    float_series_properties=ProtoFloatSeriesAttributeDTO(
+                        attribute_name=name, attribute_type="floatSeries", last=0.5
+                    ),
+                )
+            )
+        elif i % 3 == 1:
+            name = f"params/lr_{i}"
+            attributes.append(
+                ProtoAttributeDTO(
+                    name=name,
+                    type="float",
+                    float_properties=ProtoFloatAttributeDTO(attribute_name=name, attribute_type="float", value=0.1),
+                )
+            )
+        else:
+            name = f"params/optimizer_{i}"
+            attributes.append(
+                ProtoAttributeDTO(
+                    name=name,
+                    type="string",
+                    string_properties=ProtoStringAttributeDTO(
+                        attribute_name=name, attribute_type="string", value="adam"
+                    ),
+                )
+            )
+    return attributes
+
+
+def make_search_result(entries: int, fields: int) -> ProtoLeaderboardEntriesSearchResultDTO:
+    attributes = make_attributes(fields)
+    return ProtoLeaderboardEntriesSearchResultDTO(
+        matching_item_count=entries,
+        entries=[ProtoAttributesDTO(experiment_id=f"id-{i}", attributes=attributes) for i in range(entries)],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--fields", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = make_search_result(entries=args.entries, fields=args.fields)
+    assert legacy_result_from_proto(data) == LeaderboardEntriesSearchResult.from_proto(data)
+    column = data.entries[0].attributes[args.fields // 2].name
+
+    def decode_all() -> None:
+        for entry in LeaderboardEntriesSearchResult.from_proto(data).entries:
+            list(entry.fields)
+
+    def legacy_lookup() -> None:
+        for entry in legacy_result_from_proto(data).entries:
+            next(field for field in entry.fields if field.path == column)
+
+    def lookup() -> None:
+        for entry in LeaderboardEntriesSearchResult.from_proto(data).entries:
+            entry.get_field(column)
+
+    for name, run in (
+        ("decode all (legacy)", lambda: legacy_result_from_proto(data)),
+        ("decode all", decode_all),
+        ("single column (legacy)", legacy_lookup),
+        ("single column", lookup),
+    ):
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        print(f"{name:>24}: {best:.3f}s ({args.entries / best:,.0f} entries/s)")
+
+
+if __name__ == "__main__":
+    main()
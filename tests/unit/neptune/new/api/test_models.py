@@ -24,6 +24,7 @@ from neptune.api.models import (
     DateTimeField,
     Field,
     FieldDefinition,
+    Fields,
     FieldType,
     FileEntry,
     FileField,
@@ -1938,6 +1939,87 @@ def test__leaderboard_entry__from_proto():
     assert string_field.path == "some/string"
 
 
+def test__leaderboard_entry__from_proto__skips_unsupported_field_types():
+    # given
+    proto = ProtoAttributesDTO(
+        experiment_id="some-id",
+        attributes=[
+            ProtoAttributeDTO(name="sys/state", type="experimentState"),
+            ProtoAttributeDTO(
+                name="some/float",
+                type="float",
+                float_properties=ProtoFloatAttributeDTO(
+                    attribute_name="some/float",
+                    attribute_type="float",
+                    value=18.5,
+                ),
+            ),
+            ProtoAttributeDTO(name="some/file", type="file"),
+        ],
+    )
+
+    # when
+    result = LeaderboardEntry.from_proto(proto)
+
+    # then
+    assert result.fields == [FloatField(path="some/float", value=18.5)]
+
+
+def test__leaderboard_entry__from_proto__get_field():
+    # given
+    proto = ProtoAttributesDTO(
+        experiment_id="some-id",
+        attributes=[
+            ProtoAttributeDTO(
+                name="some/float",
+                type="float",
+                float_properties=ProtoFloatAttributeDTO(attribute_name="some/float", attribute_type="float", value=1.5),
+            ),
+            ProtoAttributeDTO(name="sys/state", type="experimentState"),
+            ProtoAttributeDTO(
+                name="some/int",
+                type="int",
+                int_properties=ProtoIntAttributeDTO(attribute_name="some/int", attribute_type="int", value=18),
+            ),
+        ],
+    )
+
+    # when
+    result = LeaderboardEntry.from_proto(proto)
+
+    # then
+    assert result.get_field("some/int") == IntField(path="some/int", value=18)
+    assert result.get_field("some/int") is result.get_field("some/int")
+    assert result.get_field("sys/state") is None
+    assert result.get_field("some/missing") is None
+
+    # and
+    assert result.fields == [FloatField(path="some/float", value=1.5), IntField(path="some/int", value=18)]
+    assert result.get_field("some/float") is result.fields[0]
+
+
+def test__leaderboard_entry__get_field__keeps_first_occurrence():
+    # given
+    entry = LeaderboardEntry(
+        object_id="some-id",
+        fields=[FloatField(path="some/float", value=1.5), FloatField(path="some/float", value=2.5)],
+    )
+
+    # then
+    assert entry.get_field("some/float") == FloatField(path="some/float", value=1.5)
+    assert entry.fields == Fields([FloatField(path="some/float", value=1.5), FloatField(path="some/float", value=2.5)])
+
+
+def test__fields__are_slotted():
+    # given
+    field = FloatField(path="some/float", value=1.5)
+
+    # then
+    assert not hasattr(field, "__dict__")
+    with pytest.raises(AttributeError):
+        field.other = 1
+
+
 def test__leaderboard_entries_search_result__from_dict():
     # given
     data = {
@@ -244,6 +244,70 @@ def test__iter_over_pages__limit(get_single_page_mock):
     ]
 
 
+@patch("neptune.api.searching_entries.get_single_page")
+def test__iter_over_pages__prefetch(get_single_page_mock):
+    # given
+    values = [f"{idx:03}" for idx in range(20)]
+
+    def get_single_page(limit, offset, searching_after, **_):
+        remaining = [value for value in values if searching_after is None or value > searching_after]
+        return generate_leaderboard_entries(values=remaining[offset : offset + limit])
+
+    get_single_page_mock.side_effect = get_single_page
+
+    # when
+    result = list(
+        iter_over_pages(
+            step_size=3,
+            limit=None,
+            sort_by="sys/id",
+            sort_by_column_type="string",
+            ascending=False,
+            progress_bar=None,
+            max_offset=9,
+            prefetch_pages=4,
+        )
+    )
+
+    # then
+    assert result == generate_leaderboard_entries(values=values).entries
+    assert (
+        call(limit=0, offset=0, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after=None)
+        in get_single_page_mock.mock_calls
+    )
+    assert (
+        call(limit=3, offset=6, sort_by="sys/id", ascending=False, sort_by_column_type="string", searching_after="008")
+        in get_single_page_mock.mock_calls
+    )
+
+
+@patch("neptune.api.searching_entries.get_single_page")
+def test__iter_over_pages__prefetch_limit(get_single_page_mock):
+    # given
+    get_single_page_mock.side_effect = lambda limit, offset, **_: generate_leaderboard_entries(
+        values=[str(idx) for idx in range(offset, offset + limit)]
+    )
+
+    # when
+    result = list(
+        iter_over_pages(
+            step_size=2,
+            limit=5,
+            sort_by="sys/id",
+            sort_by_column_type="string",
+            ascending=False,
+            progress_bar=None,
+            prefetch_pages=3,
+        )
+    )
+
+    # then
+    assert result == generate_leaderboard_entries(values=["0", "1", "2", "3", "4"]).entries
+    assert sorted(
+        (kwargs["offset"], kwargs["limit"]) for _, _, kwargs in get_single_page_mock.mock_calls if kwargs["limit"]
+    ) == [(0, 2), (2, 2), (4, 1)]
+
+
 def generate_leaderboard_entries(values: Sequence, experiment_id: str = "foo") -> LeaderboardEntriesSearchResult:
     return LeaderboardEntriesSearchResult(
         matching_item_count=len(values),
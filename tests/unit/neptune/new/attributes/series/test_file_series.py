@@ -14,6 +14,9 @@
 # limitations under the License.
 #
 import io
+import os
+import pathlib
+import tempfile
 from importlib.util import find_spec
 from unittest import mock
 
@@ -26,6 +29,7 @@ from mock import (
 )
 
 from neptune.attributes.series.file_series import FileSeries
+from neptune.core.components.operation_storage import OperationStorage
 from neptune.exceptions import OperationNotSupported
 from neptune.internal.operation import (
     ClearImageLog,
@@ -91,6 +95,78 @@ class TestFileSeries(TestAttributeBase):
                 wait=wait,
             )
 
+    @pytest.mark.skipif(condition=find_spec("PIL") is None, reason="PIL not installed")
+    @patch.dict("os.environ", {"NEPTUNE_IMAGE_ENCODING_WORKERS": "4"})
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_log_content_with_encoding_workers(self, get_operation_processor):
+        # given
+        path = self._random_path()
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            attr = FileSeries(exp, path)
+
+            arrays = [numpy.random.rand(10, 10) * 255 for _ in range(10)]
+            files = [File.as_image(array) for array in arrays]
+
+            # when
+            for step, file in enumerate(files):
+                attr.log(file, step=step, timestamp=self._now())
+            exp.wait()
+
+            # then
+            processor.enqueue_operation.assert_has_calls(
+                [
+                    call(
+                        LogImages(
+                            path,
+                            [
+                                LogImages.ValueType(
+                                    ImageValue(base64_encode(file.content), None, None),
+                                    step,
+                                    self._now(),
+                                )
+                            ],
+                        ),
+                        wait=False,
+                    )
+                    for step, file in enumerate(files)
+                ]
+            )
+
+    @pytest.mark.skipif(condition=find_spec("PIL") is None, reason="PIL not installed")
+    @patch.dict("os.environ", {"NEPTUNE_OPERATION_BLOB_THRESHOLD": "1"})
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_log_content_as_blob(self, get_operation_processor):
+        # given
+        path = self._random_path()
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp, tempfile.TemporaryDirectory() as data_path:
+            processor.operation_storage = OperationStorage(data_path=pathlib.Path(data_path))
+            attr = FileSeries(exp, path)
+
+            file = File.as_image(numpy.random.rand(10, 10) * 255)
+
+            # when
+            attr.log(file, step=3, timestamp=self._now(), name="nazwa", description="opis")
+
+            # then
+            operation = processor.enqueue_operation.call_args[0][0]
+            image_value = operation.values[0].value
+            self.assertIsNone(image_value.data)
+            self.assertEqual(image_value.get_data(processor.operation_storage), base64_encode(file.content))
+            self.assertEqual((image_value.name, image_value.description), ("nazwa", "opis"))
+
+            # when
+            processor.operation_storage.release_blobs(1, operation.get_blobs())
+            processor.operation_storage.remove_released_blobs(acknowledged_version=1)
+
+            # then
+            self.assertEqual(os.listdir(processor.operation_storage.blobs_path), [])
+
     @pytest.mark.skipif(condition=find_spec("PIL") is None, reason="PIL not installed")
     @patch("neptune.objects.neptune_object.get_operation_processor")
     def test_assign_content(self, get_operation_processor):
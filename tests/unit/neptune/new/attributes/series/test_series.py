@@ -13,6 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import json
+
+import numpy
+import pytest
 from mock import (
     MagicMock,
     call,
@@ -33,6 +37,10 @@ from neptune.internal.operation import (
     ConfigFloatSeries,
     LogFloats,
 )
+from neptune.internal.warnings import (
+    NeptuneUnsupportedValue,
+    warned_once,
+)
 from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
 
 
@@ -164,6 +172,29 @@ class TestSeries(TestAttributeBase):
                 var.log(value, timestamp=ts, wait=wait)
                 processor.enqueue_operation.assert_called_with(LogFloats(path, [expected]), wait=wait)
 
+    @patch("neptune.objects.neptune_object.get_operation_processor")
+    def test_extend_numpy_array(self, get_operation_processor):
+        processor = MagicMock()
+        get_operation_processor.return_value = processor
+
+        with self._exp() as exp:
+            path = self._random_path()
+            var = FloatSeries(exp, path)
+
+            warned_once.clear()
+            with pytest.warns(NeptuneUnsupportedValue):
+                var.extend(numpy.array([1.5, numpy.nan, 3, numpy.inf]), steps=numpy.array([1, 2, 3, 4]))
+
+            expected = [LogFloats.ValueType(1.5, 1, self._now()), LogFloats.ValueType(3.0, 3, self._now())]
+            processor.enqueue_operation.assert_called_with(LogFloats(path, expected), wait=False)
+
+            # and values are stored as Python numbers, so they can be serialized to JSON
+            operation = processor.enqueue_operation.call_args[0][0]
+            self.assertEqual(
+                json.loads(json.dumps(operation.to_dict()))["values"],
+                [{"value": 1.5, "step": 1, "ts": self._now()}, {"value": 3.0, "step": 3, "ts": self._now()}],
+            )
+
     @patch("neptune.objects.neptune_object.get_operation_processor")
     def test_log_value_errors(self, get_operation_processor):
         processor = MagicMock()
@@ -0,0 +1,44 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from mock import MagicMock
+
+from neptune.attributes.namespace import Namespace
+from neptune.internal.utils.generic_attribute_mapper import NoValue
+from tests.unit.neptune.new.attributes.test_attribute_base import TestAttributeBase
+
+
+class TestNamespace(TestAttributeBase):
+    def test_fetch_builds_nested_dict_of_atoms(self):
+        with self._exp() as exp:
+            exp._backend.fetch_atom_attribute_values = MagicMock(
+                return_value=[
+                    ("params/lr", "float", 0.1),
+                    ("params/optimizer/name", "string", "adam"),
+                    ("params/optimizer/betas/first", "float", 0.9),
+                    ("params/loss", "floatSeries", 0.5),
+                    ("params/charts/accuracy", "floatSeries", NoValue),
+                    ("params/empty", "string", NoValue),
+                ]
+            )
+
+            self.assertEqual(
+                Namespace(exp, ["params"]).fetch(),
+                {
+                    "lr": 0.1,
+                    "optimizer": {"name": "adam", "betas": {"first": 0.9}},
+                    "charts": {},
+                },
+            )
@@ -19,7 +19,10 @@ from unittest.mock import MagicMock
 import mock
 import pytest
 
-from neptune.cli.sync import SyncRunner
+from neptune.cli.sync import (
+    SyncRunner,
+    sync_containers,
+)
 from neptune.cli.utils import get_qualified_name
 from neptune.internal.container_type import ContainerType
 from neptune.internal.operation import Operation
@@ -34,6 +37,12 @@ from tests.unit.neptune.new.cli.utils import (
 AVAILABLE_CONTAINERS = [ContainerType.RUN, ContainerType.MODEL_VERSION, ContainerType.MODEL, ContainerType.PROJECT]
 
 
+@pytest.fixture(autouse=True)
+def release_operation_blobs_fixture(mocker):
+    # Operations are plain strings in these tests, so they have no blobs to release
+    mocker.patch("neptune.cli.containers.release_operation_blobs")
+
+
 @pytest.fixture(name="backend")
 def backend_fixture():
     backend = MagicMock()
@@ -426,3 +435,59 @@ def test_sync_non_existent_offline_containers(tmp_path, capsys, backend):
     captured = capsys.readouterr()
     assert "Offline container foo__bar not found on disk." in captured.out
     assert "Offline container model__bar not found on disk." in captured.out
+
+
+def test_sync_all_v2_containers_concurrently(tmp_path, mocker, capsys, backend):
+    # given
+    unsynced_containers = [
+        prepare_v2_container(
+            container_type=ContainerType.RUN, path=tmp_path, last_ack_version=1, pid=2501 + i, key=f"a1b2c{i}"
+        )
+        for i in range(4)
+    ]
+
+    # and
+    get_container_impl = generate_get_metadata_container(registered_containers=unsynced_containers)
+
+    # and
+    mocker.patch.object(backend, "get_metadata_container", get_container_impl)
+    mocker.patch.object(Operation, "from_dict", lambda x: x)
+
+    # when
+    SyncRunner.sync_all(backend=backend, base_path=tmp_path, project_name="foo", jobs=3)
+
+    # then
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    for container in unsynced_containers:
+        assert f"Synchronization of run {get_qualified_name(container)} completed." in captured.out
+    assert "Synchronized 4 of 4 objects." in captured.out
+
+    # and
+    assert backend.execute_operations.call_count == 4
+    backend.execute_operations.assert_has_calls(
+        [
+            mocker.call(
+                container_id=container.id,
+                container_type=ContainerType.RUN,
+                operations=["op-1", "op-2"],
+                operation_storage=mock.ANY,
+            )
+            for container in unsynced_containers
+        ],
+        any_order=True,
+    )
+
+
+def test_sync_containers_concurrently_reraises_first_failure():
+    # given
+    containers = [MagicMock(container_id=f"container-{i}") for i in range(3)]
+    containers[1].sync.side_effect = RuntimeError("lost")
+
+    # when
+    with pytest.raises(RuntimeError, match="lost"):
+        sync_containers(containers=containers, base_path=MagicMock(), backend=MagicMock(), project=None, jobs=2)
+
+    # then
+    for container in containers:
+        container.sync.assert_called_once()
@@ -19,6 +19,7 @@ from abc import abstractmethod
 from datetime import datetime
 from typing import List
 
+import pandas as pd
 import pytest
 from mock import patch
 
@@ -134,6 +135,45 @@ class AbstractTablesTestMixin:
         with self.assertRaises(KeyError):
             self.assertTrue(df["image/series"])
 
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_get_table_as_pandas_with_sparse_columns(self, search_leaderboard_entries):
+        # given
+        search_leaderboard_entries.return_value = [
+            LeaderboardEntry(object_id=str(uuid.uuid4()), fields=[FloatField(path="float", value=1.5)]),
+            LeaderboardEntry(object_id=str(uuid.uuid4()), fields=[StringField(path="sys/name", value="name")]),
+            LeaderboardEntry(object_id=str(uuid.uuid4()), fields=[FloatField(path="float", value=2.5)]),
+        ]
+
+        # when
+        df = self.get_table().to_pandas()
+
+        # then
+        self.assertEqual(["sys/name", "float"], list(df.columns))
+        self.assertEqual([0, 1, 2], list(df.index))
+        self.assertEqual([1.5, 2.5], df["float"].dropna().tolist())
+        self.assertTrue(pd.isna(df["float"][1]))
+        self.assertEqual("name", df["sys/name"][1])
+
+    @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
+    def test_get_table_as_arrow(self, search_leaderboard_entries):
+        pytest.importorskip("pyarrow")
+
+        # given
+        search_leaderboard_entries.return_value = [
+            LeaderboardEntry(object_id=str(uuid.uuid4()), fields=[]),
+            LeaderboardEntry(object_id=str(uuid.uuid4()), fields=self.build_fields_leaderboard(datetime.now())),
+            LeaderboardEntry(object_id=str(uuid.uuid4()), fields=[StringField(path="float", value="text")]),
+        ]
+
+        # when
+        table = self.get_table().to_arrow()
+
+        # then
+        self.assertEqual(2, table.num_rows)
+        self.assertEqual(["Inactive", None], table.column("run/state").to_pylist())
+        self.assertEqual(["12.5", "text"], table.column("float").to_pylist())
+        self.assertNotIn("file", table.column_names)
+
     @patch.object(NeptuneBackendMock, "search_leaderboard_entries")
     def test_get_table_as_rows(self, search_leaderboard_entries):
         # given
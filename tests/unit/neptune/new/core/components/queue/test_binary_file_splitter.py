@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from neptune.core.components.queue.binary_file_splitter import BinaryFileSplitter
+from neptune.core.components.queue.segment_format import (
+    BINARY_SEGMENT_MAGIC,
+    RECORD_HEADER,
+    encode_record,
+)
+from neptune.exceptions import MalformedOperation
+from tests.unit.neptune.new.utils.file_helpers import create_file
+
+
+def test_simple_file():
+    content = BINARY_SEGMENT_MAGIC + encode_record({"a": 5, "b": "text"}) + encode_record({"a": 13}) + encode_record({})
+
+    with create_file(content, binary_mode=True) as filename:
+        with BinaryFileSplitter(filename) as splitter:
+            assert splitter.get() == {"a": 5, "b": "text"}
+            assert splitter.get() == {"a": 13}
+            assert splitter.get() == {}
+            assert splitter.get() is None
+
+
+def test_append():
+    with create_file(BINARY_SEGMENT_MAGIC + encode_record({"a": 5}), binary_mode=True) as filename, open(
+        filename, "ab"
+    ) as fp:
+        with BinaryFileSplitter(filename) as splitter:
+            assert splitter.get() == {"a": 5}
+            assert splitter.get() is None
+
+            fp.write(encode_record({"a": {"b": [1.5, 2.5, float("inf")]}}))
+            fp.flush()
+
+            assert splitter.get() == {"a": {"b": [1.5, 2.5, float("inf")]}}
+            assert splitter.get() is None
+
+
+def test_partially_written_record():
+    record = encode_record({"q": 555, "r": "something"})
+
+    with create_file(BINARY_SEGMENT_MAGIC + record[:7], binary_mode=True) as filename, open(filename, "ab") as fp:
+        with BinaryFileSplitter(filename) as splitter:
+            assert splitter.get() is None
+
+            fp.write(record[7:])
+            fp.flush()
+
+            assert splitter.get_with_size() == ({"q": 555, "r": "something"}, len(record) - RECORD_HEADER.size)
+            assert splitter.get() is None
+
+
+def test_read_at():
+    first, second = encode_record({"a": 1}), encode_record({"a": 2})
+
+    with create_file(BINARY_SEGMENT_MAGIC + first + second, binary_mode=True) as filename:
+        with BinaryFileSplitter(filename) as splitter:
+            assert splitter.read_at(len(BINARY_SEGMENT_MAGIC) + len(first)) == (
+                {"a": 2},
+                len(second) - RECORD_HEADER.size,
+            )
+
+            # and sequential reading is not affected
+            assert splitter.get() == {"a": 1}
+            assert splitter.offset == len(BINARY_SEGMENT_MAGIC) + len(first)
+
+
+def test_corrupted_record():
+    record = bytearray(encode_record({"a": 5}))
+    record[-1] ^= 0xFF
+
+    with create_file(BINARY_SEGMENT_MAGIC + bytes(record), binary_mode=True) as filename:
+        with BinaryFileSplitter(filename) as splitter:
+            with pytest.raises(MalformedOperation):
+                splitter.get()
+
+
+def test_not_a_binary_segment():
+    with create_file('{"a": 5}') as filename:
+        with pytest.raises(MalformedOperation):
+            BinaryFileSplitter(filename)
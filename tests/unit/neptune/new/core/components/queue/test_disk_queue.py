@@ -23,11 +23,20 @@ from tempfile import TemporaryDirectory
 from typing import Optional
 
 from mock import patch
-from pytest import fixture
+from pytest import (
+    fixture,
+    raises,
+)
 
 from neptune.core.components.queue.disk_queue import (
     DiskQueue,
     QueueElement,
+    read_offsets,
+)
+from neptune.core.components.queue.group_commit import Durability
+from neptune.core.components.queue.segment_format import (
+    SegmentFormat,
+    detect_segment_format,
 )
 
 
@@ -221,6 +230,477 @@ def test_cleaning_up():
     assert list(Path(data_path).glob("*")) == []
 
 
+def test_deferred_ack():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=100,
+            ack_interval=3600,
+        ) as queue:
+            # given
+            for i in range(1, 11):
+                queue.put(Obj(i, str(i)))
+            queue.flush()
+            log_files_count = len(glob(data_path + "/data-*.log"))
+
+            # when
+            assert [element.ver for element in queue.get_batch(10)] == list(range(1, 11))
+            queue.ack(8)
+
+            # then
+            assert 2 == queue.size()
+            assert read_offsets(Path(data_path)) == (10, 0)
+            assert len(glob(data_path + "/data-*.log")) == log_files_count
+
+            # when
+            queue.persist_ack()
+
+            # then
+            assert read_offsets(Path(data_path)) == (10, 8)
+            assert len(glob(data_path + "/data-*.log")) < log_files_count
+
+            # when
+            queue.ack(10)
+
+            # then
+            assert queue.is_empty()
+
+    assert list(Path(data_path).glob("*")) == []
+
+
+def test_on_ack_persisted():
+    for ack_interval in (None, 3600):
+        with TemporaryDirectory() as data_path:
+            persisted = []
+            with DiskQueue[Obj](
+                data_path=Path(data_path),
+                to_dict=serializer,
+                from_dict=deserializer,
+                lock=threading.RLock(),
+                ack_interval=ack_interval,
+                on_ack_persisted=persisted.append,
+            ) as queue:
+                # given
+                for i in range(5):
+                    queue.put(Obj(i, str(i)))
+                queue.flush()
+
+                # when
+                queue.ack(3)
+
+                # then
+                assert persisted == ([] if ack_interval else [3])
+
+                # when
+                queue.persist_ack()
+
+                # then
+                assert persisted == [3]
+
+
+def test_binary_segment_format():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+            segment_format=SegmentFormat.BINARY,
+        ) as queue:
+            # given
+            for i in range(1, 101):
+                queue.put(Obj(i, str(i)))
+
+            # when
+            queue.flush()
+
+            # then
+            batch = queue.get_batch(100)
+            assert [(element.obj, element.ver, element.at) for element in batch] == [
+                (Obj(i, str(i)), i, 1234 + i - 1) for i in range(1, 101)
+            ]
+
+            # and
+            data_files = glob(data_path + "/data-*.log")
+            assert len(data_files) > 10
+            assert all(detect_segment_format(file) == SegmentFormat.BINARY for file in data_files)
+
+
+def test_reading_json_segments_after_switching_to_binary_format():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # given
+            for i in range(1, 6):
+                queue.put(Obj(i, str(i)))
+
+        # when
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            segment_format=SegmentFormat.BINARY,
+        ) as queue:
+            for i in range(6, 11):
+                queue.put(Obj(i, str(i)))
+            queue.flush()
+
+            # then
+            assert [(element.obj, element.ver) for element in queue.get_batch(10)] == [
+                (Obj(i, str(i)), i) for i in range(1, 11)
+            ]
+
+            # and
+            assert detect_segment_format(Path(data_path) / "data-1.log") == SegmentFormat.JSON
+            assert detect_segment_format(Path(data_path) / "data-6.log") == SegmentFormat.BINARY
+
+
+def test_group_commit():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+            group_commit_interval=3600,
+        ) as queue:
+            # given
+            versions = [queue.put(Obj(i, str(i))) for i in range(1, 51)]
+
+            # then
+            assert versions == list(range(1, 51))
+            assert queue.is_empty()
+            assert queue.get() is None
+
+            # when
+            queue.flush()
+
+            # then
+            assert 50 == queue.size()
+            assert [get_queue_element(Obj(i, str(i)), i, 1234 + i - 1) for i in range(1, 51)] == queue.get_batch(50)
+            assert len(glob(data_path + "/data-*.log")) > 5
+
+
+def test_group_commit_backpressure():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            group_commit_interval=3600,
+            durability=Durability.FLUSH,
+            max_pending=10,
+        ) as queue:
+            # when
+            for i in range(1, 16):
+                queue.put(Obj(i, str(i)))
+
+            # then
+            assert 10 == queue.size()
+            assert [element.ver for element in queue.get_batch(20)] == list(range(1, 11))
+
+
+def test_put_batch():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            max_file_size=300,
+        ) as queue:
+            # given
+            queue.put(Obj(0, "0"))
+
+            # when
+            version = queue.put_batch([Obj(i, str(i)) for i in range(1, 51)])
+            queue.flush()
+
+            # then
+            assert version == 51
+            assert queue.put_batch([]) == 51
+            assert 51 == queue.size()
+            assert [get_queue_element(Obj(0, "0"), 1, 1234)] + [
+                get_queue_element(Obj(i, str(i)), i + 1, 1235) for i in range(1, 51)
+            ] == queue.get_batch(51)
+            assert len(glob(data_path + "/data-*.log")) > 5
+
+
+def test_put_batch_with_group_commit():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            group_commit_interval=3600,
+            durability=Durability.FLUSH,
+            max_pending=10,
+        ) as queue:
+            # when
+            first_version = queue.put_batch([Obj(i, str(i)) for i in range(1, 6)])
+            second_version = queue.put_batch([Obj(i, str(i)) for i in range(6, 16)])
+
+            # then
+            assert (first_version, second_version) == (5, 15)
+            assert 15 == queue.size()
+            assert [element.ver for element in queue.get_batch(20)] == list(range(1, 16))
+
+
+def test_group_commit_on_close():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            group_commit_interval=3600,
+            durability=Durability.FSYNC,
+        ) as queue:
+            for i in range(1, 6):
+                queue.put(Obj(i, str(i)))
+
+        # when
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # then
+            assert 5 == queue.size()
+            assert [element.obj for element in queue.get_batch(5)] == [Obj(i, str(i)) for i in range(1, 6)]
+
+
+def test_group_commit_retries_elements_of_failed_write():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            group_commit_interval=3600,
+        ) as queue:
+            # given
+            for i in range(1, 6):
+                queue.put(Obj(i, str(i)))
+
+            # when
+            with patch.object(queue, "_write_chunk", side_effect=OSError("No space left on device")):
+                with raises(OSError):
+                    queue.commit()
+            queue.put(Obj(6, "6"))
+            queue.flush()
+
+            # then
+            assert 6 == queue.size()
+            assert [element.ver for element in queue.get_batch(10)] == list(range(1, 7))
+
+
+def test_group_commit_put_raises_serialization_error():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            group_commit_interval=3600,
+        ) as queue:
+            # given
+            queue.put(Obj(1, object()))
+
+            # when
+            with raises(TypeError):
+                queue.commit()
+            version = queue.put(Obj(2, "2"))
+            queue.flush()
+
+            # then
+            assert 2 == version
+            assert 2 == queue.last_put_version
+            assert [get_queue_element(Obj(2, "2"), 2, 1235)] == queue.get_batch(10)
+
+
+def test_group_commit_next_put_raises_serialization_error_of_writer_thread():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            group_commit_interval=3600,
+        ) as queue:
+            # given
+            queue.put(Obj(1, "1"))
+            queue.put(Obj(2, object()))
+
+            # when
+            queue._write_pending()
+
+            # then
+            assert 1 == queue.last_put_version
+            with raises(TypeError):
+                queue.put(Obj(3, "3"))
+
+            # and
+            assert 3 == queue.put(Obj(4, "4"))
+            queue.flush()
+            assert [element.ver for element in queue.get_batch(10)] == [1, 3]
+
+
+def test_mmap_offsets():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            mmap_offsets=True,
+        ) as queue:
+            # given
+            for i in range(5):
+                queue.put(Obj(i, str(i)))
+
+            # when
+            queue.flush()
+            queue.ack(2)
+
+            # then
+            assert 3 == queue.size()
+            assert not (Path(data_path) / "last_put_version").exists()
+
+        # when
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # then
+            assert 3 == queue.size()
+            assert get_queue_element(Obj(2, "2"), 3, 1234 + 2) == queue.get()
+
+
+def test_migrating_to_mmap_offsets():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # given
+            for i in range(5):
+                queue.put(Obj(i, str(i)))
+            queue.flush()
+            queue.ack(1)
+
+        # when
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            mmap_offsets=True,
+        ) as queue:
+            # then
+            assert 4 == queue.size()
+            assert get_queue_element(Obj(1, "1"), 2, 1234 + 1) == queue.get()
+            assert not (Path(data_path) / "last_put_version").exists()
+            assert not (Path(data_path) / "last_ack_version").exists()
+
+
+def test_interrupted_migration_to_mmap_offsets():
+    with TemporaryDirectory() as data_path:
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+        ) as queue:
+            # given
+            for i in range(5):
+                queue.put(Obj(i, str(i)))
+            queue.flush()
+            queue.ack(1)
+
+        # when
+        with patch(
+            "neptune.core.components.queue.mmap_offset_file.MmapOffsetStorage.fsync", side_effect=OSError("crash")
+        ):
+            with raises(OSError):
+                DiskQueue[Obj](
+                    data_path=Path(data_path),
+                    to_dict=serializer,
+                    from_dict=deserializer,
+                    lock=threading.RLock(),
+                    mmap_offsets=True,
+                )
+
+        # then
+        assert (Path(data_path) / "last_put_version").exists()
+        assert (Path(data_path) / "last_ack_version").exists()
+        with DiskQueue[Obj](
+            data_path=Path(data_path),
+            to_dict=serializer,
+            from_dict=deserializer,
+            lock=threading.RLock(),
+            mmap_offsets=True,
+        ) as queue:
+            assert 4 == queue.size()
+
+
+def test_read_offsets():
+    for mmap_offsets in (False, True):
+        with TemporaryDirectory() as data_path:
+            with DiskQueue[Obj](
+                data_path=Path(data_path),
+                to_dict=serializer,
+                from_dict=deserializer,
+                lock=threading.RLock(),
+                mmap_offsets=mmap_offsets,
+            ) as queue:
+                # given
+                for i in range(5):
+                    queue.put(Obj(i, str(i)))
+                queue.flush()
+                queue.ack(2)
+
+                # and
+                files_before = sorted(Path(data_path).iterdir())
+
+                # then
+                assert (5, 2) == read_offsets(Path(data_path))
+                assert files_before == sorted(Path(data_path).iterdir())
+
+
+def test_read_offsets_of_empty_directory():
+    with TemporaryDirectory() as data_path:
+        # then
+        assert (0, 0) == read_offsets(Path(data_path))
+        assert [] == list(Path(data_path).iterdir())
+
+
+def test_read_offsets_of_corrupted_offsets_file():
+    with TemporaryDirectory() as data_path:
+        # given
+        (Path(data_path) / "offsets").write_bytes(b"\xff" * 64)
+
+        # then
+        assert read_offsets(Path(data_path)) is None
+
+
 @dataclass
 class Obj:
     num: int
@@ -0,0 +1,99 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from neptune.core.components.queue.mmap_offset_file import (
+    OFFSETS_FILE,
+    MmapOffsetFile,
+    MmapOffsetStorage,
+    read_offsets_file,
+)
+
+
+def test_default_values():
+    with TemporaryDirectory() as data_path:
+        storage = MmapOffsetStorage(Path(data_path) / OFFSETS_FILE, default_put=5, default_ack=3)
+
+        assert (5, 3) == storage.read()
+        assert 5 == MmapOffsetFile(storage, is_ack=False).read()
+        assert 3 == MmapOffsetFile(storage, is_ack=True).read()
+
+        storage.close()
+
+
+def test_write_and_reopen():
+    with TemporaryDirectory() as data_path:
+        # given
+        storage = MmapOffsetStorage(Path(data_path) / OFFSETS_FILE)
+        put_file, ack_file = MmapOffsetFile(storage, is_ack=False), MmapOffsetFile(storage, is_ack=True)
+
+        # when
+        for version in range(1, 11):
+            put_file.write(version)
+        ack_file.write(7)
+
+        # then
+        assert (10, 7) == (put_file.read_local(), ack_file.read_local())
+        assert (10, 7) == (put_file.read(), ack_file.read())
+
+        # and
+        put_file.close()
+        ack_file.close()
+        assert (10, 7) == MmapOffsetStorage(Path(data_path) / OFFSETS_FILE).read()
+
+
+def test_torn_write_falls_back_to_previous_state():
+    with TemporaryDirectory() as data_path:
+        # given
+        storage = MmapOffsetStorage(Path(data_path) / OFFSETS_FILE)
+        storage.write_put(10)
+        storage.write_ack(4)
+        storage.close()
+
+        # when
+        path = Path(data_path) / OFFSETS_FILE
+        content = bytearray(path.read_bytes())
+        # generation 3 (the latest state) is kept in the second slot
+        content[32 + 10] ^= 0xFF
+        path.write_bytes(bytes(content))
+
+        # then
+        assert (10, 0) == MmapOffsetStorage(path).read()
+
+
+def test_cleanup():
+    with TemporaryDirectory() as data_path:
+        storage = MmapOffsetStorage(Path(data_path) / OFFSETS_FILE)
+        storage.close()
+        storage.cleanup()
+
+        assert list(Path(data_path).glob("*")) == []
+
+
+def test_read_offsets_file():
+    with TemporaryDirectory() as data_path:
+        # given
+        storage = MmapOffsetStorage(Path(data_path) / OFFSETS_FILE)
+        storage.write_put(7)
+        storage.write_ack(4)
+        storage.fsync()
+
+        # then
+        assert (7, 4) == read_offsets_file(Path(data_path) / OFFSETS_FILE)
+        assert read_offsets_file(Path(data_path) / "missing") is None
+
+        storage.close()
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+import pytest
+
+from neptune.core.components.operation_storage import OperationStorage
+
+
+def test_blob_roundtrip(tmp_path):
+    # given
+    storage = OperationStorage(data_path=tmp_path)
+
+    # when
+    blob = storage.store_blob(b"some content")
+
+    # then
+    assert blob.size == len(b"some content")
+    assert blob.name.startswith(blob.sha256)
+    assert storage.read_blob(blob) == b"some content"
+
+    # when
+    storage.remove_blob(blob)
+
+    # then
+    assert os.listdir(storage.blobs_path) == []
+
+
+def test_same_content_is_stored_in_separate_blobs(tmp_path):
+    # given
+    storage = OperationStorage(data_path=tmp_path)
+
+    # when
+    first, second = storage.store_blob(b"content"), storage.store_blob(b"content")
+    storage.remove_blob(first)
+
+    # then
+    assert first.sha256 == second.sha256
+    assert storage.read_blob(second) == b"content"
+
+
+def test_read_corrupted_blob(tmp_path):
+    # given
+    storage = OperationStorage(data_path=tmp_path)
+    blob = storage.store_blob(b"content")
+
+    # when
+    with open(storage.blobs_path / blob.name, "wb") as blob_file:
+        blob_file.write(b"modified")
+
+    # then
+    with pytest.raises(ValueError):
+        storage.read_blob(blob)
+
+
+def test_released_blobs_are_removed_once_acknowledged(tmp_path):
+    # given
+    storage = OperationStorage(data_path=tmp_path)
+    first, second, third = (storage.store_blob(content) for content in (b"first", b"second", b"third"))
+
+    # when
+    storage.release_blobs(1, [first])
+    storage.release_blobs(3, [second, third])
+    storage.remove_released_blobs(2)
+
+    # then
+    assert sorted(os.listdir(storage.blobs_path)) == sorted([second.name, third.name])
+
+    # when
+    storage.remove_released_blobs(3)
+
+    # then
+    assert os.listdir(storage.blobs_path) == []
@@ -132,3 +132,40 @@ class TestFileHasher:
             assert "d78f8bb992a56a597f6c7a1fb918bb78271367eb" == hash1
             assert "12dada1fff4d4787ade3333147202c3b443e376f" == hash2
             assert 2 == hashlib.sha1.call_count
+
+    @patch("pathlib.Path.home")
+    def test_local_file_hashes_computed_in_parallel(self, home):
+        with TemporaryDirectory() as tmp_dir:
+            paths = []
+            for idx in range(10):
+                path = Path(tmp_dir) / f"file_{idx}"
+                path.write_bytes(bytes([idx]) * 1000)
+                paths.append(path)
+
+            home.return_value = Path(tmp_dir)
+
+            with patch.object(FileHasher, "PARALLEL_HASHING_MIN_FILES", 2):
+                hashes = FileHasher.get_local_file_hashes(paths)
+
+            assert [hashlib.sha1(path.read_bytes()).hexdigest() for path in paths] == hashes
+            assert hashes[3] == FileHasher.get_local_file_hash(paths[3])
+
+    @patch("pathlib.Path.home")
+    def test_local_file_hashes_computed_only_for_modified_files(self, home):
+        with TemporaryDirectory() as tmp_dir:
+            paths = [Path(tmp_dir) / "unchanged", Path(tmp_dir) / "modified"]
+            for path in paths:
+                path.write_bytes(b"\xde\xad\xbe\xef")
+
+            home.return_value = Path(tmp_dir)
+            FileHasher.get_local_file_hashes(paths)
+
+            # Minimal change in modification time
+            time.sleep(0.1)
+            paths[1].write_bytes(b"\x01\x02\x03\x04")
+
+            with patch("neptune.internal.artifacts.file_hasher.sha1", Mock(return_value="new_hash")) as sha1:
+                hashes = FileHasher.get_local_file_hashes(paths)
+
+            assert ["d78f8bb992a56a597f6c7a1fb918bb78271367eb", "new_hash"] == hashes
+            sha1.assert_called_once_with(paths[1].resolve())
@@ -71,3 +71,36 @@ class TestLocalFileHashStorage(unittest.TestCase):
 
         self.assertEqual(returned.file_hash, "test_hash")
         self.assertEqual(returned.modification_date, modification_date)
+
+    def test_fetch_many(self):
+        returned = self.sut.fetch_many(
+            [Path(f"{self.tempDir.name}/test.file"), Path(f"{self.tempDir.name}/test1.file")]
+        )
+
+        self.assertEqual(list(returned), [f"{self.tempDir.name}/test.file"])
+        self.assertEqual(
+            returned[f"{self.tempDir.name}/test.file"].file_hash, "c38444d2ccff1a7aab3d323fb6234e1b4f0a81ac"
+        )
+
+    def test_save_many(self):
+        modification_date = datetime.datetime.now().strftime("%Y%m%d_%H%M%S%f")
+
+        self.sut.save_many(
+            inserted=[
+                (Path(f"{self.tempDir.name}/test{idx}.file"), f"hash{idx}", modification_date) for idx in range(3)
+            ],
+            updated=[(Path(f"{self.tempDir.name}/test.file"), "new_test_hash", modification_date)],
+        )
+        returned = self.sut.fetch_many(
+            [Path(f"{self.tempDir.name}/test{idx}.file") for idx in range(3)] + [Path(f"{self.tempDir.name}/test.file")]
+        )
+
+        self.assertEqual(
+            {path: stored.file_hash for path, stored in returned.items()},
+            {
+                f"{self.tempDir.name}/test0.file": "hash0",
+                f"{self.tempDir.name}/test1.file": "hash1",
+                f"{self.tempDir.name}/test2.file": "hash2",
+                f"{self.tempDir.name}/test.file": "new_test_hash",
+            },
+        )
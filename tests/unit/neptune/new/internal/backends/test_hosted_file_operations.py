@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 import json
+import math
 import os
 import random
 import unittest
@@ -31,6 +32,7 @@ from mock import (
     patch,
 )
 
+from neptune.envs import NEPTUNE_STREAM_FILE_SET_UPLOADS
 from neptune.internal.backends.api_model import ClientConfig
 from neptune.internal.backends.hosted_file_operations import (
     _get_content_disposition_filename,
@@ -39,6 +41,8 @@ from neptune.internal.backends.hosted_file_operations import (
     upload_file_attribute,
     upload_file_set_attribute,
 )
+from neptune.internal.backends.upload_executor import UploadExecutor
+from neptune.internal.storage import TarGzStream
 from neptune.internal.utils.utils import IS_WINDOWS
 from tests.unit.neptune.backend_test_mixin import BackendTestMixin
 from tests.unit.neptune.new.utils.file_helpers import create_file
@@ -324,6 +328,54 @@ class TestNewUploadFileOperations(HostedFileOperationsHelper, BackendTestMixin):
             ]
         )
 
+    @unittest.skipIf(IS_WINDOWS, "Windows behaves strangely")
+    @patch("neptune.internal.backends.hosted_file_operations.upload_raw_data")
+    def test_upload_big_file_attribute_chunks_concurrently(self, upload_raw_data):
+        # given
+        exp_uuid = str(uuid.uuid4())
+        swagger_mock = self._get_swagger_mock()
+        set_expected_result(
+            swagger_mock.api.fileAtomMultipartUploadStart,
+            {
+                "uploadId": "placeholder",
+                "errors": [],
+            },
+        )
+        upload_raw_data.return_value = json.dumps(
+            {
+                "errors": [],
+            }
+        )
+        data = self.get_random_bytes(1000 * 2**10)  # 1000 KB split into 10 chunks
+        chunk_size = self.multipart_config.min_chunk_size
+        executor = UploadExecutor(max_workers=4)
+
+        # when
+        with create_file(content=data, binary_mode=True) as filename:
+            upload_file_attribute(
+                swagger_client=swagger_mock,
+                container_id=exp_uuid,
+                attribute="target/path.txt",
+                source=filename,
+                ext="txt",
+                multipart_config=self.multipart_config,
+                executor=executor,
+            )
+        executor.shutdown()
+
+        # then
+        uploaded_chunks = {
+            upload_call.kwargs["query_params"]["uploadPartIdx"]: upload_call.kwargs["data"]
+            for upload_call in upload_raw_data.call_args_list
+        }
+        self.assertEqual(data, b"".join(uploaded_chunks[idx] for idx in range(len(uploaded_chunks))))
+        self.assertEqual(math.ceil(len(data) / chunk_size), len(uploaded_chunks))
+        swagger_mock.api.fileAtomMultipartUploadFinish.assert_called_once_with(
+            attribute="target/path.txt",
+            experimentIdentifier=str(exp_uuid),
+            uploadId="placeholder",
+        )
+
     @unittest.skipIf(IS_WINDOWS, "Windows behaves strangely")
     @patch("neptune.internal.backends.hosted_file_operations.upload_raw_data")
     @patch(
@@ -505,6 +557,45 @@ class TestNewUploadFileOperations(HostedFileOperationsHelper, BackendTestMixin):
             },
         )
 
+    @unittest.skipIf(IS_WINDOWS, "Windows behaves strangely")
+    @patch("neptune.internal.backends.hosted_file_operations.upload_raw_data")
+    @patch(
+        "neptune.internal.utils.glob",
+        new=lambda path, recursive=False: [path.replace("*", "file.txt")],
+    )
+    @patch.dict(os.environ, {NEPTUNE_STREAM_FILE_SET_UPLOADS: "True"})
+    def test_upload_multiple_files_in_file_set_attribute_streamed(self, upload_raw_data_mock):
+        # given
+        exp_uuid = str(uuid.uuid4())
+        swagger_mock = self._get_swagger_mock()
+        upload_raw_data_mock.return_value = b"null"
+
+        # when
+        with NamedTemporaryFile("w") as temp_file_1:
+            with NamedTemporaryFile("w") as temp_file_2:
+                upload_file_set_attribute(
+                    swagger_client=swagger_mock,
+                    container_id=exp_uuid,
+                    attribute="some/attribute",
+                    file_globs=[temp_file_1.name, temp_file_2.name],
+                    reset=True,
+                    multipart_config=self.multipart_config,
+                )
+
+        # then
+        upload_raw_data_mock.assert_called_once_with(
+            http_client=swagger_mock.swagger_spec.http_client,
+            url="https://ui.neptune.ai/uploadFileSetTar",
+            data=mock.ANY,
+            headers={"Content-Type": "application/octet-stream"},
+            query_params={
+                "experimentId": str(exp_uuid),
+                "attribute": "some/attribute",
+                "reset": "True",
+            },
+        )
+        self.assertIsInstance(upload_raw_data_mock.call_args.kwargs["data"], TarGzStream)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,11 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import os
 import socket
 import time
 import unittest
 import uuid
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import (
     Mock,
     call,
@@ -36,7 +38,16 @@ from mock import (
 )
 from packaging.version import Version
 
+from neptune.api.models import (
+    FieldDefinition,
+    FieldType,
+    FloatField,
+    IntField,
+    ObjectStateField,
+    StringField,
+)
 from neptune.core.components.operation_storage import OperationStorage
+from neptune.envs import NEPTUNE_UPLOAD_CONCURRENCY
 from neptune.exceptions import (
     CannotResolveHostname,
     FileSetNotFound,
@@ -61,12 +72,15 @@ from neptune.internal.container_type import ContainerType
 from neptune.internal.credentials import Credentials
 from neptune.internal.operation import (
     AssignString,
+    ImageValue,
     LogFloats,
+    LogImages,
     TrackFilesToArtifact,
     UploadFile,
     UploadFileContent,
 )
 from neptune.internal.utils import base64_encode
+from neptune.internal.utils.generic_attribute_mapper import NoValue
 from tests.unit.neptune.backend_test_mixin import BackendTestMixin
 from tests.unit.neptune.new.utils import response_mock
 
@@ -97,6 +111,11 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
         self.container_types = [ContainerType.RUN, ContainerType.PROJECT]
         self.dummy_operation_storage = OperationStorage(Path("./tests/dummy_storage"))
 
+    def _get_temporary_operation_storage(self) -> OperationStorage:
+        data_path = TemporaryDirectory()
+        self.addCleanup(data_path.cleanup)
+        return OperationStorage(Path(data_path.name))
+
     @patch("neptune.internal.backends.hosted_neptune_backend.upload_file_attribute")
     @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
     def test_execute_operations(self, upload_mock, swagger_client_factory):
@@ -184,6 +203,7 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                             source="other/file/path.txt",
                             ext="txt",
                             multipart_config=backend._client_config.multipart_config,
+                            executor=None,
                         ),
                         call(
                             swagger_client=backend.leaderboard_client,
@@ -192,6 +212,7 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                             source="path_to_file",
                             ext="",
                             multipart_config=backend._client_config.multipart_config,
+                            executor=None,
                         ),
                         call(
                             swagger_client=backend.leaderboard_client,
@@ -200,6 +221,7 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                             source=some_text.encode("utf-8"),
                             ext="txt",
                             multipart_config=backend._client_config.multipart_config,
+                            executor=None,
                         ),
                         call(
                             swagger_client=backend.leaderboard_client,
@@ -208,6 +230,7 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                             source=some_binary,
                             ext="bin",
                             multipart_config=backend._client_config.multipart_config,
+                            executor=None,
                         ),
                     ],
                     any_order=True,
@@ -227,6 +250,150 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                     result,
                 )
 
+    @patch("neptune.internal.backends.hosted_neptune_backend.upload_file_attribute")
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    @patch.dict(os.environ, {NEPTUNE_UPLOAD_CONCURRENCY: "4"})
+    def test_execute_upload_operations_concurrently(self, upload_mock, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+
+        # and
+        upload_mock.side_effect = lambda attribute, **_: [FileUploadError(attribute, "error")]
+
+        # when
+        errors = backend._execute_upload_operations(
+            container_id=container_uuid,
+            container_type=ContainerType.RUN,
+            upload_operations=[
+                UploadFile(path=["files", f"file_{idx}"], ext="txt", file_path=f"path_{idx}.txt") for idx in range(8)
+            ],
+            operation_storage=self.dummy_operation_storage,
+        )
+        backend.close()
+
+        # then
+        self.assertEqual(8, upload_mock.call_count)
+        self.assertEqual([FileUploadError(f"files/file_{idx}", "error") for idx in range(8)], errors)
+        for upload_call in upload_mock.call_args_list:
+            self.assertIs(backend._upload_executor, upload_call.kwargs["executor"])
+
+    @patch("neptune.internal.backends.hosted_neptune_backend.upload_file_attribute")
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    @patch.dict(os.environ, {NEPTUNE_UPLOAD_CONCURRENCY: "4"})
+    def test_execute_upload_operations_concurrently_reports_errors_in_order(self, upload_mock, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+
+        # and
+        upload_mock.side_effect = lambda attribute, source, **_: [FileUploadError(Path(source).name, "error")]
+
+        # when
+        errors = backend._execute_upload_operations(
+            container_id=container_uuid,
+            container_type=ContainerType.RUN,
+            upload_operations=[
+                UploadFile(path=["files", f"file_{idx % 3}"], ext="txt", file_path=f"path_{idx}.txt")
+                for idx in range(8)
+            ],
+            operation_storage=self.dummy_operation_storage,
+        )
+        backend.close()
+
+        # then
+        self.assertEqual([FileUploadError(f"path_{idx}.txt", "error") for idx in range(8)], errors)
+
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_execute_operations_with_image_blobs(self, swagger_client_factory):
+        # given
+        swagger_client = self._get_swagger_client_mock(swagger_client_factory)
+        swagger_client.api.executeOperations().response().result = []
+        swagger_client.api.executeOperations.reset_mock()
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+
+        # and
+        operation_storage = self._get_temporary_operation_storage()
+        blob = operation_storage.store_blob(b"image content")
+
+        # when
+        backend.execute_operations(
+            container_id=container_uuid,
+            container_type=ContainerType.RUN,
+            operations=[
+                LogImages(["images"], [LogImages.ValueType(ImageValue(None, "name", None, blob=blob), 1, 2)]),
+            ],
+            operation_storage=operation_storage,
+        )
+
+        # then
+        swagger_client.api.executeOperations.assert_called_once_with(
+            **{
+                "experimentId": container_uuid,
+                "operations": [
+                    {
+                        "path": "images",
+                        "logImages": {
+                            "entries": [
+                                {
+                                    "value": {
+                                        "data": base64_encode(b"image content"),
+                                        "name": "name",
+                                        "description": None,
+                                    },
+                                    "step": 1,
+                                    "timestampMilliseconds": 2000,
+                                }
+                            ]
+                        },
+                    },
+                ],
+                **DEFAULT_REQUEST_KWARGS,
+            }
+        )
+
+        # and blob is kept until the operation is acknowledged in the queue
+        self.assertTrue((operation_storage.blobs_path / blob.name).exists())
+
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_execute_operations_skips_images_with_missing_blobs(self, swagger_client_factory):
+        # given
+        swagger_client = self._get_swagger_client_mock(swagger_client_factory)
+        swagger_client.api.executeOperations().response().result = []
+        swagger_client.api.executeOperations.reset_mock()
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+
+        # and
+        operation_storage = self._get_temporary_operation_storage()
+        blob = operation_storage.store_blob(b"image content")
+        missing_blob = operation_storage.store_blob(b"other image content")
+        operation_storage.remove_blob(missing_blob)
+
+        # when
+        backend.execute_operations(
+            container_id=container_uuid,
+            container_type=ContainerType.RUN,
+            operations=[
+                LogImages(
+                    ["images"],
+                    [
+                        LogImages.ValueType(ImageValue(None, "missing", None, blob=missing_blob), 1, 2),
+                        LogImages.ValueType(ImageValue(None, "present", None, blob=blob), 2, 3),
+                    ],
+                ),
+            ],
+            operation_storage=operation_storage,
+        )
+
+        # then
+        (entry,) = swagger_client.api.executeOperations.call_args.kwargs["operations"][0]["logImages"]["entries"]
+        self.assertEqual(entry["value"]["name"], "present")
+        self.assertEqual(entry["value"]["data"], base64_encode(b"image content"))
+
     @pytest.mark.asyncio
     @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
     async def test_too_many_requests(self, swagger_client_factory):
@@ -360,6 +527,7 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                             source="/path/to/file",
                             ext="",
                             multipart_config=backend._client_config.multipart_config,
+                            executor=None,
                         ),
                         call(
                             swagger_client=backend.leaderboard_client,
@@ -368,6 +536,7 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                             source="/some.file/with.dots.txt",
                             ext="txt",
                             multipart_config=backend._client_config.multipart_config,
+                            executor=None,
                         ),
                         call(
                             swagger_client=backend.leaderboard_client,
@@ -376,6 +545,7 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
                             source="/path/to/some_image.jpeg",
                             ext="jpeg",
                             multipart_config=backend._client_config.multipart_config,
+                            executor=None,
                         ),
                     ],
                     any_order=True,
@@ -712,3 +882,150 @@ class TestHostedNeptuneBackend(unittest.TestCase, BackendTestMixin):
         # then
         with pytest.raises(FileSetNotFound):
             backend.list_fileset_files(["mock"], "mock", ".")
+
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_fetch_atom_attribute_values_within_namespace(self, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+        backend.get_fields_definitions = MagicMock(
+            return_value=[
+                FieldDefinition(path="params/lr", type=FieldType.FLOAT),
+                FieldDefinition(path="params/optimizer/name", type=FieldType.STRING),
+                FieldDefinition(path="params/loss", type=FieldType.FLOAT_SERIES),
+                FieldDefinition(path="paramsx/other", type=FieldType.FLOAT),
+                FieldDefinition(path="sys/id", type=FieldType.STRING),
+                FieldDefinition(path="sys/owner", type=FieldType.STRING),
+                FieldDefinition(path="sys/state", type=FieldType.OBJECT_STATE),
+            ]
+        )
+        backend.get_fields_with_paths_filter = MagicMock(
+            return_value=[
+                FloatField(path="params/lr", value=0.1),
+                StringField(path="params/optimizer/name", value="adam"),
+            ]
+        )
+
+        # when
+        values = backend.fetch_atom_attribute_values(container_uuid, ContainerType.RUN, ["params"])
+
+        # then
+        backend.get_fields_with_paths_filter.assert_called_once_with(
+            container_uuid, ContainerType.RUN, ["params/lr", "params/optimizer/name"], use_proto=False
+        )
+        self.assertEqual(
+            values,
+            [
+                ("params/lr", "float", 0.1),
+                ("params/optimizer/name", "string", "adam"),
+                ("params/loss", "floatSeries", NoValue),
+            ],
+        )
+
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_fetch_atom_attribute_values_keeps_api_object_state(self, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+        backend.get_fields_definitions = MagicMock(
+            return_value=[FieldDefinition(path="sys/state", type=FieldType.OBJECT_STATE)]
+            + [FieldDefinition(path=f"params/p{i}", type=FieldType.INT) for i in range(5)]
+        )
+        backend.get_fields_with_paths_filter = MagicMock(
+            return_value=[ObjectStateField(path="sys/state", value="Active")]
+        )
+
+        # when
+        values = backend.fetch_atom_attribute_values(container_uuid, ContainerType.RUN, ["sys"])
+
+        # then
+        self.assertEqual(values, [("sys/state", "experimentState", "running")])
+
+    @patch("neptune.internal.backends.hosted_neptune_backend.ATTRIBUTE_PATHS_FILTER_BATCH_SIZE", 2)
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_fetch_atom_attribute_values_within_namespace_in_batches(self, swagger_client_factory):
+        # given
+        self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+        backend.get_fields_definitions = MagicMock(
+            return_value=[FieldDefinition(path=f"params/p{i}", type=FieldType.INT) for i in range(5)]
+            + [FieldDefinition(path=f"metrics/m{i}", type=FieldType.FLOAT_SERIES) for i in range(5)]
+        )
+        backend.get_fields_with_paths_filter = MagicMock(
+            side_effect=lambda _, __, paths, **___: [IntField(path=path, value=int(path[-1])) for path in paths]
+        )
+
+        # when
+        values = backend.fetch_atom_attribute_values(container_uuid, ContainerType.RUN, ["params"])
+
+        # then
+        self.assertEqual(
+            backend.get_fields_with_paths_filter.call_args_list,
+            [
+                call(container_uuid, ContainerType.RUN, ["params/p0", "params/p1"], use_proto=False),
+                call(container_uuid, ContainerType.RUN, ["params/p2", "params/p3"], use_proto=False),
+                call(container_uuid, ContainerType.RUN, ["params/p4"], use_proto=False),
+            ],
+        )
+        self.assertEqual(values, [(f"params/p{i}", "int", i) for i in range(5)])
+
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_fetch_atom_attribute_values_of_whole_container_with_single_request(self, swagger_client_factory):
+        # given
+        swagger_client = self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+        backend.get_fields_definitions = MagicMock()
+        backend.get_fields_with_paths_filter = MagicMock()
+
+        # and
+        swagger_client.api.getExperimentAttributes().response().result.attributes = [
+            self._get_attribute_mock("params/lr", "float", floatProperties=MagicMock(value=0.1)),
+            self._get_attribute_mock("sys/state", "experimentState", experimentStateProperties=MagicMock(value="idle")),
+        ]
+
+        # when
+        values = backend.fetch_atom_attribute_values(container_uuid, ContainerType.RUN, [])
+
+        # then
+        self.assertEqual(values, [("params/lr", "float", 0.1), ("sys/state", "experimentState", "idle")])
+        backend.get_fields_definitions.assert_not_called()
+        backend.get_fields_with_paths_filter.assert_not_called()
+
+    @patch("socket.gethostbyname", MagicMock(return_value="1.1.1.1"))
+    def test_fetch_atom_attribute_values_of_most_of_container_with_single_request(self, swagger_client_factory):
+        # given
+        swagger_client = self._get_swagger_client_mock(swagger_client_factory)
+        backend = HostedNeptuneBackend(credentials)
+        container_uuid = str(uuid.uuid4())
+        backend.get_fields_definitions = MagicMock(
+            return_value=[
+                FieldDefinition(path="params/lr", type=FieldType.FLOAT),
+                FieldDefinition(path="params/epochs", type=FieldType.INT),
+                FieldDefinition(path="sys/id", type=FieldType.STRING),
+            ]
+        )
+        backend.get_fields_with_paths_filter = MagicMock()
+
+        # and
+        swagger_client.api.getExperimentAttributes().response().result.attributes = [
+            self._get_attribute_mock("params/lr", "float", floatProperties=MagicMock(value=0.1)),
+            self._get_attribute_mock("params/epochs", "int", intProperties=MagicMock(value=10)),
+            self._get_attribute_mock("sys/id", "string", stringProperties=MagicMock(value="RUN-1")),
+        ]
+
+        # when
+        values = backend.fetch_atom_attribute_values(container_uuid, ContainerType.RUN, ["params"])
+
+        # then
+        self.assertEqual(values, [("params/lr", "float", 0.1), ("params/epochs", "int", 10)])
+        backend.get_fields_with_paths_filter.assert_not_called()
+
+    @staticmethod
+    def _get_attribute_mock(name, attribute_type, **properties):
+        attribute = MagicMock(type=attribute_type, **properties)
+        attribute.name = name
+        return attribute
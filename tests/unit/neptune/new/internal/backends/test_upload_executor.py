@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+
+import pytest
+from mock import patch
+
+from neptune.internal.backends.upload_executor import UploadExecutor
+
+
+def test_run_all_returns_results_in_order():
+    # given
+    executor = UploadExecutor(max_workers=4)
+
+    # when
+    results = executor.run_all([lambda idx=idx: time.sleep(0.01 * (5 - idx)) or idx for idx in range(5)])
+    executor.shutdown()
+
+    # then
+    assert results == [0, 1, 2, 3, 4]
+
+
+def test_run_all_finishes_all_tasks_before_raising():
+    # given
+    executor = UploadExecutor(max_workers=2)
+    finished = []
+
+    def failing() -> None:
+        raise ValueError("upload failed")
+
+    def slow() -> None:
+        time.sleep(0.05)
+        finished.append(True)
+
+    # when
+    with pytest.raises(ValueError):
+        executor.run_all([failing, slow])
+    executor.shutdown()
+
+    # then
+    assert finished == [True]
+
+
+def test_run_chunks_bounds_chunks_in_flight():
+    # given
+    executor = UploadExecutor(max_workers=2)
+    lock = threading.Lock()
+    in_flight, max_in_flight, uploaded = [0], [0], []
+
+    def upload(idx: int) -> None:
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+            uploaded.append(idx)
+
+    # when
+    executor.run_chunks(lambda idx=idx: upload(idx) for idx in range(10))
+    executor.shutdown()
+
+    # then
+    assert sorted(uploaded) == list(range(10))
+    assert max_in_flight[0] <= 2
+
+
+def test_recreates_pools_in_forked_process():
+    # given
+    executor = UploadExecutor(max_workers=2)
+    executor.run_all([lambda: None])
+    parent_pools = executor._pools
+
+    # when
+    with patch("neptune.internal.backends.upload_executor.os.getpid", return_value=-1):
+        results = executor.run_all([lambda: 1, lambda: 2])
+
+    # then
+    assert results == [1, 2]
+    assert executor._pools is not None and executor._pools is not parent_pools
+    executor.shutdown()
+
+
+def test_runs_tasks_in_calling_thread_after_shutdown():
+    # given
+    executor = UploadExecutor(max_workers=2)
+    executor.run_all([lambda: None])
+    executor.shutdown()
+
+    # when
+    results = executor.run_all([threading.get_ident, threading.get_ident])
+    executor.run_chunks([lambda: results.append(threading.get_ident())])
+
+    # then
+    assert results == [threading.get_ident()] * 3
+
+
+def test_shutdown_does_not_wait_for_running_tasks():
+    # given
+    executor = UploadExecutor(max_workers=1)
+    started, can_finish = threading.Event(), threading.Event()
+
+    def upload() -> None:
+        started.set()
+        can_finish.wait()
+
+    thread = threading.Thread(target=executor.run_chunks, args=([upload, upload],))
+    thread.start()
+    started.wait()
+
+    # when
+    executor.shutdown()
+    can_finish.set()
+    thread.join()
+
+    # then
+    assert not thread.is_alive()
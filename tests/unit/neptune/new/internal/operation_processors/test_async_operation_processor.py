@@ -13,7 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import threading
 from pathlib import Path
+from queue import Queue
 from uuid import uuid4
 
 from mock import (
@@ -24,6 +26,11 @@ from mock import (
 from neptune.constants import NEPTUNE_DATA_DIRECTORY
 from neptune.internal.container_type import ContainerType
 from neptune.internal.id_formats import UniqueId
+from neptune.internal.operation import (
+    AssignInt,
+    ImageValue,
+    LogImages,
+)
 from neptune.internal.operation_processors.async_operation_processor import AsyncOperationProcessor
 
 
@@ -238,3 +245,126 @@ def test_metadata(metadata_file_mock, _, __):
     assert metadata["mode"] == "async"
     assert metadata["containerType"] == ContainerType.RUN
     assert metadata["containerId"] == container_id
+
+
+def test_pipelined_consumer_sends_batches_in_order(tmp_path):
+    # given
+    sent = []
+    backend = MagicMock()
+
+    def execute_operations(operations, **_):
+        sent.extend(op.value for op in operations)
+        return len(operations), []
+
+    backend.execute_operations.side_effect = execute_operations
+
+    # and
+    processor = AsyncOperationProcessor(
+        container_id=UniqueId(str(uuid4())),
+        container_type=ContainerType.RUN,
+        backend=backend,
+        lock=threading.RLock(),
+        queue=Queue(),
+        sleep_time=0.1,
+        batch_size=3,
+        data_path=tmp_path,
+        prefetch_depth=2,
+    )
+
+    # when
+    for value in range(20):
+        processor.enqueue_operation(AssignInt(path=["value"], value=value), wait=False)
+    processor.start()
+    processor.wait()
+    processor.stop()
+
+    # then
+    assert sent == list(range(20))
+    assert all(len(call.kwargs["operations"]) <= 3 for call in backend.execute_operations.call_args_list)
+
+
+def test_enqueue_operations(tmp_path):
+    # given
+    sent = []
+    backend = MagicMock()
+
+    def execute_operations(operations, **_):
+        sent.extend(op.value for op in operations)
+        return len(operations), []
+
+    backend.execute_operations.side_effect = execute_operations
+
+    # and
+    processor = AsyncOperationProcessor(
+        container_id=UniqueId(str(uuid4())),
+        container_type=ContainerType.RUN,
+        backend=backend,
+        lock=threading.RLock(),
+        queue=Queue(),
+        sleep_time=0.1,
+        data_path=tmp_path,
+    )
+
+    # when
+    processor.enqueue_operation(AssignInt(path=["first"], value=0), wait=False)
+    processor.enqueue_operations(
+        [AssignInt(path=["value", str(value)], value=value) for value in range(1, 20)],
+        wait=False,
+    )
+    processor.start()
+    processor.wait()
+    processor.stop()
+
+    # then
+    assert sent == list(range(20))
+
+
+def test_pipelined_consumer_does_not_skip_reads_after_empty_batch():
+    # given
+    processor = MagicMock()
+    processor._queue.get_batch.side_effect = [[], ["a"], ["b"], [], []]
+
+    # and
+    consumer = AsyncOperationProcessor.ConsumerThread(processor, sleep_time=1, batch_size=10, prefetch_depth=2)
+
+    # when
+    batches = [consumer._get_batch() for _ in range(3)]
+    consumer._stop_prefetching()
+
+    # then
+    assert batches == [["a"], ["b"], []]
+
+
+def test_image_blobs_are_removed_once_acknowledged(tmp_path):
+    # given
+    backend = MagicMock()
+    backend.execute_operations.side_effect = lambda operations, **_: (len(operations), [])
+
+    # and
+    processor = AsyncOperationProcessor(
+        container_id=UniqueId(str(uuid4())),
+        container_type=ContainerType.RUN,
+        backend=backend,
+        lock=threading.RLock(),
+        queue=Queue(),
+        sleep_time=0.1,
+        data_path=tmp_path,
+    )
+    blob = processor.operation_storage.store_blob(b"image content")
+
+    # when
+    processor.enqueue_operation(
+        LogImages(["images"], [LogImages.ValueType(ImageValue(None, None, None, blob=blob), 1, 2)]), wait=False
+    )
+
+    # then
+    assert (processor.operation_storage.blobs_path / blob.name).exists()
+
+    # when
+    processor.start()
+    processor.wait()
+
+    # then
+    assert not (processor.operation_storage.blobs_path / blob.name).exists()
+
+    processor.stop()
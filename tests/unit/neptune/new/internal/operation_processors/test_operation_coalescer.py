@@ -0,0 +1,123 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from mock import patch
+
+from neptune.internal.operation import (
+    AssignFloat,
+    LogFloats,
+    LogSeriesValues,
+    LogStrings,
+)
+from neptune.internal.operation_processors.operation_coalescer import LogOperationCoalescer
+
+
+def log_floats(path, *values):
+    return LogFloats(path, [LogFloats.ValueType(value, step=None, ts=1.0) for value in values])
+
+
+def log_strings(path, *values):
+    return LogStrings(path, [LogStrings.ValueType(value, step=None, ts=1.0) for value in values])
+
+
+def get_coalescer(max_delay=3600.0):
+    return LogOperationCoalescer(max_batch_sizes={LogFloats: 3, LogStrings: 2}, max_delay=max_delay)
+
+
+def test_merging_consecutive_appends():
+    # given
+    coalescer = get_coalescer()
+
+    # when
+    assert coalescer.add(log_floats(["a"], 1)) == []
+    assert coalescer.add(log_floats(["b"], 10)) == []
+    assert coalescer.add(log_floats(["a"], 2)) == []
+
+    # then
+    assert coalescer.flush() == [log_floats(["a"], 1, 2), log_floats(["b"], 10)]
+    assert coalescer.flush() == []
+
+
+def test_releasing_full_batch():
+    # given
+    coalescer = get_coalescer()
+
+    # when
+    coalescer.add(log_floats(["a"], 1, 2))
+
+    # then
+    assert coalescer.add(log_floats(["a"], 3)) == [log_floats(["a"], 1, 2, 3)]
+    assert len(coalescer) == 0
+
+    # and
+    assert coalescer.add(log_floats(["a"], 4)) == []
+    assert coalescer.add(log_floats(["a"], 5, 6, 7)) == [log_floats(["a"], 4), log_floats(["a"], 5, 6, 7)]
+
+
+def test_preserving_order_on_the_same_path():
+    # given
+    coalescer = get_coalescer()
+    coalescer.add(log_floats(["a"], 1))
+    coalescer.add(log_floats(["b"], 1))
+
+    # when
+    assign = AssignFloat(["a"], 5.0)
+
+    # then
+    assert coalescer.add(assign) == [log_floats(["a"], 1), assign]
+    assert coalescer.add(log_strings(["b"], "x")) == [log_floats(["b"], 1)]
+    assert coalescer.flush() == [log_strings(["b"], "x")]
+
+
+def test_not_modifying_caller_operations():
+    # given
+    coalescer = get_coalescer()
+    op = log_floats(["a"], 1)
+
+    # when
+    coalescer.add(op)
+    coalescer.add(log_floats(["a"], 2))
+
+    # then
+    assert op == log_floats(["a"], 1)
+
+
+def test_merging_values_without_creating_value_objects():
+    # given
+    coalescer = get_coalescer()
+
+    # when
+    coalescer.add(LogFloats(["a"], LogSeriesValues([1.0], [1.0], [10.0])))
+    coalescer.add(LogFloats(["a"], LogSeriesValues([2.0], [2.0], [20.0])))
+    operations = coalescer.flush()
+
+    # then
+    assert operations == [LogFloats(["a"], LogSeriesValues([1.0, 2.0], [1.0, 2.0], [10.0, 20.0]))]
+    assert isinstance(operations[0].values, LogSeriesValues)
+
+
+def test_flushing_after_max_delay():
+    # given
+    coalescer = get_coalescer(max_delay=5.0)
+
+    with patch("neptune.internal.operation_processors.operation_coalescer.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        assert coalescer.add(log_floats(["a"], 1)) == []
+
+        # when
+        monotonic.return_value = 105.0
+
+        # then
+        assert coalescer.add(log_floats(["b"], 1)) == [log_floats(["a"], 1), log_floats(["b"], 1)]
@@ -13,9 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import threading
 from pathlib import Path
 from uuid import uuid4
 
+import pytest
 from mock import (
     MagicMock,
     patch,
@@ -24,6 +26,7 @@ from mock import (
 from neptune.constants import NEPTUNE_DATA_DIRECTORY
 from neptune.internal.container_type import ContainerType
 from neptune.internal.id_formats import UniqueId
+from neptune.internal.operation import AssignInt
 from neptune.internal.operation_processors.sync_operation_processor import SyncOperationProcessor
 
 
@@ -155,3 +158,129 @@ def test_metadata(metadata_file_mock, _):
     assert metadata["mode"] == "sync"
     assert metadata["containerType"] == ContainerType.RUN
     assert metadata["containerId"] == container_id
+
+
+def get_operations(count):
+    return [AssignInt(path=["value", str(value)], value=value) for value in range(count)]
+
+
+def get_sent_operations(backend):
+    return [call.kwargs["operations"] for call in backend.execute_operations.call_args_list]
+
+
+@patch("neptune.internal.operation_processors.sync_operation_processor.OperationStorage")
+@patch("neptune.internal.operation_processors.sync_operation_processor.MetadataFile")
+def test_enqueue_operations_in_single_request(_, __):
+    # given
+    backend = MagicMock()
+    backend.execute_operations.return_value = (3, [])
+    processor = SyncOperationProcessor(
+        container_id=UniqueId(str(uuid4())), container_type=ContainerType.RUN, backend=backend
+    )
+    operations = get_operations(3)
+
+    # when
+    processor.enqueue_operation(operations[0], wait=False)
+    processor.enqueue_operations(operations[1:], wait=False)
+
+    # then
+    assert get_sent_operations(backend) == [operations[:1], operations[1:]]
+
+
+@patch("neptune.internal.operation_processors.sync_operation_processor.OperationStorage")
+@patch("neptune.internal.operation_processors.sync_operation_processor.MetadataFile")
+def test_batching(_, __):
+    # given
+    backend = MagicMock()
+    backend.execute_operations.return_value = (0, [])
+    processor = SyncOperationProcessor(
+        container_id=UniqueId(str(uuid4())), container_type=ContainerType.RUN, backend=backend, batch_size=3
+    )
+    operations = get_operations(6)
+
+    # when
+    for op in operations[:2]:
+        processor.enqueue_operation(op, wait=False)
+
+    # then
+    backend.execute_operations.assert_not_called()
+
+    # when
+    processor.enqueue_operation(operations[2], wait=False)
+    processor.enqueue_operation(operations[3], wait=False)
+    processor.enqueue_operation(operations[4], wait=True)
+    processor.enqueue_operation(operations[5], wait=False)
+    processor.wait()
+
+    # then
+    assert get_sent_operations(backend) == [operations[:3], operations[3:5], operations[5:]]
+
+
+@patch("neptune.internal.operation_processors.sync_operation_processor.monotonic")
+@patch("neptune.internal.operation_processors.sync_operation_processor.OperationStorage")
+@patch("neptune.internal.operation_processors.sync_operation_processor.MetadataFile")
+def test_batching_interval(_, __, monotonic_mock):
+    # given
+    backend = MagicMock()
+    backend.execute_operations.return_value = (0, [])
+    processor = SyncOperationProcessor(
+        container_id=UniqueId(str(uuid4())),
+        container_type=ContainerType.RUN,
+        backend=backend,
+        batch_size=100,
+        batch_interval=1.0,
+    )
+    operations = get_operations(3)
+
+    # when
+    monotonic_mock.side_effect = [10.0, 10.0, 10.5, 11.0]
+    for op in operations:
+        processor.enqueue_operation(op, wait=False)
+
+    # then
+    assert get_sent_operations(backend) == [operations]
+
+
+@patch("neptune.internal.operation_processors.sync_operation_processor.OperationStorage")
+@patch("neptune.internal.operation_processors.sync_operation_processor.MetadataFile")
+def test_batching_raises_errors_on_send(_, __):
+    # given
+    backend = MagicMock()
+    backend.execute_operations.return_value = (1, [ValueError("error")])
+    processor = SyncOperationProcessor(
+        container_id=UniqueId(str(uuid4())), container_type=ContainerType.RUN, backend=backend, batch_size=10
+    )
+
+    # when
+    processor.enqueue_operation(get_operations(1)[0], wait=False)
+
+    # then
+    with pytest.raises(ValueError):
+        processor.flush()
+
+
+@patch("neptune.internal.operation_processors.sync_operation_processor.OperationStorage")
+@patch("neptune.internal.operation_processors.sync_operation_processor.MetadataFile")
+def test_batching_interval_without_further_operations(_, __):
+    # given
+    sent = threading.Event()
+    backend = MagicMock()
+    backend.execute_operations.side_effect = lambda **_: sent.set() or (1, [])
+    processor = SyncOperationProcessor(
+        container_id=UniqueId(str(uuid4())),
+        container_type=ContainerType.RUN,
+        backend=backend,
+        batch_size=100,
+        batch_interval=0.05,
+    )
+    operations = get_operations(1)
+
+    # when
+    processor.start()
+    processor.enqueue_operation(operations[0], wait=False)
+
+    # then
+    assert sent.wait(timeout=5)
+    assert get_sent_operations(backend) == [operations]
+
+    processor.close()
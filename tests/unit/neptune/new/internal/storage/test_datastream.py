@@ -0,0 +1,80 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import io
+import os
+import tarfile
+
+import pytest
+
+from neptune.internal.storage import (
+    TarGzStream,
+    UploadEntry,
+    compress_to_tar_gz_in_memory,
+)
+
+
+@pytest.fixture
+def upload_entries(tmp_path):
+    entries = []
+    for idx in range(5):
+        path = tmp_path / f"file_{idx}.bin"
+        path.write_bytes(os.urandom(100_000))
+        entries.append(UploadEntry(str(path), f"dir/file_{idx}.bin"))
+    return entries
+
+
+def read_archive(data: bytes):
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as archive:
+        return {member.name: archive.extractfile(member).read() for member in archive.getmembers()}
+
+
+def test_stream_matches_in_memory_archive(upload_entries):
+    # when
+    streamed = b"".join(TarGzStream(upload_entries, chunk_size=4096))
+    in_memory = compress_to_tar_gz_in_memory(upload_entries)
+
+    # then
+    assert read_archive(streamed) == read_archive(in_memory)
+    assert read_archive(streamed) == {entry.target_path: open(entry.source, "rb").read() for entry in upload_entries}
+
+
+def test_stream_yields_bounded_chunks(upload_entries):
+    # when
+    chunks = list(TarGzStream(upload_entries, compression_level=0, chunk_size=4096))
+
+    # then
+    assert len(chunks) > 100
+    assert all(len(chunk) <= 4096 for chunk in chunks)
+
+
+def test_stream_can_be_iterated_again(upload_entries):
+    # given
+    stream = TarGzStream(upload_entries, chunk_size=4096)
+
+    # when
+    next(iter(stream))
+
+    # then
+    assert read_archive(b"".join(stream)).keys() == {entry.target_path for entry in upload_entries}
+
+
+def test_stream_raises_archiving_errors(tmp_path):
+    # given
+    stream = TarGzStream([UploadEntry(str(tmp_path / "missing"), "missing")])
+
+    # then
+    with pytest.raises(FileNotFoundError):
+        b"".join(stream)
@@ -87,6 +87,22 @@ class TestRunStructure(unittest.TestCase):
         with self.assertRaises(MetadataInconsistency):
             exp.pop(["some", "path"])
 
+    def test_set_overwrites_leaf(self):
+        exp = ContainerStructure[int, dict]()
+        exp.set(["some", "path", "val"], 3)
+        exp.set(["some", "path", "val"], 5)
+        self.assertEqual(exp.get(["some", "path", "val"]), 5)
+
+        exp.set(["some", "path", "val"], {})
+        self.assertEqual(exp.get(["some", "path", "val"]), {})
+
+    def test_clear(self):
+        exp = ContainerStructure[int, dict]()
+        exp.set(["some", "path", "val"], 3)
+        exp.clear()
+        self.assertEqual(exp.get(["some", "path", "val"]), None)
+        self.assertEqual(exp.get_structure(), {})
+
 
 class TestIterateSubpaths(unittest.TestCase):
     project_uuid = str(uuid.uuid4())
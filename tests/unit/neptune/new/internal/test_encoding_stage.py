@@ -0,0 +1,106 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+
+from neptune.internal.encoding_stage import EncodingStage
+
+
+def test_emits_in_submission_order():
+    # given
+    stage = EncodingStage(threading.RLock(), max_workers=2)
+    first_can_finish = threading.Event()
+    emitted = []
+
+    def slow():
+        first_can_finish.wait(timeout=5)
+        return "first"
+
+    # when
+    stage.submit(encode=slow, emit=emitted.append)
+    stage.submit(encode=lambda: "second", emit=emitted.append)
+
+    # then
+    assert emitted == []
+
+    # when
+    first_can_finish.set()
+    stage.shutdown()
+
+    # then
+    assert emitted == ["first", "second"]
+
+
+def test_skips_values_that_failed_to_encode():
+    # given
+    stage = EncodingStage(threading.RLock(), max_workers=2)
+    emitted = []
+
+    def failing():
+        raise ValueError("broken image")
+
+    # when
+    stage.submit(encode=lambda: 1, emit=emitted.append)
+    stage.submit(encode=failing, emit=emitted.append)
+    stage.submit(encode=lambda: 3, emit=emitted.append)
+    stage.flush()
+
+    # then
+    assert emitted == [1, 3]
+
+    stage.shutdown()
+
+
+def test_emits_while_holding_lock():
+    # given
+    lock = threading.RLock()
+    stage = EncodingStage(lock, max_workers=1)
+    lock_owned = []
+
+    # when
+    stage.submit(encode=lambda: None, emit=lambda _: lock_owned.append(lock._is_owned()))
+    stage.flush()
+
+    # then
+    assert lock_owned == [True]
+
+    stage.shutdown()
+
+
+def test_emits_once_lock_is_released():
+    # given
+    lock = threading.RLock()
+    stage = EncodingStage(lock, max_workers=1)
+    can_encode = threading.Event()
+    encoded = threading.Event()
+    emitted = threading.Event()
+
+    def encode():
+        can_encode.wait(timeout=5)
+        encoded.set()
+
+    # when
+    with lock:
+        stage.submit(encode=encode, emit=lambda _: emitted.set())
+        can_encode.set()
+
+        # then
+        assert encoded.wait(timeout=5)
+        assert not emitted.wait(timeout=0.2)
+
+    # then
+    assert emitted.wait(timeout=5)
+
+    stage.shutdown()
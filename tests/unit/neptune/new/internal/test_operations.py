@@ -19,6 +19,7 @@ import unittest
 import uuid
 
 from neptune.attributes import Integer
+from neptune.core.components.operation_storage import Blob
 from neptune.internal.operation import (
     AddStrings,
     AssignArtifact,
@@ -40,6 +41,8 @@ from neptune.internal.operation import (
     ImageValue,
     LogFloats,
     LogImages,
+    LogSeriesValue,
+    LogSeriesValues,
     LogStrings,
     Operation,
     RemoveStrings,
@@ -70,6 +73,23 @@ class TestOperations(unittest.TestCase):
         # expect no Operation subclass left
         self.assertEqual(classes, set())
 
+    def test_log_series_values(self):
+        # given
+        values = LogSeriesValues([1.0, 2.0, 3.0], [None, 2, 3], [10, 20, 30])
+        expected = [LogSeriesValue(1.0, None, 10), LogSeriesValue(2.0, 2, 20), LogSeriesValue(3.0, 3, 30)]
+
+        # then
+        self.assertEqual(len(values), 3)
+        self.assertEqual(list(values), expected)
+        self.assertEqual(values, expected)
+        self.assertEqual(values[1], expected[1])
+        self.assertEqual(values[1:], LogSeriesValues([2.0, 3.0], [2, 3], [20, 30]))
+        self.assertEqual(values + expected[:1], expected + expected[:1])
+        self.assertEqual(expected[:1] + values, expected[:1] + expected)
+
+        # and
+        self.assertEqual(LogFloats(["a"], values).to_dict(), LogFloats(["a"], expected).to_dict())
+
     @staticmethod
     def _list_objects():
         now = datetime.now()
@@ -110,6 +130,7 @@ class TestOperations(unittest.TestCase):
                     LogFloats.ValueType(10, 10, 1234),
                 ],
             ),
+            LogFloats(TestOperations._random_path(), LogSeriesValues([5, 3], [4, None], [500, 1000])),
             LogStrings(
                 TestOperations._random_path(),
                 [
@@ -124,6 +145,9 @@ class TestOperations(unittest.TestCase):
                 [
                     LogImages.ValueType(ImageValue("base64_image_1", "name1", "description1"), None, 2),
                     LogImages.ValueType(ImageValue("base64_image_2", "name2", "description2"), 0, 5),
+                    LogImages.ValueType(
+                        ImageValue(None, "name3", "description3", blob=Blob("blob_name", 123, "sha256_hash")), 1, 7
+                    ),
                 ],
             ),
             ClearFloatLog(TestOperations._random_path()),
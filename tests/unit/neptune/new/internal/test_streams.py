@@ -18,9 +18,13 @@ import threading
 import unittest
 from contextlib import redirect_stdout
 from io import StringIO
-from unittest.mock import MagicMock
+from unittest.mock import (
+    ANY,
+    MagicMock,
+)
 
 from neptune.internal.streams.std_stream_capture_logger import (
+    CapturedLinesBuffer,
     StdoutCaptureLogger,
     StdStreamCaptureLogger,
 )
@@ -86,3 +90,98 @@ class TestStdStreamCaptureLogger(unittest.TestCase):
         )
         stream.seek(0)
         self.assertEqual(stream.read(), "testing")
+
+    def test_batches_lines_within_flush_interval(self):
+        stream = StringIO()
+        mock_run = MagicMock()
+        attr_name = "sys/stdout"
+
+        logger = StdStreamCaptureLogger(mock_run, attr_name, stream, flush_interval=60)
+        logger.write("first")
+        logger.write(" line\nsecond line\n")
+        logger.write("third line\n")
+        logger.close()
+
+        mock_run[attr_name].extend.assert_called_once_with(
+            ["first line", "second line", "third line"], timestamps=[ANY, ANY, ANY]
+        )
+
+    def test_collapses_progress_bar_updates(self):
+        stream = StringIO()
+        mock_run = MagicMock()
+        attr_name = "sys/stderr"
+
+        logger = StdStreamCaptureLogger(mock_run, attr_name, stream, flush_interval=60)
+        for progress in range(0, 101, 10):
+            logger.write(f"\rprogress: {progress}%")
+        logger.write("\n")
+        logger.write("done\r\n")
+        logger.close()
+
+        mock_run[attr_name].extend.assert_called_once_with(["progress: 100%", "done"], timestamps=[ANY, ANY])
+
+    def test_drops_lines_over_rate_limit(self):
+        stream = StringIO()
+        mock_run = MagicMock()
+        attr_name = "sys/stdout"
+
+        logger = StdStreamCaptureLogger(mock_run, attr_name, stream, flush_interval=60, max_bytes_per_second=10)
+        logger.write("12345\n67890\nabcde\nfghij\n")
+        logger.close()
+
+        mock_run[attr_name].extend.assert_called_once_with(
+            [
+                "12345",
+                "67890",
+                "[2 lines of output not captured: exceeded the limit of 10 bytes per second]",
+            ],
+            timestamps=[ANY, ANY, ANY],
+        )
+        stream.seek(0)
+        self.assertEqual(stream.read(), "12345\n67890\nabcde\nfghij\n")
+
+    def test_reports_partial_line_on_flush_interval(self):
+        stream = StringIO()
+        mock_run = MagicMock()
+        attr_name = "sys/stdout"
+        reported = threading.Event()
+        mock_run[attr_name].extend.side_effect = lambda *_, **__: reported.set()
+
+        logger = StdStreamCaptureLogger(mock_run, attr_name, stream, flush_interval=0.2)
+        logger.write("epoch 1: ")
+        logger.write("loss 0.5")
+
+        self.assertTrue(reported.wait(timeout=5))
+        logger.close()
+
+        mock_run[attr_name].extend.assert_called_once_with(["epoch 1: loss 0.5"], timestamps=[ANY])
+        mock_run[attr_name].append.assert_not_called()
+
+    def test_does_not_throttle_by_default(self):
+        stream = StringIO()
+        mock_run = MagicMock()
+        attr_name = "sys/stdout"
+
+        logger = StdStreamCaptureLogger(mock_run, attr_name, stream, flush_interval=60)
+        logger.write("x" * 10_000 + "\n")
+        logger.close()
+
+        mock_run[attr_name].extend.assert_called_once_with(["x" * 10_000], timestamps=[ANY])
+
+
+class TestCapturedLinesBuffer(unittest.TestCase):
+    def test_keeps_partial_line_until_drained_with_it(self):
+        buffer = CapturedLinesBuffer()
+        buffer.feed("a\nb", 1.0)
+        buffer.feed("c", 2.0)
+
+        self.assertEqual(buffer.drain(), (["a"], [1.0]))
+        self.assertFalse(buffer.has_lines())
+        self.assertEqual(buffer.drain(include_partial_line=True), (["bc"], [2.0]))
+        self.assertEqual(buffer.drain(include_partial_line=True), ([], []))
+
+    def test_splits_overlong_partial_line(self):
+        buffer = CapturedLinesBuffer(max_line_length=4)
+        buffer.feed("abcdefghij", 1.0)
+
+        self.assertEqual(buffer.drain(include_partial_line=True), (["abcd", "efgh", "ij"], [1.0, 1.0, 1.0]))
@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+
+from mock import MagicMock
+
+from neptune.internal.exceptions import NeptuneConnectionLostException
+from neptune.internal.threading.periodic_scheduler import PeriodicScheduler
+from neptune.internal.utils.ping_background_job import PingBackgroundJob
+
+
+def counting_work(runs_to_signal: int):
+    runs = []
+    done = threading.Event()
+
+    def work():
+        runs.append(threading.get_ident())
+        if len(runs) >= runs_to_signal:
+            done.set()
+
+    return work, runs, done
+
+
+def test_runs_tasks_periodically():
+    # given
+    scheduler = PeriodicScheduler(max_workers=1)
+    work, runs, done = counting_work(runs_to_signal=3)
+
+    # when
+    task = scheduler.schedule(work, period=0.01, name="test")
+
+    # then
+    assert done.wait(timeout=5)
+
+    # when
+    task.cancel()
+    task.join()
+    runs_after_cancel = len(runs)
+    threading.Event().wait(0.05)
+
+    # then
+    assert len(runs) == runs_after_cancel
+
+
+def test_number_of_threads_does_not_depend_on_number_of_tasks():
+    # given
+    scheduler = PeriodicScheduler(max_workers=2)
+    works = [counting_work(runs_to_signal=2) for _ in range(20)]
+
+    # when
+    tasks = [scheduler.schedule(work, period=0.01, name="test") for work, _, _ in works]
+
+    # then
+    assert all(done.wait(timeout=5) for _, _, done in works)
+    assert len({ident for _, runs, _ in works for ident in runs}) <= 2
+
+    # cleanup
+    for task in tasks:
+        task.cancel()
+
+
+def test_pause_and_resume():
+    # given
+    scheduler = PeriodicScheduler(max_workers=1)
+    work, runs, done = counting_work(runs_to_signal=1)
+    task = scheduler.schedule(work, period=0.01, name="test")
+    assert done.wait(timeout=5)
+
+    # when
+    task.pause()
+    runs_after_pause = len(runs)
+    threading.Event().wait(0.05)
+
+    # then
+    assert len(runs) == runs_after_pause
+
+    # when
+    task.resume()
+    threading.Event().wait(0.05)
+
+    # then
+    assert len(runs) > runs_after_pause
+
+    # cleanup
+    task.cancel()
+
+
+def test_failing_task_is_not_run_again():
+    # given
+    scheduler = PeriodicScheduler(max_workers=1)
+    work = MagicMock(side_effect=ValueError)
+    _, _, other_done = other = counting_work(runs_to_signal=3)
+
+    # when
+    task = scheduler.schedule(work, period=0.01, name="failing")
+    other_task = scheduler.schedule(other[0], period=0.01, name="other")
+
+    # then
+    assert other_done.wait(timeout=5)
+    assert task.cancelled
+    work.assert_called_once()
+
+    # cleanup
+    other_task.cancel()
+
+
+def test_ping_backs_off_on_connection_errors():
+    # given
+    job = PingBackgroundJob(period=10)
+    container = MagicMock()
+    container.ping.side_effect = [
+        NeptuneConnectionLostException(ConnectionError()),
+        NeptuneConnectionLostException(ConnectionError()),
+        None,
+    ]
+
+    # then
+    assert job._ping(container) == 2
+    assert job._ping(container) == 4
+    assert job._ping(container) is None
@@ -34,6 +34,7 @@ from neptune.envs import (
 )
 from neptune.exceptions import NeptuneMaxDiskUtilizationExceeded
 from neptune.internal.utils.disk_utilization import (
+    DiskUtilizationMonitor,
     NonRaisingErrorHandler,
     RaisingErrorHandler,
     ensure_disk_not_overutilize,
@@ -140,6 +141,71 @@ class TestDiskUtilization(unittest.TestCase):
 
         mocked_func.assert_not_called()
 
+    @patch.dict(os.environ, {NEPTUNE_RAISE_ERROR_ON_DISK_USAGE_EXCEEDED: "True"})
+    @patch.dict(os.environ, {NEPTUNE_MAX_DISK_USAGE: "60"})
+    @patch("psutil.disk_usage")
+    def test_utilization_is_cached_between_calls(self, disk_usage_mock):
+        disk_usage_mock.return_value.percent = 10
+        mocked_func = MagicMock()
+        wrapped_func = ensure_disk_not_overutilize(mocked_func)
+
+        for _ in range(3):
+            wrapped_func()
+
+        assert mocked_func.call_count == 3
+        disk_usage_mock.assert_called_once()
+
+
+class TestDiskUtilizationMonitor(unittest.TestCase):
+    @patch("neptune.internal.utils.disk_utilization.monotonic")
+    @patch("psutil.disk_usage")
+    def test_sampling_interval(self, disk_usage_mock, monotonic_mock):
+        # given
+        monitor = DiskUtilizationMonitor(max_disk_utilization=90.0, sampling_interval=1.0)
+        disk_usage_mock.return_value.percent = 50
+
+        # when
+        monotonic_mock.return_value = 10.0
+        assert monitor.get() == 50.0
+        disk_usage_mock.return_value.percent = 70
+        monotonic_mock.return_value = 10.5
+        assert monitor.get() == 50.0
+
+        # then
+        disk_usage_mock.assert_called_once()
+
+        # when
+        monotonic_mock.return_value = 11.0
+
+        # then
+        assert monitor.get() == 70.0
+        assert disk_usage_mock.call_count == 2
+
+    @patch("neptune.internal.utils.disk_utilization.monotonic", return_value=10.0)
+    @patch("psutil.disk_usage")
+    def test_sampling_on_every_check_near_limit(self, disk_usage_mock, _):
+        # given
+        monitor = DiskUtilizationMonitor(max_disk_utilization=90.0, sampling_interval=1.0, near_limit_margin=1.0)
+        disk_usage_mock.return_value.percent = 89.5
+
+        # when
+        for _ in range(3):
+            monitor.get()
+
+        # then
+        assert disk_usage_mock.call_count == 3
+
+    @patch("neptune.internal.utils.disk_utilization.monotonic", return_value=10.0)
+    @patch("psutil.disk_usage")
+    def test_sampling_on_every_check_after_error(self, disk_usage_mock, _):
+        # given
+        monitor = DiskUtilizationMonitor(max_disk_utilization=90.0, sampling_interval=1.0)
+        disk_usage_mock.side_effect = [Error(), MagicMock(percent=20)]
+
+        # then
+        assert monitor.get() is None
+        assert monitor.get() == 20.0
+
 
 class TestDiskErrorHandler(unittest.TestCase):
     @patch("neptune.internal.utils.disk_utilization.RaisingErrorHandler")
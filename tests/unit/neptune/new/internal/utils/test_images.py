@@ -34,6 +34,7 @@ from neptune.internal.utils.images import (
     _scale_array,
     get_html_content,
     get_image_content,
+    snapshot_image_array,
 )
 from neptune.internal.utils.utils import (
     IS_MACOS,
@@ -284,6 +285,35 @@ class TestImage(unittest.TestCase):
             return numpy.random.rand(w, h)
 
 
+def test_get_image_content_does_not_modify_array():
+    # given
+    arr = numpy.random.rand(10, 20, 1)
+    original = arr.copy()
+
+    # when
+    get_image_content(arr)
+
+    # then
+    assert numpy.array_equal(arr, original)
+
+
+def test_snapshot_image_array_copies_array():
+    # given
+    arr = numpy.random.rand(10, 20, 3)
+
+    # when
+    snapshot = snapshot_image_array(arr)
+    arr[:] = 0
+
+    # then
+    assert snapshot.any()
+
+
+def test_snapshot_image_array_verifies_shape():
+    with pytest.raises(ValueError):
+        snapshot_image_array(numpy.random.rand(10, 20, 2))
+
+
 def test_scale_array_when_array_already_scaled():
     # given
     arr = numpy.array([[123, 32], [255, 0]])
@@ -0,0 +1,40 @@
+#
+# Copyright (c) 2024, Neptune Labs Sp. z o.o.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from neptune.internal.utils.paths import (
+    parse_path,
+    path_to_str,
+)
+
+
+def test_parse_path():
+    assert parse_path("a/b//c/") == ["a", "b", "c"]
+    assert parse_path(5) == ["5"]
+    assert parse_path("") == []
+
+
+def test_parse_path_returns_new_list():
+    # given
+    path = parse_path("some/cached/path")
+
+    # when
+    path.append("mutated")
+
+    # then
+    assert parse_path("some/cached/path") == ["some", "cached", "path"]
+
+
+def test_path_to_str():
+    assert path_to_str(["a", "", "b"]) == "a/b"
@@ -37,6 +37,10 @@ class TestUtils(unittest.TestCase):
         with self.assertRaises(TypeError):
             verify_type("arg", 5, (str, type(None), float))
 
+    def test_verify_type_failed_message(self):
+        with self.assertRaisesRegex(TypeError, "arg must be a str or NoneType"):
+            verify_type("arg", 5, (str, type(None)))
+
     def test_verify_collection_type(self):
         verify_collection_type("arg", ["string", "aaa", 5, 1, "q"], (int, str))
 
@@ -142,6 +142,28 @@ class TestBaseAssign:
             assert isinstance(exp.get_structure()["some"]["str"]["val"], String)
             assert isinstance(exp.get_structure()["some"]["datetime"]["val"], Datetime)
 
+    def test_assign_dict_enqueues_single_group(self):
+        with init_run(mode="debug", flush_period=0.5) as exp:
+            processor = exp._op_processor
+            with patch.object(processor, "enqueue_operation", wraps=processor.enqueue_operation) as enqueue_operation:
+                with patch.object(
+                    processor, "enqueue_operations", wraps=processor.enqueue_operations
+                ) as enqueue_operations:
+                    exp["params"] = {"lr": 0.1, "optimizer": "Adam", "layers": {"first": 32, "second": 64}}
+                    exp.wait()
+
+            enqueue_operations.assert_called_once()
+            assert [op.path for op in enqueue_operations.call_args.args[0]] == [
+                ["params", "lr"],
+                ["params", "optimizer"],
+                ["params", "layers", "first"],
+                ["params", "layers", "second"],
+            ]
+            assert all(call.kwargs["wait"] is False for call in enqueue_operation.call_args_list)
+            assert exp["params/lr"].fetch() == 0.1
+            assert exp["params/optimizer"].fetch() == "Adam"
+            assert exp["params/layers/second"].fetch() == 64
+
     def test_lookup(self):
         with init_run(mode="debug", flush_period=0.5) as exp:
             ns = exp["some/ns"]
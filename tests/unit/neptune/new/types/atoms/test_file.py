@@ -13,22 +13,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import os
 import pickle
 import unittest
 from io import (
     BytesIO,
     StringIO,
 )
+from unittest.mock import patch
 
 import numpy
 import pytest
 from bokeh.plotting import figure
 
+from neptune.envs import NEPTUNE_IMAGE_ENCODING_WORKERS
 from neptune.exceptions import (
     NeptuneException,
     StreamAlreadyUsedException,
 )
 from neptune.internal.types.file_types import (
+    DeferredInMemoryComposite,
     FileType,
     InMemoryComposite,
 )
@@ -179,6 +183,24 @@ class TestFile(unittest.TestCase):
         self.assertEqual(file.extension, "png")
         self.assertEqual(file.content, _get_pil_image_data(expected_image))
 
+    def test_as_image_from_array_is_a_snapshot(self):
+        for encoding_workers, composite_type in (("", InMemoryComposite), ("2", DeferredInMemoryComposite)):
+            with self.subTest(encoding_workers=encoding_workers), patch.dict(
+                os.environ, {NEPTUNE_IMAGE_ENCODING_WORKERS: encoding_workers}
+            ):
+                # given
+                image_array = numpy.random.rand(10, 10) * 255
+                expected_image = Image.fromarray(image_array.astype(numpy.uint8))
+
+                # when
+                file = File.as_image(image_array)
+                image_array[:] = 0
+
+                # then
+                self.assertIsInstance(file._file_composite, composite_type)
+                self.assertEqual(file.extension, "png")
+                self.assertEqual(file.content, _get_pil_image_data(expected_image))
+
     def test_as_html(self):
         # given
         p = figure(width=400, height=400)